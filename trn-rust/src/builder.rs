@@ -109,6 +109,10 @@ impl TrnBuilder {
             TrnError::builder_missing_field("version")
         })?;
 
+        if !self.validate_on_build {
+            return Ok(Trn::from_parts(&platform, &scope, &resource_type, &resource_id, &version));
+        }
+
         // Create TRN object using public constructor
         Trn::new(platform, scope, resource_type, resource_id, version)
     }
@@ -368,4 +372,19 @@ mod tests {
 
         assert_eq!(trn_string, "trn:user:alice:tool:getUserById:v1.0");
     }
+
+    #[test]
+    fn test_build_without_validation() {
+        let builder = TrnBuilder::new()
+            .platform("user")
+            .scope("alice")
+            .resource_type("tool")
+            .resource_id("my api")
+            .version("v1.0");
+
+        assert!(builder.clone().build().is_err());
+
+        let trn = builder.validate(false).build().expect("Should skip validation");
+        assert_eq!(trn.resource_id(), "my api");
+    }
 } 
\ No newline at end of file
@@ -0,0 +1,56 @@
+//! Bounded cache helpers
+//!
+//! The parse, validation, version, pattern and URL caches are all `DashMap`s
+//! that make room by evicting a quarter of their entries once full; the
+//! eviction lives here so every cache shares one implementation.
+
+use dashmap::DashMap;
+use std::hash::Hash;
+
+/// Insert `value` under `key`, first evicting entries if `map` holds `capacity` or more
+///
+/// A quarter of the capacity (at least one entry) is evicted in arbitrary
+/// order. The shards are pruned in place with `retain`, so no guard into the
+/// map is held while removing and the doomed keys are never copied.
+pub(crate) fn insert_bounded<K, V>(map: &DashMap<K, V>, capacity: usize, key: K, value: V)
+where
+    K: Eq + Hash,
+{
+    if map.len() >= capacity {
+        let mut to_evict = (capacity / 4).max(1);
+        map.retain(|_, _| {
+            if to_evict == 0 {
+                return true;
+            }
+            to_evict -= 1;
+            false
+        });
+    }
+
+    map.insert(key, value);
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_insert_bounded_evicts_a_quarter_when_full() {
+        let map = DashMap::new();
+        for index in 0..8 {
+            insert_bounded(&map, 8, index, index);
+        }
+        assert_eq!(map.len(), 8);
+
+        insert_bounded(&map, 8, 8, 8);
+        assert_eq!(map.len(), 7);
+        assert_eq!(map.get(&8).map(|entry| *entry), Some(8));
+
+        // Tiny capacities still make room for the new entry
+        let map = DashMap::new();
+        insert_bounded(&map, 1, "a", 1);
+        insert_bounded(&map, 1, "b", 2);
+        assert_eq!(map.len(), 1);
+        assert!(map.contains_key("b"));
+    }
+}
@@ -2,18 +2,17 @@
 //!
 //! This module defines all constants, patterns, and configuration values
 //! used throughout the TRN library for the simplified 6-component format.
+//! Configuration is expressed as typed `const` items rather than a runtime
+//! settings map, so every read is resolved at compile time.
 
 use once_cell::sync::Lazy;
 use regex::Regex;
-use std::collections::HashSet;
 
 // TRN Format Constants
 /// TRN prefix that all TRNs must start with
-#[allow(dead_code)]
 pub const TRN_PREFIX: &str = "trn";
 
 /// Separator character between TRN components
-#[allow(dead_code)]
 pub const TRN_SEPARATOR: char = ':';
 
 /// Maximum total TRN length
@@ -57,8 +56,124 @@ pub const RESOURCE_ID_PATTERN: &str = r"[a-zA-Z0-9][a-zA-Z0-9_.-]{0,63}";
 /// Pattern for version component
 pub const VERSION_PATTERN: &str = r"[a-zA-Z0-9][a-zA-Z0-9.-]{0,31}";
 
+// Byte-class lookup tables for the single-pass scanner
+/// Byte class flag for ASCII letters
+pub const CHAR_ALPHA: u8 = 1 << 0;
+
+/// Byte class flag for ASCII digits
+pub const CHAR_DIGIT: u8 = 1 << 1;
+
+/// Byte class flag for `-`
+pub const CHAR_DASH: u8 = 1 << 2;
+
+/// Byte class flag for `_`
+pub const CHAR_UNDERSCORE: u8 = 1 << 3;
+
+/// Byte class flag for `.`
+pub const CHAR_DOT: u8 = 1 << 4;
+
+/// Byte class flags for ASCII letters and digits
+pub const CHAR_ALNUM: u8 = CHAR_ALPHA | CHAR_DIGIT;
+
+/// 256-entry table mapping every byte to its class flags (0 for bytes never allowed)
+pub static CHARSET_TABLE: [u8; 256] = build_charset_table();
+
+const fn build_charset_table() -> [u8; 256] {
+    let mut table = [0u8; 256];
+    let mut i = 0;
+    while i < 256 {
+        let byte = i as u8;
+        table[i] = if byte.is_ascii_alphabetic() {
+            CHAR_ALPHA
+        } else if byte.is_ascii_digit() {
+            CHAR_DIGIT
+        } else if byte == b'-' {
+            CHAR_DASH
+        } else if byte == b'_' {
+            CHAR_UNDERSCORE
+        } else if byte == b'.' {
+            CHAR_DOT
+        } else {
+            0
+        };
+        i += 1;
+    }
+    table
+}
+
+/// Byte-level grammar of a single TRN component, mirroring its regex pattern
+#[derive(Debug, Clone, Copy)]
+pub struct ComponentCharset {
+    /// Classes allowed for the first byte
+    pub first: u8,
+    /// Classes allowed for the remaining bytes
+    pub rest: u8,
+    /// Minimum length in bytes
+    pub min_length: usize,
+    /// Maximum length in bytes
+    pub max_length: usize,
+}
+
+impl ComponentCharset {
+    /// Check a component value against this grammar
+    #[inline]
+    pub fn matches(&self, value: &str) -> bool {
+        let bytes = value.as_bytes();
+        match bytes.split_first() {
+            Some((first, rest)) => {
+                bytes.len() >= self.min_length
+                    && bytes.len() <= self.max_length
+                    && CHARSET_TABLE[*first as usize] & self.first != 0
+                    && rest.iter().all(|b| CHARSET_TABLE[*b as usize] & self.rest != 0)
+            }
+            None => false,
+        }
+    }
+}
+
+/// Byte grammar equivalent to [`PLATFORM_PATTERN`]
+pub const PLATFORM_CHARSET: ComponentCharset = ComponentCharset {
+    first: CHAR_ALPHA,
+    rest: CHAR_ALNUM | CHAR_DASH,
+    min_length: 2,
+    max_length: PLATFORM_MAX_LENGTH,
+};
+
+/// Byte grammar equivalent to [`SCOPE_PATTERN`]
+pub const SCOPE_CHARSET: ComponentCharset = ComponentCharset {
+    first: CHAR_ALNUM,
+    rest: CHAR_ALNUM | CHAR_UNDERSCORE | CHAR_DASH,
+    min_length: 1,
+    max_length: SCOPE_MAX_LENGTH,
+};
+
+/// Byte grammar equivalent to [`RESOURCE_TYPE_PATTERN`]
+pub const RESOURCE_TYPE_CHARSET: ComponentCharset = ComponentCharset {
+    first: CHAR_ALPHA,
+    rest: CHAR_ALNUM | CHAR_UNDERSCORE | CHAR_DASH,
+    min_length: 2,
+    max_length: RESOURCE_TYPE_MAX_LENGTH,
+};
+
+/// Byte grammar equivalent to [`RESOURCE_ID_PATTERN`]
+pub const RESOURCE_ID_CHARSET: ComponentCharset = ComponentCharset {
+    first: CHAR_ALNUM,
+    rest: CHAR_ALNUM | CHAR_UNDERSCORE | CHAR_DOT | CHAR_DASH,
+    min_length: 1,
+    max_length: RESOURCE_ID_MAX_LENGTH,
+};
+
+/// Byte grammar equivalent to [`VERSION_PATTERN`]
+pub const VERSION_CHARSET: ComponentCharset = ComponentCharset {
+    first: CHAR_ALNUM,
+    rest: CHAR_ALNUM | CHAR_DOT | CHAR_DASH,
+    min_length: 1,
+    max_length: VERSION_MAX_LENGTH,
+};
+
 // Complete TRN Regex Pattern - Simplified 6-Component Format
 /// Compiled regex for complete TRN validation with simplified structure
+#[allow(dead_code)]
 pub static TRN_REGEX: Lazy<Regex> = Lazy::new(|| {
     let pattern = format!(
         r"^trn:({platform}):({scope}):({resource_type}):({resource_id}):({version})$",
@@ -72,104 +187,159 @@ pub static TRN_REGEX: Lazy<Regex> = Lazy::new(|| {
 });
 
 // Individual component regex patterns
+//
+// Validation uses the equivalent byte grammars in COMPONENT_CHARSETS, so
+// these are only compiled by callers that ask for them explicitly.
 /// Compiled regex for platform validation
+#[allow(dead_code)]
 pub static PLATFORM_REGEX: Lazy<Regex> = Lazy::new(|| {
     Regex::new(&format!(r"^{}$", PLATFORM_PATTERN)).unwrap()
 });
 
 /// Compiled regex for scope validation
+#[allow(dead_code)]
 pub static SCOPE_REGEX: Lazy<Regex> = Lazy::new(|| {
     Regex::new(&format!(r"^{}$", SCOPE_PATTERN)).unwrap()
 });
 
 /// Compiled regex for resource type validation
+#[allow(dead_code)]
 pub static RESOURCE_TYPE_REGEX: Lazy<Regex> = Lazy::new(|| {
     Regex::new(&format!(r"^{}$", RESOURCE_TYPE_PATTERN)).unwrap()
 });
 
 /// Compiled regex for resource ID validation
+#[allow(dead_code)]
 pub static RESOURCE_ID_REGEX: Lazy<Regex> = Lazy::new(|| {
     Regex::new(&format!(r"^{}$", RESOURCE_ID_PATTERN)).unwrap()
 });
 
 /// Compiled regex for version validation
+#[allow(dead_code)]
 pub static VERSION_REGEX: Lazy<Regex> = Lazy::new(|| {
     Regex::new(&format!(r"^{}$", VERSION_PATTERN)).unwrap()
 });
 
-// Reserved words that cannot be used in components
-/// Set of reserved words that cannot be used as platform names
-pub static RESERVED_PLATFORMS: Lazy<HashSet<&'static str>> = Lazy::new(|| {
-    [
-        "trn", "null", "undefined", "void",
-    ].iter().copied().collect()
-});
-
-/// Set of reserved words that cannot be used as scope names
-pub static RESERVED_SCOPES: Lazy<HashSet<&'static str>> = Lazy::new(|| {
-    [
-        "trn", "null", "undefined", "void",
-    ].iter().copied().collect()
-});
-
-/// Set of reserved words that cannot be used as resource type names
-pub static RESERVED_RESOURCE_TYPES: Lazy<HashSet<&'static str>> = Lazy::new(|| {
-    [
-        "trn", "null", "undefined", "void",
-    ].iter().copied().collect()
-});
+// Per-component tables, indexed by position within the TRN
+/// Component names in TRN order
+pub const COMPONENT_NAMES: [&str; 5] = ["platform", "scope", "resource_type", "resource_id", "version"];
+
+/// Unanchored component regex patterns in TRN order
+pub const COMPONENT_PATTERNS: [&str; 5] = [
+    PLATFORM_PATTERN,
+    SCOPE_PATTERN,
+    RESOURCE_TYPE_PATTERN,
+    RESOURCE_ID_PATTERN,
+    VERSION_PATTERN,
+];
+
+/// Maximum component lengths in TRN order
+pub const COMPONENT_MAX_LENGTHS: [usize; 5] = [
+    PLATFORM_MAX_LENGTH,
+    SCOPE_MAX_LENGTH,
+    RESOURCE_TYPE_MAX_LENGTH,
+    RESOURCE_ID_MAX_LENGTH,
+    VERSION_MAX_LENGTH,
+];
+
+/// Byte grammars of the components in TRN order
+pub const COMPONENT_CHARSETS: [ComponentCharset; 5] = [
+    PLATFORM_CHARSET,
+    SCOPE_CHARSET,
+    RESOURCE_TYPE_CHARSET,
+    RESOURCE_ID_CHARSET,
+    VERSION_CHARSET,
+];
 
-/// Set of reserved words that cannot be used as resource ID names
-pub static RESERVED_RESOURCE_IDS: Lazy<HashSet<&'static str>> = Lazy::new(|| {
-    [
-        "trn", "null", "undefined", "void",
-    ].iter().copied().collect()
-});
 
-/// Set of reserved words that cannot be used as version names
-pub static RESERVED_VERSIONS: Lazy<HashSet<&'static str>> = Lazy::new(|| {
-    [
-        "trn", "null", "undefined", "void",
-    ].iter().copied().collect()
-});
+// Reserved words that cannot be used in components
+/// Words that cannot be used as the value of any component
+pub const RESERVED_WORDS: [&str; 4] = ["trn", "null", "undefined", "void"];
+
+/// Check if a component value is a reserved word
+///
+/// Compiled to a length dispatch plus a byte compare, so no hashing is
+/// involved. Matching is case-sensitive: component grammars accept uppercase,
+/// and `NULL` or `Void` are not reserved. Must stay in sync with
+/// [`RESERVED_WORDS`].
+#[inline]
+pub fn is_reserved_word(value: &str) -> bool {
+    matches!(value, "trn" | "null" | "undefined" | "void")
+}
 
 // Valid platform values
-/// Set of valid platform identifiers
+/// Valid platform identifiers
 #[allow(dead_code)]
-pub static VALID_PLATFORMS: Lazy<HashSet<&'static str>> = Lazy::new(|| {
-    [
-        "user", "org", "aiplatform"
-    ].iter().copied().collect()
-});
+pub const VALID_PLATFORMS: [&str; 3] = ["user", "org", "aiplatform"];
+
+/// Check if a platform is one of [`VALID_PLATFORMS`]
+#[inline]
+pub fn is_valid_platform(value: &str) -> bool {
+    matches!(value, "user" | "org" | "aiplatform")
+}
 
 // Valid resource types
-/// Set of valid resource type identifiers
-#[allow(dead_code)]
-pub static VALID_RESOURCE_TYPES: Lazy<HashSet<&'static str>> = Lazy::new(|| {
-    [
-        "tool", "model", "dataset", "pipeline", "workflow", "service",
-        "api", "schema", "template", "config", "plugin", "extension",
-        "library", "framework", "runtime", "environment", "container",
-        "image", "script", "function", "lambda", "microservice",
-        "component", "module", "package", "bundle", "archive",
-        "custom-type", "other"
-    ].iter().copied().collect()
-});
+/// Valid resource type identifiers
+#[allow(dead_code)]
+pub const VALID_RESOURCE_TYPES: [&str; 29] = [
+    "tool", "model", "dataset", "pipeline", "workflow", "service",
+    "api", "schema", "template", "config", "plugin", "extension",
+    "library", "framework", "runtime", "environment", "container",
+    "image", "script", "function", "lambda", "microservice",
+    "component", "module", "package", "bundle", "archive",
+    "custom-type", "other",
+];
+
+/// Check if a resource type is one of [`VALID_RESOURCE_TYPES`]
+#[inline]
+pub fn is_valid_resource_type(value: &str) -> bool {
+    matches!(
+        value,
+        "tool" | "model" | "dataset" | "pipeline" | "workflow" | "service"
+            | "api" | "schema" | "template" | "config" | "plugin" | "extension"
+            | "library" | "framework" | "runtime" | "environment" | "container"
+            | "image" | "script" | "function" | "lambda" | "microservice"
+            | "component" | "module" | "package" | "bundle" | "archive"
+            | "custom-type" | "other"
+    )
+}
 
 // Semantic versioning pattern
 /// Regex pattern for semantic version validation
 #[allow(dead_code)]
 pub static SEMANTIC_VERSION_REGEX: Lazy<Regex> = Lazy::new(|| {
-    Regex::new(r"^(?P<major>0|[1-9]\d*)\.(?P<minor>0|[1-9]\d*)\.(?P<patch>0|[1-9]\d*)(?:-(?P<prerelease>(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+(?P<buildmetadata>[0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$").unwrap()
+    Regex::new(r"^(?P<major>0|[1-9][0-9]*)\.(?P<minor>0|[1-9][0-9]*)\.(?P<patch>0|[1-9][0-9]*)(?:-(?P<prerelease>(?:0|[1-9][0-9]*|[0-9]*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9][0-9]*|[0-9]*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+(?P<buildmetadata>[0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$").unwrap()
 });
 
 // Performance and operational constants
 /// Cache size for validation operations
-#[allow(dead_code)]
 pub const VALIDATION_CACHE_SIZE: usize = 1000;
 
+/// Cache size for parsed TRN objects
+///
+/// Also bounds the memoization of `normalize_trn` and `extract_base_trn`,
+/// which both resolve their input through the parse cache.
+pub const PARSE_CACHE_SIZE: usize = 4096;
+
+/// Cache size for compiled pattern regexes
+pub const PATTERN_CACHE_SIZE: usize = 256;
+
+/// Upper bound, in bytes, on the compiled size of a single pattern regex
+///
+/// Pattern length is not otherwise limited, so this caps the time and memory
+/// spent compiling one; ordinary TRN patterns use a small fraction of it.
+pub const PATTERN_REGEX_SIZE_LIMIT: usize = 256 * 1024;
+
+/// Cache size for parsed semantic versions
+pub const VERSION_CACHE_SIZE: usize = 4096;
+
+/// Cache size for parsed base URLs used by HTTP URL conversion
+pub const BASE_URL_CACHE_SIZE: usize = 64;
+
+/// Batch size from which batch validation is split across threads
+pub const PARALLEL_VALIDATION_THRESHOLD: usize = 4096;
+
 /// Cache TTL in seconds
-#[allow(dead_code)]
 pub const VALIDATION_CACHE_TTL_SECONDS: u64 = 300;
 
 /// Library version
@@ -203,4 +373,43 @@ pub const TEST_VERSION: &str = "v1.0";
 
 #[cfg(test)]
 #[allow(dead_code)]
-pub const SAMPLE_TRN: &str = "trn:user:testuser:tool:testresource:v1.0"; 
\ No newline at end of file
+pub const SAMPLE_TRN: &str = "trn:user:testuser:tool:testresource:v1.0"; 
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_predicates_match_lists() {
+        assert!(RESERVED_WORDS.iter().all(|word| is_reserved_word(word)));
+        assert!(VALID_PLATFORMS.iter().all(|platform| is_valid_platform(platform)));
+        assert!(VALID_RESOURCE_TYPES.iter().all(|resource_type| is_valid_resource_type(resource_type)));
+
+        assert!(!is_reserved_word("alice"));
+        assert!(!is_reserved_word("NULL"));
+        assert!(!is_reserved_word("Trn"));
+        assert!(!is_valid_platform("custom"));
+        assert!(!is_valid_resource_type("agent"));
+    }
+
+    #[test]
+    fn test_component_charsets_agree_with_regexes() {
+        let regexes = [
+            &*PLATFORM_REGEX,
+            &*SCOPE_REGEX,
+            &*RESOURCE_TYPE_REGEX,
+            &*RESOURCE_ID_REGEX,
+            &*VERSION_REGEX,
+        ];
+        let values = [
+            "", "a", "ab", "user", "1abc", "-abc", "_abc", "a_b", "a.b", "a-b",
+            "v1.0", "v1.0-beta", "my.api_v2", "测试", "a b", "A1",
+        ];
+
+        for (charset, regex) in COMPONENT_CHARSETS.iter().zip(regexes) {
+            for value in values {
+                assert_eq!(charset.matches(value), regex.is_match(value), "{}", value);
+            }
+        }
+    }
+}
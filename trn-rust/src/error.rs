@@ -3,6 +3,7 @@
 //! This module defines all error types that can occur during TRN parsing,
 //! validation, and manipulation operations.
 
+use serde::ser::{Serialize, SerializeStruct, Serializer};
 use std::fmt;
 
 /// Result type alias for TRN operations
@@ -357,7 +358,10 @@ impl TrnError {
     }
 
     /// Get the error category for JSON RPC compatibility
-    pub fn error_code(&self) -> i32 {
+    ///
+    /// Codes are fixed per variant, so this is a `const fn` and resolves at
+    /// compile time when the variant is known.
+    pub const fn error_code(&self) -> i32 {
         match self {
             Self::Format { .. } => -32000,
             Self::Validation { .. } => -32001,
@@ -383,25 +387,26 @@ impl TrnError {
     }
 
     /// Get the error code (alias for error_code)
-    pub fn code(&self) -> i32 {
+    pub const fn code(&self) -> i32 {
         self.error_code()
     }
 
     /// Convert to JSON RPC error response format
     pub fn to_json_rpc(&self) -> serde_json::Value {
-        serde_json::json!({
-            "code": self.error_code(),
-            "message": self.to_string(),
-            "data": {
-                "type": self.error_type_name(),
-                "trn": self.trn(),
-                "details": self.error_details()
-            }
-        })
+        serde_json::to_value(self.json_rpc()).expect("JSON RPC errors always serialize")
+    }
+
+    /// Borrow this error as a JSON RPC error response
+    ///
+    /// Serializes to the same layout as [`TrnError::to_json_rpc`], but writes
+    /// straight to the serializer instead of building a `serde_json::Value`
+    /// tree first, and renders the message without an intermediate `String`.
+    pub fn json_rpc(&self) -> JsonRpcError<'_> {
+        JsonRpcError { error: self }
     }
 
     /// Get the error type name
-    fn error_type_name(&self) -> &'static str {
+    const fn error_type_name(&self) -> &'static str {
         match self {
             Self::Format { .. } => "TrnFormatError",
             Self::Validation { .. } => "TrnValidationError",
@@ -474,6 +479,37 @@ impl TrnError {
     }
 }
 
+/// Borrowed JSON RPC view of a [`TrnError`], created by [`TrnError::json_rpc`]
+#[derive(Debug, Clone, Copy)]
+pub struct JsonRpcError<'a> {
+    error: &'a TrnError,
+}
+
+/// The `data` member of a JSON RPC error response
+struct JsonRpcErrorData<'a> {
+    error: &'a TrnError,
+}
+
+impl Serialize for JsonRpcError<'_> {
+    fn serialize<S: Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        let mut state = serializer.serialize_struct("JsonRpcError", 3)?;
+        state.serialize_field("code", &self.error.error_code())?;
+        state.serialize_field("message", &format_args!("{}", self.error))?;
+        state.serialize_field("data", &JsonRpcErrorData { error: self.error })?;
+        state.end()
+    }
+}
+
+impl Serialize for JsonRpcErrorData<'_> {
+    fn serialize<S: Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        let mut state = serializer.serialize_struct("JsonRpcErrorData", 3)?;
+        state.serialize_field("type", self.error.error_type_name())?;
+        state.serialize_field("trn", &self.error.trn())?;
+        state.serialize_field("details", &self.error.error_details())?;
+        state.end()
+    }
+}
+
 /// Specialized error for TRN parsing
 #[derive(Debug, Clone, PartialEq)]
 pub struct TrnParseError {
@@ -528,6 +564,17 @@ mod tests {
         assert_eq!(json["data"]["details"]["max_length"], 256);
     }
 
+    #[test]
+    fn test_json_rpc_view_matches_value() {
+        let err = TrnError::format("Invalid format", Some("invalid-trn".to_string()));
+        let streamed: serde_json::Value =
+            serde_json::from_str(&serde_json::to_string(&err.json_rpc()).unwrap()).unwrap();
+
+        assert_eq!(streamed, err.to_json_rpc());
+        assert_eq!(streamed["message"], err.to_string());
+        assert_eq!(streamed["data"]["trn"], "invalid-trn");
+    }
+
     #[test]
     fn test_parse_error_conversion() {
         let parse_err = TrnParseError {
@@ -0,0 +1,316 @@
+//! TRN component index
+//!
+//! This module provides a trie keyed by TRN component, so wildcard patterns
+//! only walk the branches they can match instead of scanning every TRN.
+
+use regex::Regex;
+use std::collections::HashMap;
+use std::sync::Arc;
+
+use crate::error::{TrnError, TrnResult};
+use crate::parsing::{parse_trn_uncached, scan_trn};
+use crate::pattern::compile_segment;
+use crate::validation::validate_scanned_rules;
+
+/// Number of component levels below the `trn` prefix
+const INDEX_DEPTH: usize = 5;
+
+/// Component trie for fast pattern lookups over large TRN collections
+///
+/// Each level of the trie corresponds to one component
+/// (platform, scope, resource type, resource ID, version). A literal pattern
+/// segment is a single map lookup, a `*` segment visits every child, and a
+/// segment with an embedded wildcard (e.g. `v1.*`) filters the children with
+/// an anchored regex.
+///
+/// # Examples
+///
+/// ```rust
+/// use trn_rust::TrnIndex;
+///
+/// let mut index = TrnIndex::new();
+/// index.add("trn:user:alice:tool:myapi:v1.0")?;
+/// index.add("trn:org:company:model:bert:v2.1")?;
+///
+/// let matches = index.find("trn:user:*:tool:*:*")?;
+/// assert_eq!(matches, vec!["trn:user:alice:tool:myapi:v1.0"]);
+/// # Ok::<(), trn_rust::TrnError>(())
+/// ```
+#[derive(Debug, Clone, Default)]
+pub struct TrnIndex {
+    root: IndexNode,
+    len: usize,
+}
+
+/// Trie node holding one component level
+#[derive(Debug, Clone, Default)]
+struct IndexNode {
+    children: HashMap<String, IndexNode>,
+    trn: Option<String>,
+}
+
+impl IndexNode {
+    /// Get the child for a component value, creating it if needed
+    ///
+    /// Component values repeat heavily across a collection (`user`, `tool`,
+    /// `latest`, ...), so the key is only copied into an owned `String` the
+    /// first time a value is seen under this node.
+    fn child_mut(&mut self, component: &str) -> &mut IndexNode {
+        if !self.children.contains_key(component) {
+            self.children.insert(component.to_string(), IndexNode::default());
+        }
+        self.children
+            .get_mut(component)
+            .expect("child was inserted above")
+    }
+}
+
+/// Pre-compiled pattern segment
+enum Segment<'p> {
+    /// Matches any component value
+    Any,
+    /// Matches one exact component value
+    Exact(&'p str),
+    /// Matches component values against an anchored regex
+    Glob(Arc<Regex>),
+}
+
+impl TrnIndex {
+    /// Create an empty index
+    pub fn new() -> Self {
+        Self::default()
+    }
+
+    /// Build an index from a collection of TRN strings, skipping invalid ones
+    pub fn from_trns(trns: &[String]) -> Self {
+        let mut index = Self::new();
+        for trn in trns {
+            let _ = index.add(trn);
+        }
+        index
+    }
+
+    /// Add a TRN to the index
+    ///
+    /// Returns `Ok(true)` if the TRN was newly inserted and `Ok(false)` if it
+    /// was already present.
+    ///
+    /// The index keeps its own copy of every TRN, so adding bypasses the
+    /// global parse and validation caches: loading a large collection would
+    /// otherwise keep evicting other callers' hot entries for no benefit.
+    /// Well-formed input is validated from its scan without building a `Trn`.
+    pub fn add(&mut self, trn: &str) -> TrnResult<bool> {
+        let parsed;
+        let components = match scan_trn(trn) {
+            Some(components) => {
+                validate_scanned_rules(&components, trn)?;
+                components
+            }
+            None => {
+                parsed = parse_trn_uncached(trn)?;
+                parsed.components()
+            }
+        };
+
+        let node = [
+            components.platform,
+            components.scope,
+            components.resource_type,
+            components.resource_id,
+            components.version,
+        ]
+        .iter()
+        .fold(&mut self.root, |node, component| node.child_mut(component));
+
+        if node.trn.is_some() {
+            return Ok(false);
+        }
+
+        node.trn = Some(trn.to_string());
+        self.len += 1;
+        Ok(true)
+    }
+
+    /// Find all indexed TRNs matching a wildcard pattern
+    pub fn find(&self, pattern: &str) -> TrnResult<Vec<&str>> {
+        let segments = compile_segments(pattern)?;
+        let mut matches = Vec::new();
+        collect_matches(&self.root, &segments, &mut matches);
+        Ok(matches)
+    }
+
+    /// Check if a TRN is in the index
+    ///
+    /// Every indexed TRN passed the scanner, so input it rejects is simply
+    /// absent; no parse error is built for it.
+    pub fn contains(&self, trn: &str) -> bool {
+        match scan_trn(trn) {
+            Some(components) => [
+                components.platform,
+                components.scope,
+                components.resource_type,
+                components.resource_id,
+                components.version,
+            ]
+            .iter()
+            .try_fold(&self.root, |node, component| node.children.get(*component))
+            .map_or(false, |node| node.trn.is_some()),
+            None => false,
+        }
+    }
+
+    /// Get the number of indexed TRNs
+    pub fn len(&self) -> usize {
+        self.len
+    }
+
+    /// Check if the index is empty
+    pub fn is_empty(&self) -> bool {
+        self.len == 0
+    }
+
+    /// Remove all TRNs from the index
+    pub fn clear(&mut self) {
+        self.root = IndexNode::default();
+        self.len = 0;
+    }
+}
+
+/// Split a pattern into one compiled segment per component level
+fn compile_segments(pattern: &str) -> TrnResult<Vec<Segment<'_>>> {
+    let rest = pattern.strip_prefix("trn:").ok_or_else(|| TrnError::pattern(
+        "Pattern must start with 'trn:'",
+        pattern,
+    ))?;
+
+    let parts: Vec<&str> = rest.split(':').collect();
+    if parts.len() != INDEX_DEPTH {
+        return Err(TrnError::pattern(
+            "Pattern must have exactly 6 components (trn:platform:scope:resource_type:resource_id:version)",
+            pattern,
+        ));
+    }
+
+    parts
+        .into_iter()
+        .map(|part| {
+            if part == "*" || part.is_empty() {
+                Ok(Segment::Any)
+            } else if part.contains('*') {
+                compile_segment(part).map(Segment::Glob)
+            } else {
+                Ok(Segment::Exact(part))
+            }
+        })
+        .collect()
+}
+
+/// Walk the trie, descending only into branches that match each segment
+fn collect_matches<'a>(node: &'a IndexNode, segments: &[Segment<'_>], matches: &mut Vec<&'a str>) {
+    let (segment, rest) = match segments.split_first() {
+        Some(split) => split,
+        None => {
+            if let Some(trn) = &node.trn {
+                matches.push(trn);
+            }
+            return;
+        }
+    };
+
+    match segment {
+        Segment::Exact(value) => {
+            if let Some(child) = node.children.get(*value) {
+                collect_matches(child, rest, matches);
+            }
+        }
+        Segment::Any => {
+            for child in node.children.values() {
+                collect_matches(child, rest, matches);
+            }
+        }
+        Segment::Glob(regex) => {
+            for (value, child) in &node.children {
+                if regex.is_match(value) {
+                    collect_matches(child, rest, matches);
+                }
+            }
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn sample_index() -> TrnIndex {
+        TrnIndex::from_trns(&[
+            "trn:user:alice:tool:myapi:v1.0".to_string(),
+            "trn:user:alice:tool:myapi:v1.1".to_string(),
+            "trn:user:alice:tool:python-script:v2.0".to_string(),
+            "trn:user:bob:tool:slack-api:v1.5".to_string(),
+            "trn:org:company:tool:workflow-pipeline:latest".to_string(),
+            "trn:org:company:model:bert:v2.1".to_string(),
+        ])
+    }
+
+    fn sorted(mut matches: Vec<&str>) -> Vec<&str> {
+        matches.sort_unstable();
+        matches
+    }
+
+    #[test]
+    fn test_index_add_and_len() {
+        let mut index = sample_index();
+        assert_eq!(index.len(), 6);
+        assert!(!index.add("trn:user:alice:tool:myapi:v1.0").unwrap());
+        assert!(index.add("invalid:format").is_err());
+        assert!(index.add("trn:user:alice:tool:null:v1.0").is_err());
+        assert!(index.add("trn:user:alice:widget:myapi:v1.0").is_err());
+        assert_eq!(index.len(), 6);
+        assert!(index.contains("trn:org:company:model:bert:v2.1"));
+        assert!(!index.contains("trn:org:company:model:bert:v9.9"));
+        assert!(!index.contains("not a trn"));
+    }
+
+    #[test]
+    fn test_index_find_wildcards() {
+        let index = sample_index();
+
+        assert_eq!(index.find("trn:user:alice:tool:*:*").unwrap().len(), 3);
+        assert_eq!(index.find("trn:*:*:tool:*:*").unwrap().len(), 5);
+        assert_eq!(
+            sorted(index.find("trn:*:*:*:*:v1.*").unwrap()),
+            vec![
+                "trn:user:alice:tool:myapi:v1.0",
+                "trn:user:alice:tool:myapi:v1.1",
+                "trn:user:bob:tool:slack-api:v1.5",
+            ]
+        );
+        assert!(index.find("trn:aiplatform:*:*:*:*").unwrap().is_empty());
+    }
+
+    #[test]
+    fn test_index_agrees_with_linear_scan() {
+        let trns = vec![
+            "trn:user:alice:tool:myapi:v1.0".to_string(),
+            "trn:user:bob:tool:slack-api:v1.5".to_string(),
+            "trn:org:company:model:bert:v2.1".to_string(),
+        ];
+        let index = TrnIndex::from_trns(&trns);
+
+        for pattern in ["trn:user:*:*:*:*", "trn:*:*:model:*:*", "trn:*:*:*:*-api:*"] {
+            let expected: Vec<&str> = crate::pattern::find_matching_trns(&trns, pattern)
+                .into_iter()
+                .map(String::as_str)
+                .collect();
+            assert_eq!(sorted(index.find(pattern).unwrap()), sorted(expected), "{}", pattern);
+        }
+    }
+
+    #[test]
+    fn test_index_invalid_pattern() {
+        let index = sample_index();
+        assert!(index.find("user:*:*:*:*").is_err());
+        assert!(index.find("trn:*:*:*").is_err());
+    }
+}
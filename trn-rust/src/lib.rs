@@ -10,7 +10,7 @@
 //!
 //! - Parsing and validating TRN strings
 //! - Converting between TRN and URL formats
-//! - Pattern matching and filtering
+//! - Pattern matching, filtering and indexing
 //! - Version comparison and management
 //! - Builder pattern for TRN construction
 //!
@@ -93,6 +93,8 @@ mod types;
 
 // Main functionality modules
 mod builder;
+mod cache;
+mod index;
 mod parsing;
 mod pattern;
 mod url;
@@ -101,7 +103,7 @@ mod validation;
 
 // Re-export public API
 pub use builder::TrnBuilder;
-pub use error::{TrnError, TrnResult};
+pub use error::{JsonRpcError, TrnError, TrnResult};
 pub use types::{Platform, ResourceType, Trn, TrnComponents};
 
 // Re-export utility functions
@@ -112,7 +114,7 @@ pub use url::url_to_trn;
 
 // Re-export validation functions
 pub use validation::{
-    is_valid_trn, validate_trn_string, validate_trn_struct, validate_multiple_trns,
+    is_valid_trn, validate_trn_string, validate_trn_struct, validate_multiple_trns, are_valid_trns,
     generate_validation_report, check_component_format, validate_naming_conventions,
     validate_performance_batch, ValidationCache, ValidationCacheStats, ValidationStats,
     ValidationReport
@@ -123,6 +125,9 @@ pub use validation::{
 // Re-export pattern matching
 pub use pattern::{find_matching_trns, TrnMatcher};
 
+// Re-export indexing
+pub use index::TrnIndex;
+
 // Feature-gated modules (commented out for now - implement as needed)
 // #[cfg(feature = "cli")]
 // #[cfg_attr(docsrs, doc(cfg(feature = "cli")))]
@@ -157,6 +162,41 @@ pub fn parse(input: &str) -> TrnResult<Trn> {
     Trn::parse(input)
 }
 
+/// Clear the global parse, validation, version, pattern and base URL caches
+///
+/// Parsing, string validation and semantic version parsing memoize their
+/// results keyed by the exact input string; pattern matching and HTTP URL
+/// conversion keep compiled patterns and parsed base URLs. This is mainly
+/// useful for benchmarks, config reloads and long-running processes that want
+/// to release the cached entries.
+///
+/// # Examples
+///
+/// ```rust
+/// use trn_rust::{clear_caches, parse};
+///
+/// let trn = parse("trn:user:alice:tool:getUserById:v1.0")?;
+/// clear_caches();
+/// assert_eq!(parse("trn:user:alice:tool:getUserById:v1.0")?, trn);
+/// # Ok::<(), trn_rust::TrnError>(())
+/// ```
+pub fn clear_caches() {
+    parsing::clear_parse_cache();
+    validation::clear_validation_cache();
+    utils::clear_version_cache();
+    pattern::clear_pattern_cache();
+    url::clear_base_url_cache();
+}
+
+/// Number of TRNs currently held by the parse cache
+///
+/// The cache holds at most 4096 entries; watching this against the number of
+/// distinct TRNs in a workload shows whether the bound is large enough to keep
+/// repeated parses (and base TRN extraction) hitting the cache.
+pub fn parse_cache_len() -> usize {
+    parsing::parse_cache_len()
+}
+
 /// Trait for types that can be validated
 pub trait Validate {
     /// Validate the item
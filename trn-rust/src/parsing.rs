@@ -1,191 +1,225 @@
 //! TRN parsing functionality
 //!
-//! This module provides high-performance parsing of TRN strings using regex
-//! with comprehensive error handling and zero-copy optimization for the
-//! simplified 6-component format.
+//! This module provides high-performance parsing of TRN strings using a
+//! single-pass byte scanner, with the regex/split path kept as a fallback for
+//! detailed error reporting, and zero-copy optimization for the simplified
+//! 6-component format.
 
+use dashmap::DashMap;
+use once_cell::sync::Lazy;
 use percent_encoding::percent_decode_str;
 
+use crate::cache::insert_bounded;
 use crate::constants::*;
 use crate::error::{TrnError, TrnResult};
 use crate::types::{Trn, TrnComponents};
+use crate::validation::{validate_length, validate_scanned};
+
+/// Successfully parsed TRNs keyed by the exact input string
+///
+/// Only TRN strings are cached here: a hit is returned before any validation,
+/// so a key that is not itself a valid TRN must never be stored.
+static PARSE_CACHE: Lazy<DashMap<String, Trn>> = Lazy::new(DashMap::new);
+
+/// Successfully parsed `trn://` URLs keyed by the exact URL string
+///
+/// Kept apart from [`PARSE_CACHE`] so that parsing a URL never makes the same
+/// string acceptable to [`parse_trn`].
+static URL_PARSE_CACHE: Lazy<DashMap<String, Trn>> = Lazy::new(DashMap::new);
+
+/// Remember a parsed TRN, evicting a quarter of the entries when full
+fn cache_parsed(input: &str, trn: &Trn) {
+    insert_bounded(&PARSE_CACHE, PARSE_CACHE_SIZE, input.to_string(), trn.clone());
+}
 
-/// Parse TRN string into a TRN object
-pub fn parse_trn(input: &str) -> TrnResult<Trn> {
-    // Basic validation
-    if input.is_empty() {
-        return Err(TrnError::format(
-            "Empty TRN string".to_string(),
-            Some(input.to_string()),
-        ));
+/// Clear all cached parse results, including parsed URLs
+pub fn clear_parse_cache() {
+    PARSE_CACHE.clear();
+    URL_PARSE_CACHE.clear();
+}
+
+/// Number of parsed TRNs currently cached
+pub fn parse_cache_len() -> usize {
+    PARSE_CACHE.len()
+}
+
+/// Scan a TRN string in a single left-to-right pass (zero-copy)
+///
+/// Walks the bytes once as a small state machine (the state being the index
+/// of the current component), checking each byte against the component's
+/// class table and length limit as it goes, so separators are located and
+/// components validated without a second pass over the input.
+///
+/// Returns the borrowed components only when every component satisfies its
+/// byte grammar, i.e. exactly when [`TRN_REGEX`] would match. Any deviation
+/// yields `None` so callers can fall back to the slower path that produces
+/// detailed errors.
+pub fn scan_trn(input: &str) -> Option<TrnComponents<'_>> {
+    let body = input.strip_prefix("trn:")?;
+    let bytes = body.as_bytes();
+
+    let mut ends = [0usize; 5];
+    let mut component = 0;
+    let mut start = 0;
+
+    for (position, &byte) in bytes.iter().enumerate() {
+        let charset = &COMPONENT_CHARSETS[component];
+        let length = position - start;
+
+        if byte == TRN_SEPARATOR as u8 {
+            if component == 4 || length < charset.min_length {
+                return None;
+            }
+            ends[component] = position;
+            component += 1;
+            start = position + 1;
+        } else {
+            let classes = if length == 0 { charset.first } else { charset.rest };
+            if length >= charset.max_length || CHARSET_TABLE[byte as usize] & classes == 0 {
+                return None;
+            }
+        }
     }
 
-    if !input.starts_with("trn:") {
-        return Err(TrnError::format(
-            "TRN must start with 'trn:'".to_string(),
-            Some(input.to_string()),
-        ));
+    if component != 4 || bytes.len() - start < COMPONENT_CHARSETS[4].min_length {
+        return None;
     }
+    ends[4] = bytes.len();
 
-    // Split TRN by colons - expect exactly 6 parts for simplified structure
-    let parts: Vec<&str> = input.split(':').collect();
+    // Every accepted byte is ASCII, so these offsets are char boundaries
+    Some(TrnComponents::new(
+        &body[..ends[0]],
+        &body[ends[0] + 1..ends[1]],
+        &body[ends[1] + 1..ends[2]],
+        &body[ends[2] + 1..ends[3]],
+        &body[ends[3] + 1..ends[4]],
+    ))
+}
 
-    if parts.len() != TRN_FIXED_COMPONENT_COUNT {
-        return Err(TrnError::format(
-            format!(
-                "TRN must have exactly {} components (trn:platform:scope:resource_type:resource_id:version), found {}",
-                TRN_FIXED_COMPONENT_COUNT,
-                parts.len()
-            ),
-            Some(input.to_string()),
-        ));
+/// Parse TRN string into a TRN object
+///
+/// Successful results are cached by input string, so repeated parses of the
+/// same TRN skip scanning and validation entirely.
+pub fn parse_trn(input: &str) -> TrnResult<Trn> {
+    if let Some(cached) = PARSE_CACHE.get(input) {
+        return Ok(cached.value().clone());
     }
 
-    if parts[0] != "trn" {
-        return Err(TrnError::format(
-            "TRN must start with 'trn:'".to_string(),
-            Some(input.to_string()),
-        ));
+    let trn = parse_trn_uncached(input)?;
+    cache_parsed(input, &trn);
+    Ok(trn)
+}
+
+/// Parse a TRN, or `None` if it is invalid
+///
+/// For callers that skip invalid input: malformed strings are rejected by the
+/// scanner without building the detailed error [`parse_trn`] would return,
+/// only for it to be discarded. Successful results share the parse cache.
+pub(crate) fn try_parse_trn(input: &str) -> Option<Trn> {
+    if let Some(cached) = PARSE_CACHE.get(input) {
+        return Some(cached.value().clone());
     }
 
-    // Parse simplified structure: trn:platform:scope:resource_type:resource_id:version
-    let platform = parts[1];
-    let scope = parts[2];
-    let resource_type = parts[3];
-    let resource_id = parts[4];
-    let version = parts[5];
+    // Input the scanner rejects never parses, so no fallback is needed here
+    let components = scan_trn(input)?;
+    validate_scanned(input, &components).ok()?;
 
-    // Validate all components are non-empty
-    if platform.is_empty() {
-        return Err(TrnError::component(
-            "Platform cannot be empty".to_string(),
-            "platform".to_string(),
-            Some(input.to_string()),
-        ));
-    }
+    let trn = components.to_owned();
+    cache_parsed(input, &trn);
+    Some(trn)
+}
 
-    if scope.is_empty() {
-        return Err(TrnError::component(
-            "Scope cannot be empty".to_string(),
-            "scope".to_string(),
-            Some(input.to_string()),
-        ));
+/// Parse TRN string into a TRN object without consulting the parse cache
+pub(crate) fn parse_trn_uncached(input: &str) -> TrnResult<Trn> {
+    // Fast path: well-formed input skips the split/regex pipeline entirely,
+    // and is validated from this scan rather than rescanned by the validator
+    if let Some(components) = scan_trn(input) {
+        validate_scanned(input, &components)?;
+        return Ok(components.to_owned());
     }
 
-    if resource_type.is_empty() {
-        return Err(TrnError::component(
-            "Resource type cannot be empty".to_string(),
-            "resource_type".to_string(),
+    // Basic validation
+    if input.is_empty() {
+        return Err(TrnError::format(
+            "Empty TRN string".to_string(),
             Some(input.to_string()),
         ));
     }
 
-    if resource_id.is_empty() {
-        return Err(TrnError::component(
-            "Resource ID cannot be empty".to_string(),
-            "resource_id".to_string(),
+    if !input.starts_with("trn:") {
+        return Err(TrnError::format(
+            "TRN must start with 'trn:'".to_string(),
             Some(input.to_string()),
         ));
     }
 
-    if version.is_empty() {
-        return Err(TrnError::component(
-            "Version cannot be empty".to_string(),
-            "version".to_string(),
-            Some(input.to_string()),
-        ));
-    }
+    let components = split_trn_components(input)?;
 
-    // Create and validate the TRN
-    let trn = Trn::new(
-        platform.to_string(),
-        scope.to_string(),
-        resource_type.to_string(),
-        resource_id.to_string(),
-        version.to_string(),
-    )?;
+    // Reject out-of-range lengths before building a TRN that would fail anyway
+    validate_length(input)?;
 
-    Ok(trn)
+    // Create and validate the TRN
+    Trn::from_components(components)
 }
 
-/// Parse TRN components from a string (zero-copy)
-pub fn parse_trn_components(input: &str) -> TrnResult<TrnComponents<'_>> {
-    // Split TRN by colons - expect exactly 6 parts for simplified structure
-    let parts: Vec<&str> = input.split(':').collect();
-    
-    if parts.len() != TRN_FIXED_COMPONENT_COUNT {
+/// Human-readable component labels in TRN order, used in error messages
+const COMPONENT_LABELS: [&str; 5] = ["Platform", "Scope", "Resource type", "Resource ID", "Version"];
+
+/// Split a TRN into its fixed layout, reporting the first structural problem
+///
+/// This is the slow path behind [`scan_trn`]: it does not check component
+/// grammars, but explains why an input does not have the
+/// `trn:platform:scope:resource_type:resource_id:version` shape.
+pub(crate) fn split_trn_components(input: &str) -> TrnResult<TrnComponents<'_>> {
+    // Fill the fixed layout directly, counting any surplus parts for the error
+    let mut parts = [""; TRN_FIXED_COMPONENT_COUNT];
+    let mut count = 0;
+    for part in input.split(TRN_SEPARATOR) {
+        if let Some(slot) = parts.get_mut(count) {
+            *slot = part;
+        }
+        count += 1;
+    }
+
+    if count != TRN_FIXED_COMPONENT_COUNT {
         return Err(TrnError::format(
             format!(
                 "TRN must have exactly {} components (trn:platform:scope:resource_type:resource_id:version), found {}",
                 TRN_FIXED_COMPONENT_COUNT,
-                parts.len()
+                count
             ),
             Some(input.to_string()),
         ));
     }
-    
+
     if parts[0] != "trn" {
         return Err(TrnError::format(
             "TRN must start with 'trn:'".to_string(),
             Some(input.to_string()),
         ));
     }
-    
-    // Parse simplified structure: trn:platform:scope:resource_type:resource_id:version
-    let platform = parts[1];
-    let scope = parts[2];
-    let resource_type = parts[3];
-    let resource_id = parts[4];
-    let version = parts[5];
 
     // Validate all components are non-empty
-    if platform.is_empty() {
-        return Err(TrnError::component(
-            "Platform cannot be empty".to_string(),
-            "platform".to_string(),
-            Some(input.to_string()),
-        ));
-    }
-
-    if scope.is_empty() {
-        return Err(TrnError::component(
-            "Scope cannot be empty".to_string(),
-            "scope".to_string(),
-            Some(input.to_string()),
-        ));
+    for (index, value) in parts[1..].iter().enumerate() {
+        if value.is_empty() {
+            return Err(TrnError::component(
+                format!("{} cannot be empty", COMPONENT_LABELS[index]),
+                COMPONENT_NAMES[index].to_string(),
+                Some(input.to_string()),
+            ));
+        }
     }
 
-    if resource_type.is_empty() {
-        return Err(TrnError::component(
-            "Resource type cannot be empty".to_string(),
-            "resource_type".to_string(),
-            Some(input.to_string()),
-        ));
-    }
+    Ok(TrnComponents::new(parts[1], parts[2], parts[3], parts[4], parts[5]))
+}
 
-    if resource_id.is_empty() {
-        return Err(TrnError::component(
-            "Resource ID cannot be empty".to_string(),
-            "resource_id".to_string(),
-            Some(input.to_string()),
-        ));
+/// Parse TRN components from a string (zero-copy)
+pub fn parse_trn_components(input: &str) -> TrnResult<TrnComponents<'_>> {
+    if let Some(components) = scan_trn(input) {
+        return Ok(components);
     }
 
-    if version.is_empty() {
-        return Err(TrnError::component(
-            "Version cannot be empty".to_string(),
-            "version".to_string(),
-            Some(input.to_string()),
-        ));
-    }
-    
-    Ok(TrnComponents {
-        platform,
-        scope,
-        resource_type,
-        resource_id,
-        version,
-    })
+    split_trn_components(input)
 }
 
 /// Extract normalized components
@@ -202,17 +236,28 @@ pub fn extract_components(input: &str) -> TrnResult<(String, String, String, Str
 }
 
 /// Normalize TRN string
+///
+/// Inputs that parse as-is are served from the parse cache, so repeated
+/// normalization of the same TRN skips scanning and validation.
 #[allow(dead_code)]
 pub fn normalize_trn(input: &str) -> TrnResult<String> {
     // First try parsing as-is
     match parse_trn(input) {
         Ok(trn) => Ok(trn.to_string()),
-        Err(_) => {
-            // If that fails, try lowercasing first
-            let lowercase_input = input.to_lowercase();
-            let trn = parse_trn(&lowercase_input)?;
-            Ok(trn.to_string())
-        }
+        // If that fails, try lowercasing first
+        Err(error) => parse_lowercased(input, error).map(|trn| trn.to_string()),
+    }
+}
+
+/// Retry a failed parse on the ASCII-lowercased input
+///
+/// Every valid TRN byte is ASCII, so only ASCII letters need folding; inputs
+/// without uppercase letters would fail again and return `error` directly.
+fn parse_lowercased(input: &str, error: TrnError) -> TrnResult<Trn> {
+    if input.bytes().any(|byte| byte.is_ascii_uppercase()) {
+        parse_trn(&input.to_ascii_lowercase())
+    } else {
+        Err(error)
     }
 }
 
@@ -222,11 +267,8 @@ pub fn parse_trn_with_recovery(input: &str) -> TrnResult<Trn> {
     // Try main parser first
     match parse_trn(input) {
         Ok(trn) => Ok(trn),
-        Err(_) => {
-            // Try with normalization
-            let normalized = input.to_lowercase();
-            parse_trn(&normalized)
-        }
+        // Try with normalization
+        Err(error) => parse_lowercased(input, error),
     }
 }
 
@@ -234,7 +276,13 @@ pub fn parse_trn_with_recovery(input: &str) -> TrnResult<Trn> {
 #[allow(dead_code)]
 pub fn extract_base_trn(input: &str) -> TrnResult<String> {
     let trn = parse_trn(input)?;
-    Ok(trn.base_trn().to_string())
+    // The version is the last component, so the base is a prefix of the TRN
+    let repr = trn.as_str();
+    let head = &repr[..repr.len() - trn.version().len()];
+    let mut base = String::with_capacity(head.len() + 1);
+    base.push_str(head);
+    base.push('*');
+    Ok(base)
 }
 
 /// Check if input looks like a TRN
@@ -244,10 +292,13 @@ pub fn is_trn_format(input: &str) -> bool {
 }
 
 /// Parse base TRN (without version)
+///
+/// The base is derived from the parsed TRN by slicing, not by serializing and
+/// re-parsing it: the wildcard version is not part of the component grammar,
+/// so a second parse could only reject it.
 #[allow(dead_code)]
 pub fn parse_base_trn(input: &str) -> TrnResult<Trn> {
-    let trn = parse_trn(input)?;
-    parse_trn(&trn.base_trn().to_string())
+    Ok(parse_trn(input)?.base_trn())
 }
 
 /// Check if string looks like a TRN (alternative name)
@@ -261,8 +312,9 @@ pub fn is_trn_like(input: &str) -> bool {
 pub fn parse_multiple_trns(input: &str) -> Vec<TrnResult<Trn>> {
     input
         .lines()
-        .filter(|line| !line.trim().is_empty())
-        .map(|line| parse_trn(line.trim()))
+        .map(str::trim)
+        .filter(|line| !line.is_empty())
+        .map(parse_trn)
         .collect()
 }
 
@@ -277,47 +329,67 @@ pub fn parse_trn_from_url(url: &str) -> TrnResult<Trn> {
 
 /// Parse TRN URL format for simplified structure
 fn parse_trn_url(url: &str) -> TrnResult<Trn> {
-    if !url.starts_with("trn://") {
-        return Err(TrnError::format(
-            "URL must start with trn://".to_string(),
-            Some(url.to_string()),
-        ));
-    }
-    
     // Remove trn:// prefix
-    let path = &url[6..];
+    let path = match url.strip_prefix("trn://") {
+        Some(path) => path,
+        None => {
+            return Err(TrnError::format(
+                "URL must start with trn://".to_string(),
+                Some(url.to_string()),
+            ));
+        }
+    };
+
+    if let Some(cached) = URL_PARSE_CACHE.get(url) {
+        return Ok(cached.value().clone());
+    }
     
     // Remove trailing slash if present
     let path = path.strip_suffix('/').unwrap_or(path);
     
-    // Split path components - expect exactly 5 for simplified structure
-    let path_parts: Vec<&str> = path.split('/').collect();
-    
-    if path_parts.len() != 5 {
+    // Decode each component straight into the TRN string in a single pass:
+    // trn:platform:scope:resource_type:resource_id:version
+    // Segments past the fifth are only counted, and a bad component count is
+    // reported ahead of any decoding failure.
+    let mut trn_str = String::with_capacity(TRN_PREFIX.len() + path.len() + 1);
+    trn_str.push_str(TRN_PREFIX);
+    let mut part_count = 0;
+    let mut decode_error = None;
+    for part in path.split('/') {
+        part_count += 1;
+        if part_count > 5 || decode_error.is_some() {
+            continue;
+        }
+        match percent_decode_str(part).decode_utf8() {
+            Ok(decoded) => {
+                trn_str.push(TRN_SEPARATOR);
+                trn_str.push_str(&decoded);
+            }
+            Err(e) => decode_error = Some(e),
+        }
+    }
+
+    // Expect exactly 5 path components for simplified structure
+    if part_count != 5 {
         return Err(TrnError::format(
             format!(
                 "TRN URL requires exactly 5 path components (platform/scope/resource_type/resource_id/version), found {}",
-                path_parts.len()
+                part_count
             ),
             Some(url.to_string()),
         ));
     }
-    
-    // Decode URL components and build TRN string with simplified structure
-    let decoded_parts: Result<Vec<String>, _> = path_parts
-        .iter()
-        .map(|part| percent_decode_str(part).decode_utf8().map(|s| s.to_string()))
-        .collect();
-    
-    let decoded_parts = decoded_parts.map_err(|e| TrnError::format(
-        format!("Failed to decode URL components: {}", e),
-        Some(url.to_string()),
-    ))?;
-    
-    // Build TRN string with simplified structure: trn:platform:scope:resource_type:resource_id:version
-    let trn_str = format!("trn:{}", decoded_parts.join(":"));
-    
-    parse_trn(&trn_str)
+
+    if let Some(e) = decode_error {
+        return Err(TrnError::format(
+            format!("Failed to decode URL components: {}", e),
+            Some(url.to_string()),
+        ));
+    }
+
+    let trn = parse_trn(&trn_str)?;
+    insert_bounded(&URL_PARSE_CACHE, PARSE_CACHE_SIZE, url.to_string(), trn.clone());
+    Ok(trn)
 }
 
 /// Analyze why TRN parsing failed
@@ -401,6 +473,8 @@ mod tests {
         let trn_str = "TRN:USER:ALICE:TOOL:MYAPI:V1.0";
         let normalized = normalize_trn(trn_str).unwrap();
         assert_eq!(normalized, "trn:user:alice:tool:myapi:v1.0");
+
+        assert!(normalize_trn("trn:user:alice:tool:my$api:v1.0").is_err());
     }
 
     #[test]
@@ -420,6 +494,93 @@ mod tests {
         assert_eq!(trn.resource_type(), "tool");
         assert_eq!(trn.resource_id(), "myapi");
         assert_eq!(trn.version(), "v1.0");
+
+        // Repeated URLs are served from the cache with the same result
+        assert_eq!(parse_trn_from_url(url).unwrap(), trn);
+        assert!(parse_trn_from_url("trn://user/alice/tool/myapi").is_err());
+
+        // Component count is reported before decoding failures
+        let err = parse_trn_from_url("trn://user/alice/tool/my%FFapi/v1.0/extra").unwrap_err();
+        assert!(err.to_string().contains("found 6"));
+        let err = parse_trn_from_url("trn://user/alice/tool/my%FFapi/v1.0").unwrap_err();
+        assert!(err.to_string().contains("decode"));
+    }
+
+    #[test]
+    fn test_split_reports_structural_errors() {
+        let err = parse_trn_components("trn:user::tool:myapi:v1.0").unwrap_err();
+        assert!(matches!(err, TrnError::Component { ref component, .. } if component == "scope"));
+
+        let err = parse_trn_components("trn:user:alice:tool:myapi:v1.0:extra").unwrap_err();
+        assert!(err.to_string().contains("found 7"));
+    }
+
+    #[test]
+    fn test_overlong_trn_reports_length() {
+        let input = format!("trn:user:alice:tool:{}:v1.0", "a".repeat(TRN_MAX_LENGTH));
+        let err = parse_trn(&input).unwrap_err();
+        assert!(matches!(err, TrnError::Length { max_length, .. } if max_length == TRN_MAX_LENGTH));
+    }
+
+    #[test]
+    fn test_parse_multiple_trns_trims_lines() {
+        let results = parse_multiple_trns("  trn:user:alice:tool:myapi:v1.0\n\n   \ntrn:user:bob:tool:other:v2.0  ");
+        assert_eq!(results.len(), 2);
+        assert_eq!(results[1].as_ref().unwrap().scope(), "bob");
+    }
+
+    #[test]
+    fn test_parse_cache_returns_equal_trn() {
+        let trn_str = "trn:user:cached:tool:myapi:v1.0";
+        let first = parse_trn(trn_str).unwrap();
+        let second = parse_trn(trn_str).unwrap();
+        assert_eq!(first, second);
+
+        clear_parse_cache();
+        assert_eq!(parse_trn(trn_str).unwrap(), first);
+    }
+
+    #[test]
+    fn test_scan_trn_agrees_with_regex() {
+        let cases = [
+            "trn:user:alice:tool:myapi:v1.0",
+            "trn:USER:alice:tool:myapi:v1.0",
+            "trn:aa:b:tool:d:e",
+            "trn:user:alice_1:custom-type:my.api:2.0-beta",
+            "trn:u:alice:tool:myapi:v1.0",
+            "trn:1user:alice:tool:myapi:v1.0",
+            "trn:user:_alice:tool:myapi:v1.0",
+            "trn:user:alice:t:myapi:v1.0",
+            "trn:user:alice:tool:-myapi:v1.0",
+            "trn:user:alice:tool:myapi:v1_0",
+            "trn:user:alice:tool:测试:v1.0",
+            "trn:user::tool:myapi:v1.0",
+            "trn:user:alice:tool:myapi",
+            "trn:user:alice:tool:myapi:v1.0:extra",
+            "TRN:user:alice:tool:myapi:v1.0",
+            "trn:user:alice:tool:myapi:",
+            "trn:user:alice:tool:myapi:v1.0:",
+            "trn:",
+            "",
+        ];
+
+        let long_platform = format!("trn:{}:alice:tool:myapi:v1.0", "p".repeat(PLATFORM_MAX_LENGTH));
+        let too_long_platform = format!("trn:{}:alice:tool:myapi:v1.0", "p".repeat(PLATFORM_MAX_LENGTH + 1));
+        let long_id = format!("trn:user:alice:tool:{}:v1.0", "i".repeat(RESOURCE_ID_MAX_LENGTH));
+        let too_long_id = format!("trn:user:alice:tool:{}:v1.0", "i".repeat(RESOURCE_ID_MAX_LENGTH + 1));
+        let cases = cases
+            .iter()
+            .copied()
+            .chain([
+                long_platform.as_str(),
+                too_long_platform.as_str(),
+                long_id.as_str(),
+                too_long_id.as_str(),
+            ]);
+
+        for case in cases {
+            assert_eq!(scan_trn(case).is_some(), TRN_REGEX.is_match(case), "{}", case);
+        }
     }
 
     #[test]
@@ -427,5 +588,45 @@ mod tests {
         let trn_str = "trn:user:alice:tool:myapi:v1.0";
         let base = extract_base_trn(trn_str).unwrap();
         assert_eq!(base, "trn:user:alice:tool:myapi:*");
+        assert_eq!(base, parse_trn(trn_str).unwrap().base_trn().to_string());
+        assert!(extract_base_trn("trn:user:alice").is_err());
+    }
+
+    #[test]
+    fn test_url_parse_does_not_leak_into_parse_trn() {
+        let url = "trn://user/alice/tool/myapi/v1.0";
+        assert!(parse_trn(url).is_err());
+
+        let trn = Trn::from_url(url).unwrap();
+        assert_eq!(trn.as_str(), "trn:user:alice:tool:myapi:v1.0");
+
+        // The cached URL parse must not make the URL a valid TRN string
+        assert!(parse_trn(url).is_err());
+        assert!(try_parse_trn(url).is_none());
+        assert!(normalize_trn(url).is_err());
+        assert!(extract_base_trn(url).is_err());
+        assert_eq!(Trn::from_url(url).unwrap(), trn);
+    }
+
+    #[test]
+    fn test_try_parse_trn_agrees_with_parse_trn() {
+        for input in [
+            "trn:user:alice:tool:myapi:v1.0",
+            "trn:user:alice:tool:myapi",
+            "trn:user:null:tool:myapi:v1.0",
+            "trn:user:alice:unknown-type:myapi:v1.0",
+            "not a trn",
+        ] {
+            assert_eq!(try_parse_trn(input), parse_trn(input).ok(), "{}", input);
+        }
+    }
+
+    #[test]
+    fn test_parse_base_trn() {
+        let base = parse_base_trn("trn:user:alice:tool:myapi:v1.0").unwrap();
+        assert_eq!(base.as_str(), "trn:user:alice:tool:myapi:*");
+        assert_eq!(base.version(), "*");
+        assert_eq!(base.resource_id(), "myapi");
+        assert!(parse_base_trn("trn:user:alice").is_err());
     }
 } 
\ No newline at end of file
@@ -3,43 +3,80 @@
 //! This module provides pattern matching capabilities for TRN strings,
 //! including wildcard matching, filtering, and advanced pattern operations.
 
-use regex::Regex;
-use std::collections::HashMap;
+use dashmap::DashMap;
+use once_cell::sync::Lazy;
+use regex::{bytes, Regex, RegexBuilder};
+use std::collections::{HashMap, HashSet};
+use std::sync::Arc;
 
+use crate::cache::insert_bounded;
 use crate::constants::*;
 use crate::error::{TrnError, TrnResult};
+use crate::types::Trn;
+use crate::utils::count_occurrence;
+
+/// Compiled pattern regexes keyed by the original pattern string
+///
+/// Entries are shared rather than cloned: a cloned `Regex` starts with an
+/// empty match cache, so every call would rebuild its lazy DFA state.
+static PATTERN_CACHE: Lazy<DashMap<String, Arc<bytes::Regex>>> = Lazy::new(DashMap::new);
+
+/// Compiled single-segment regexes (e.g. `v1.*`) keyed by segment text
+///
+/// Index lookups compile their glob segments on every call; repeated queries
+/// such as version globs reuse the shared regex instead of recompiling it.
+static SEGMENT_CACHE: Lazy<DashMap<String, Arc<Regex>>> = Lazy::new(DashMap::new);
 
 /// Pattern matcher for TRN strings
+///
+/// All patterns are also compiled into a single [`bytes::RegexSet`], so
+/// checking a TRN against many patterns scans it once instead of once per
+/// pattern. When no pattern has a wildcard (e.g. exact ACL entries), a
+/// matcher checks set membership instead and never runs the regexes.
 #[derive(Debug, Clone)]
 pub struct TrnMatcher {
     patterns: Vec<CompiledPattern>,
+    set: bytes::RegexSet,
+    literals: Option<HashSet<String>>,
+    match_cache: Option<MatchCache>,
+}
+
+/// Bounded memo of match results keyed by TRN string
+#[derive(Debug, Clone)]
+struct MatchCache {
+    results: DashMap<String, bool>,
+    capacity: usize,
 }
 
 /// Compiled pattern for efficient matching
 #[derive(Debug, Clone)]
 struct CompiledPattern {
     original: String,
-    regex: Regex,
+    regex: bytes::Regex,
     #[allow(dead_code)]
     components: PatternComponents,
 }
 
-/// Pattern components with wildcards
+/// Pattern components with wildcards, in TRN order (`None` matches any value)
 #[derive(Debug, Clone)]
 struct PatternComponents {
-    platform: Option<String>,
-    scope: Option<String>,
-    resource_type: Option<String>,
-    resource_id: Option<String>,
-    version: Option<String>,
+    values: [Option<String>; 5],
+}
+
+impl PatternComponents {
+    fn platform(&self) -> Option<&str> {
+        self.values[0].as_deref()
+    }
+
+    fn resource_type(&self) -> Option<&str> {
+        self.values[2].as_deref()
+    }
 }
 
 impl TrnMatcher {
     /// Create a new TRN matcher with a pattern
     pub fn new(pattern: &str) -> TrnResult<Self> {
-        let mut matcher = Self {
-            patterns: Vec::new(),
-        };
+        let mut matcher = Self::empty();
         matcher.add_pattern(pattern)?;
         Ok(matcher)
     }
@@ -48,30 +85,118 @@ impl TrnMatcher {
     pub fn empty() -> Self {
         Self {
             patterns: Vec::new(),
+            set: bytes::RegexSet::empty(),
+            literals: Some(HashSet::new()),
+            match_cache: None,
         }
     }
 
+    /// Remember up to `capacity` match results, keyed by TRN string
+    ///
+    /// Useful when the same TRNs are matched repeatedly, e.g. when filtering
+    /// overlapping collections. A capacity of zero disables the cache. The
+    /// cache is cleared whenever the pattern list changes.
+    pub fn with_match_cache(mut self, capacity: usize) -> Self {
+        self.match_cache = if capacity == 0 {
+            None
+        } else {
+            Some(MatchCache {
+                results: DashMap::new(),
+                capacity,
+            })
+        };
+        self
+    }
+
     /// Create a new TRN matcher with a pattern
     pub fn with_pattern(pattern: &str) -> TrnResult<Self> {
         Self::new(pattern)
     }
 
+    /// Create a TRN matcher from several patterns
+    ///
+    /// Equivalent to calling [`add_pattern`](Self::add_pattern) for each
+    /// pattern, but the combined pattern set is compiled once rather than
+    /// once per added pattern.
+    pub fn with_patterns<I, S>(patterns: I) -> TrnResult<Self>
+    where
+        I: IntoIterator<Item = S>,
+        S: AsRef<str>,
+    {
+        let patterns = patterns
+            .into_iter()
+            .map(|pattern| compile_pattern(pattern.as_ref()))
+            .collect::<TrnResult<Vec<_>>>()?;
+        let set = build_pattern_set(&patterns).map_err(|e| TrnError::pattern(
+            format!("Failed to compile pattern set: {}", e),
+            patterns
+                .iter()
+                .map(|pattern| pattern.original.as_str())
+                .collect::<Vec<_>>()
+                .join(", "),
+        ))?;
+
+        Ok(Self {
+            literals: literal_patterns(&patterns),
+            patterns,
+            set,
+            match_cache: None,
+        })
+    }
+
     /// Add a pattern to the matcher
     pub fn add_pattern(&mut self, pattern: &str) -> TrnResult<()> {
         let compiled = compile_pattern(pattern)?;
+        let set = build_pattern_set(self.patterns.iter().chain(std::iter::once(&compiled)))
+            .map_err(|e| TrnError::pattern(
+                format!("Failed to compile pattern set: {}", e),
+                pattern.to_string(),
+            ))?;
+
         self.patterns.push(compiled);
+        self.set = set;
+        self.literals = literal_patterns(&self.patterns);
+        self.clear_match_cache();
         Ok(())
     }
 
     /// Check if a TRN matches any pattern
     pub fn matches(&self, trn: &str) -> bool {
-        self.patterns.iter().any(|pattern| pattern.regex.is_match(trn))
+        let cache = match &self.match_cache {
+            Some(cache) => cache,
+            None => return self.matches_uncached(trn),
+        };
+
+        if let Some(matched) = cache.results.get(trn) {
+            return *matched;
+        }
+
+        let matched = self.matches_uncached(trn);
+
+        insert_bounded(&cache.results, cache.capacity, trn.to_string(), matched);
+        matched
+    }
+
+    /// Check a TRN against the patterns, bypassing the match cache
+    #[inline]
+    fn matches_uncached(&self, trn: &str) -> bool {
+        match &self.literals {
+            Some(literals) => literals.contains(trn),
+            None => self.set.is_match(trn.as_bytes()),
+        }
+    }
+
+    /// Drop memoized match results
+    fn clear_match_cache(&self) {
+        if let Some(cache) = &self.match_cache {
+            cache.results.clear();
+        }
     }
 
     /// Check if a TRN matches a specific pattern by index
     pub fn matches_pattern(&self, trn: &str, pattern_index: usize) -> bool {
         if let Some(pattern) = self.patterns.get(pattern_index) {
-            pattern.regex.is_match(trn)
+            pattern.regex.is_match(trn.as_bytes())
         } else {
             false
         }
@@ -79,13 +204,21 @@ impl TrnMatcher {
 
     /// Get all patterns that match a TRN
     pub fn matching_patterns(&self, trn: &str) -> Vec<&str> {
-        self.patterns
-            .iter()
-            .filter(|pattern| pattern.regex.is_match(trn))
-            .map(|pattern| pattern.original.as_str())
+        self.set
+            .matches(trn.as_bytes())
+            .into_iter()
+            .map(|index| self.patterns[index].original.as_str())
             .collect()
     }
 
+    /// Collect every TRN that matches any pattern
+    pub fn matches_many<'a, I>(&self, trns: I) -> Vec<&'a str>
+    where
+        I: IntoIterator<Item = &'a str>,
+    {
+        trns.into_iter().filter(|trn| self.matches(trn)).collect()
+    }
+
     /// Filter TRNs by patterns
     pub fn filter_trns<'a>(&self, trns: &'a [String]) -> Vec<&'a String> {
         trns.iter()
@@ -101,9 +234,30 @@ impl TrnMatcher {
     /// Clear all patterns
     pub fn clear(&mut self) {
         self.patterns.clear();
+        self.set = bytes::RegexSet::empty();
+        self.literals = Some(HashSet::new());
+        self.clear_match_cache();
     }
 }
 
+/// Compile the regexes of `patterns` into a single byte-level set
+fn build_pattern_set<'a, I>(patterns: I) -> Result<bytes::RegexSet, regex::Error>
+where
+    I: IntoIterator<Item = &'a CompiledPattern>,
+{
+    bytes::RegexSetBuilder::new(patterns.into_iter().map(|pattern| pattern.regex.as_str()))
+        .unicode(false)
+        .build()
+}
+
+/// Collect the original patterns when every one of them is a literal TRN
+fn literal_patterns(patterns: &[CompiledPattern]) -> Option<HashSet<String>> {
+    patterns
+        .iter()
+        .map(|pattern| is_literal_pattern(&pattern.original).then(|| pattern.original.clone()))
+        .collect()
+}
+
 impl Default for TrnMatcher {
     fn default() -> Self {
         Self::empty()
@@ -112,24 +266,186 @@ impl Default for TrnMatcher {
 
 /// Check if a TRN matches a pattern
 pub fn matches_pattern(trn: &str, pattern: &str) -> bool {
-    match compile_pattern(pattern) {
-        Ok(compiled) => compiled.regex.is_match(trn),
+    if is_literal_pattern(pattern) {
+        return trn == pattern;
+    }
+
+    if let Some(segments) = SegmentPattern::parse(pattern) {
+        return segments.matches(trn);
+    }
+
+    match cached_pattern_regex(pattern) {
+        Ok(regex) => regex.is_match(trn.as_bytes()),
         Err(_) => false,
     }
 }
 
 /// Find TRNs matching a pattern
 pub fn find_matching_trns<'a>(trns: &'a [String], pattern: &str) -> Vec<&'a String> {
-    match compile_pattern(pattern) {
-        Ok(compiled) => trns
+    if is_literal_pattern(pattern) {
+        return trns.iter().filter(|trn| *trn == pattern).collect();
+    }
+
+    if let Some(segments) = SegmentPattern::parse(pattern) {
+        return trns.iter().filter(|trn| segments.matches(trn)).collect();
+    }
+
+    match cached_pattern_regex(pattern) {
+        Ok(regex) => trns
             .iter()
-            .filter(|trn| compiled.regex.is_match(trn))
+            .filter(|trn| regex.is_match(trn.as_bytes()))
             .collect(),
         Err(_) => Vec::new(),
     }
 }
 
+/// Check whether a pattern can only match the identical string
+///
+/// A well-formed pattern with no wildcard or empty components compiles to an
+/// anchored regex of escaped literals, so plain string equality is equivalent
+/// and skips the regex cache entirely.
+///
+/// The wildcard, separator-count and empty-component checks share one pass
+/// over the bytes instead of scanning the pattern three times.
+fn is_literal_pattern(pattern: &str) -> bool {
+    let body = match pattern.strip_prefix("trn:") {
+        Some(body) => body,
+        None => return false,
+    };
+
+    let mut separators = 0;
+    let mut component_len = 0;
+    for &byte in body.as_bytes() {
+        match byte {
+            b'*' => return false,
+            b if b == TRN_SEPARATOR as u8 => {
+                if component_len == 0 {
+                    return false;
+                }
+                separators += 1;
+                component_len = 0;
+            }
+            _ => component_len += 1,
+        }
+    }
+
+    // The body holds every component but the `trn` prefix
+    separators == TRN_FIXED_COMPONENT_COUNT - 2 && component_len > 0
+}
+
+/// Positional matcher for patterns whose components need no regex
+///
+/// Covers patterns where every component is a literal, a bare `*` (or
+/// empty), `prefix*` or `*suffix` — the common TRN shapes, with runs of `*`
+/// counting as one wildcard, as in the regex. Each component is
+/// then checked in place with equality, prefix/suffix tests or the byte
+/// grammar, accepting exactly what the compiled regex would.
+struct SegmentPattern<'p> {
+    segments: [Segment<'p>; 5],
+}
+
+/// Check applied to one component by [`SegmentPattern`]
+#[derive(Clone, Copy)]
+enum Segment<'p> {
+    /// Any value allowed by the component's grammar
+    Any(ComponentCharset),
+    /// Exactly this value
+    Exact(&'p str),
+    /// This prefix followed by anything except `@`
+    Prefix(&'p str),
+    /// Anything except `@` followed by this suffix
+    Suffix(&'p str),
+}
+
+impl<'p> SegmentPattern<'p> {
+    /// Decompose `pattern`, or `None` if it needs the regex matcher
+    fn parse(pattern: &'p str) -> Option<Self> {
+        let mut parts = pattern.split(TRN_SEPARATOR);
+        if parts.next() != Some("trn") {
+            return None;
+        }
+
+        let mut segments = [Segment::Any(COMPONENT_CHARSETS[0]); 5];
+        for (index, slot) in segments.iter_mut().enumerate() {
+            let part = parts.next()?;
+            let prefix = part.trim_end_matches('*');
+            let suffix = part.trim_start_matches('*');
+            *slot = if part.is_empty() || part == "*" {
+                Segment::Any(COMPONENT_CHARSETS[index])
+            } else if !part.contains('*') {
+                Segment::Exact(part)
+            } else if !prefix.contains('*') {
+                Segment::Prefix(prefix)
+            } else if !suffix.contains('*') {
+                Segment::Suffix(suffix)
+            } else {
+                return None;
+            };
+        }
+
+        if parts.next().is_some() {
+            return None;
+        }
+
+        Some(Self { segments })
+    }
+
+    /// Check a TRN string against every component
+    fn matches(&self, trn: &str) -> bool {
+        let mut parts = trn.split(TRN_SEPARATOR);
+        if parts.next() != Some("trn") {
+            return false;
+        }
+
+        for segment in &self.segments {
+            let part = match parts.next() {
+                Some(part) => part,
+                None => return false,
+            };
+            let matched = match *segment {
+                Segment::Any(charset) => charset.matches(part),
+                Segment::Exact(value) => part == value,
+                Segment::Prefix(prefix) => part
+                    .strip_prefix(prefix)
+                    .map_or(false, |rest| !rest.contains('@')),
+                Segment::Suffix(suffix) => part
+                    .strip_suffix(suffix)
+                    .map_or(false, |rest| !rest.contains('@')),
+            };
+            if !matched {
+                return false;
+            }
+        }
+
+        parts.next().is_none()
+    }
+}
+
+/// Get the compiled regex for a pattern, compiling it at most once
+fn cached_pattern_regex(pattern: &str) -> TrnResult<Arc<bytes::Regex>> {
+    if let Some(regex) = PATTERN_CACHE.get(pattern) {
+        return Ok(Arc::clone(regex.value()));
+    }
+
+    let regex = Arc::new(compile_pattern(pattern)?.regex);
+
+    insert_bounded(&PATTERN_CACHE, PATTERN_CACHE_SIZE, pattern.to_string(), Arc::clone(&regex));
+    Ok(regex)
+}
+
+/// Clear the compiled pattern cache
+pub(crate) fn clear_pattern_cache() {
+    PATTERN_CACHE.clear();
+    SEGMENT_CACHE.clear();
+}
+
 /// Compile a pattern into a regex
+///
+/// Patterns are matched as bytes with Unicode classes disabled. The only
+/// class that could see non-ASCII input is the in-component wildcard
+/// `[^:@]`, and since `:` and `@` never occur inside a multi-byte UTF-8
+/// sequence it accepts exactly the same strings byte-wise, while the
+/// automaton stays a plain byte DFA with no UTF-8 decoding states.
 fn compile_pattern(pattern: &str) -> TrnResult<CompiledPattern> {
     // Parse pattern components
     let components = parse_pattern_components(pattern)?;
@@ -138,7 +454,10 @@ fn compile_pattern(pattern: &str) -> TrnResult<CompiledPattern> {
     let regex_pattern = build_regex_pattern(&components)?;
     
     // Compile regex
-    let regex = Regex::new(&regex_pattern)
+    let regex = bytes::RegexBuilder::new(&regex_pattern)
+        .unicode(false)
+        .size_limit(PATTERN_REGEX_SIZE_LIMIT)
+        .build()
         .map_err(|e| TrnError::pattern(
             format!("Failed to compile pattern regex: {}", e),
             pattern.to_string(),
@@ -160,9 +479,17 @@ fn parse_pattern_components(pattern: &str) -> TrnResult<PatternComponents> {
         ));
     }
     
-    let parts: Vec<&str> = pattern.split(':').collect();
+    // Fill the fixed layout positionally, counting any surplus parts
+    let mut parts = [""; TRN_FIXED_COMPONENT_COUNT];
+    let mut count = 0;
+    for part in pattern.split(TRN_SEPARATOR) {
+        if let Some(slot) = parts.get_mut(count) {
+            *slot = part;
+        }
+        count += 1;
+    }
     
-    if parts.len() != 6 {
+    if count != TRN_FIXED_COMPONENT_COUNT {
         return Err(TrnError::pattern(
             "Pattern must have exactly 6 components (trn:platform:scope:resource_type:resource_id:version)",
             pattern,
@@ -179,11 +506,7 @@ fn parse_pattern_components(pattern: &str) -> TrnResult<PatternComponents> {
     };
     
     let components = PatternComponents {
-        platform: to_pattern(parts[1]),
-        scope: to_pattern(parts[2]),
-        resource_type: to_pattern(parts[3]),
-        resource_id: to_pattern(parts[4]),
-        version: to_pattern(parts[5]),
+        values: std::array::from_fn(|index| to_pattern(parts[index + 1])),
     };
     
     Ok(components)
@@ -191,45 +514,15 @@ fn parse_pattern_components(pattern: &str) -> TrnResult<PatternComponents> {
 
 /// Build regex pattern from components
 fn build_regex_pattern(components: &PatternComponents) -> TrnResult<String> {
-    let mut pattern = String::from("^trn:");
-    
-    // Platform
-    if let Some(platform) = &components.platform {
-        pattern.push_str(&escape_pattern_component(platform));
-    } else {
-        pattern.push_str(PLATFORM_PATTERN);
-    }
-    
-    // Scope (required in 6-component format)
-    pattern.push(':');
-    if let Some(scope) = &components.scope {
-        pattern.push_str(&escape_pattern_component(scope));
-    } else {
-        pattern.push_str(SCOPE_PATTERN);
-    }
-    
-    // Resource type
-    pattern.push(':');
-    if let Some(resource_type) = &components.resource_type {
-        pattern.push_str(&escape_pattern_component(resource_type));
-    } else {
-        pattern.push_str(RESOURCE_TYPE_PATTERN);
-    }
-    
-    // Resource ID
-    pattern.push(':');
-    if let Some(resource_id) = &components.resource_id {
-        pattern.push_str(&escape_pattern_component(resource_id));
-    } else {
-        pattern.push_str(RESOURCE_ID_PATTERN);
-    }
+    let mut pattern = String::from("^trn");
     
-    // Version
-    pattern.push(':');
-    if let Some(version) = &components.version {
-        pattern.push_str(&escape_pattern_component(version));
-    } else {
-        pattern.push_str(VERSION_PATTERN);
+    // Wildcard components fall back to the component's own grammar
+    for (value, component_pattern) in components.values.iter().zip(COMPONENT_PATTERNS) {
+        pattern.push(':');
+        match value {
+            Some(value) => pattern.push_str(&escape_pattern_component(value)),
+            None => pattern.push_str(component_pattern),
+        }
     }
     
     pattern.push('$');
@@ -238,6 +531,9 @@ fn build_regex_pattern(components: &PatternComponents) -> TrnResult<String> {
 }
 
 /// Escape special regex characters in pattern components
+///
+/// A run of adjacent `*` matches the same strings as a single one, so each
+/// run becomes one `[^:@]*` rather than a chain of equivalent repetitions.
 fn escape_pattern_component(component: &str) -> String {
     // Handle wildcards
     if component == "*" {
@@ -245,14 +541,45 @@ fn escape_pattern_component(component: &str) -> String {
     }
     
     if component.contains('*') {
-        // Replace * with regex pattern
-        let escaped = regex::escape(component);
-        return escaped.replace(r"\*", "[^:@]*");
+        let mut escaped = String::with_capacity(component.len() * 2);
+        let mut after_wildcard = false;
+        for (index, literal) in component.split('*').enumerate() {
+            if index > 0 && !after_wildcard {
+                escaped.push_str("[^:@]*");
+                after_wildcard = true;
+            }
+            if !literal.is_empty() {
+                escaped.push_str(&regex::escape(literal));
+                after_wildcard = false;
+            }
+        }
+        return escaped;
     }
     
     regex::escape(component)
 }
 
+/// Compile a single pattern segment (e.g. `v1.*`) into an anchored regex
+///
+/// Compiled segments are cached, so each distinct segment is compiled once.
+pub(crate) fn compile_segment(segment: &str) -> TrnResult<Arc<Regex>> {
+    if let Some(regex) = SEGMENT_CACHE.get(segment) {
+        return Ok(Arc::clone(regex.value()));
+    }
+
+    let regex = RegexBuilder::new(&format!("^{}$", escape_pattern_component(segment)))
+        .size_limit(PATTERN_REGEX_SIZE_LIMIT)
+        .build()
+        .map(Arc::new)
+        .map_err(|e| TrnError::pattern(
+            format!("Failed to compile pattern segment: {}", e),
+            segment.to_string(),
+        ))?;
+
+    insert_bounded(&SEGMENT_CACHE, PATTERN_CACHE_SIZE, segment.to_string(), Arc::clone(&regex));
+    Ok(regex)
+}
+
 /// Advanced pattern matching with multiple conditions
 #[allow(dead_code)]
 #[derive(Debug, Clone)]
@@ -296,7 +623,7 @@ impl AdvancedMatcher {
     /// Check if a TRN matches all conditions
     pub fn matches(&self, trn: &str) -> bool {
         // Try to parse TRN first
-        let trn_obj = match crate::types::Trn::parse(trn) {
+        let trn_obj = match Trn::parse(trn) {
             Ok(t) => t,
             Err(_) => return false,
         };
@@ -306,10 +633,10 @@ impl AdvancedMatcher {
                 MatchCondition::Exact(pattern) => trn == pattern,
                 MatchCondition::Pattern(pattern) => matches_pattern(trn, pattern),
                 MatchCondition::Platform(platforms) => {
-                    platforms.contains(&trn_obj.platform().to_string())
+                    platforms.iter().any(|platform| platform == trn_obj.platform())
                 }
                 MatchCondition::ResourceType(types) => {
-                    types.contains(&trn_obj.resource_type().to_string())
+                    types.iter().any(|resource_type| resource_type == trn_obj.resource_type())
                 }
                 MatchCondition::VersionRange { min, max } => {
                     let version = trn_obj.version();
@@ -347,17 +674,14 @@ impl Default for AdvancedMatcher {
 
 /// Simple version comparison (basic semantic versioning)
 fn compare_versions(v1: &str, v2: &str, op: &str) -> bool {
-    let parse_version = |v: &str| -> Vec<u32> {
+    fn numeric_parts(v: &str) -> impl Iterator<Item = u32> + '_ {
         v.trim_start_matches('v')
             .split('.')
             .filter_map(|s| s.parse().ok())
-            .collect()
-    };
-    
-    let ver1 = parse_version(v1);
-    let ver2 = parse_version(v2);
-    
-    let cmp = ver1.cmp(&ver2);
+    }
+
+    // Compare lexicographically without collecting the parts
+    let cmp = numeric_parts(v1).cmp(numeric_parts(v2));
     
     match op {
         "==" => cmp == std::cmp::Ordering::Equal,
@@ -401,12 +725,12 @@ pub fn analyze_patterns(patterns: &[String]) -> PatternStats {
         
         // Extract platform and resource type for statistics
         if let Ok(components) = parse_pattern_components(pattern) {
-            if let Some(platform) = &components.platform {
-                *stats.common_platforms.entry(platform.clone()).or_insert(0) += 1;
+            if let Some(platform) = components.platform() {
+                count_occurrence(&mut stats.common_platforms, platform);
             }
             
-            if let Some(resource_type) = &components.resource_type {
-                *stats.common_resource_types.entry(resource_type.clone()).or_insert(0) += 1;
+            if let Some(resource_type) = components.resource_type() {
+                count_occurrence(&mut stats.common_resource_types, resource_type);
             }
         }
     }
@@ -509,6 +833,41 @@ mod tests {
         assert_eq!(all_tools.len(), 4);
     }
 
+    #[test]
+    fn test_cached_pattern_regex_reused() {
+        let pattern = "trn:user:*:tool:*:*";
+        assert!(matches_pattern("trn:user:alice:tool:myapi:v1.0", pattern));
+        assert!(!matches_pattern("trn:org:company:tool:myapi:v1.0", pattern));
+        assert!(PATTERN_CACHE.contains_key(pattern));
+
+        // Lookups share one compiled regex (and its match caches)
+        let first = cached_pattern_regex(pattern).unwrap();
+        let second = cached_pattern_regex(pattern).unwrap();
+        assert!(Arc::ptr_eq(&first, &second));
+    }
+
+    #[test]
+    fn test_compile_segment_reused() {
+        let first = compile_segment("v1.*").unwrap();
+        let second = compile_segment("v1.*").unwrap();
+        assert!(Arc::ptr_eq(&first, &second));
+        assert!(first.is_match("v1.0"));
+        assert!(!first.is_match("v2.0"));
+    }
+
+    #[test]
+    fn test_matcher_matches_many() {
+        let matcher = TrnMatcher::new("trn:user:*:tool:*:*").unwrap();
+        let trns = [
+            "trn:user:alice:tool:myapi:v1.0",
+            "trn:org:company:tool:workflow:latest",
+            "trn:user:bob:tool:slack-api:v1.5",
+        ];
+
+        let matched = matcher.matches_many(trns.iter().copied());
+        assert_eq!(matched, vec!["trn:user:alice:tool:myapi:v1.0", "trn:user:bob:tool:slack-api:v1.5"]);
+    }
+
     #[test]
     fn test_trn_matcher() {
         let mut matcher = TrnMatcher::empty();
@@ -522,6 +881,71 @@ mod tests {
         assert_eq!(matcher.pattern_count(), 2);
     }
 
+    #[test]
+    fn test_literal_matcher_uses_set_membership() {
+        let mut matcher = TrnMatcher::with_patterns([
+            "trn:user:alice:tool:myapi:v1.0",
+            "trn:org:company:tool:workflow:latest",
+        ])
+        .unwrap();
+        assert!(matcher.literals.is_some());
+        assert!(matcher.matches("trn:user:alice:tool:myapi:v1.0"));
+        assert!(!matcher.matches("trn:user:alice:tool:myapi:v1.1"));
+
+        // A wildcard pattern switches the whole matcher back to the regex set
+        matcher.add_pattern("trn:user:*:tool:*:*").unwrap();
+        assert!(matcher.literals.is_none());
+        assert!(matcher.matches("trn:user:alice:tool:myapi:v1.1"));
+        assert!(matcher.matches("trn:org:company:tool:workflow:latest"));
+
+        matcher.clear();
+        assert!(!matcher.matches("trn:user:alice:tool:myapi:v1.0"));
+    }
+
+    #[test]
+    fn test_match_cache_tracks_pattern_changes() {
+        let mut matcher = TrnMatcher::new("trn:user:*:tool:*:*")
+            .unwrap()
+            .with_match_cache(2);
+
+        assert!(matcher.matches("trn:user:alice:tool:myapi:v1.0"));
+        assert!(matcher.matches("trn:user:alice:tool:myapi:v1.0"));
+        assert!(!matcher.matches("trn:org:company:tool:workflow:latest"));
+        assert!(!matcher.matches("trn:org:company:model:bert:v1.0"));
+
+        matcher.add_pattern("trn:org:*:*:*:*").unwrap();
+        assert!(matcher.matches("trn:org:company:tool:workflow:latest"));
+    }
+
+    #[test]
+    fn test_matching_patterns_reports_every_match_in_order() {
+        let mut matcher = TrnMatcher::empty();
+        matcher.add_pattern("trn:user:*:tool:*:*").unwrap();
+        matcher.add_pattern("trn:org:*:tool:*:*").unwrap();
+        matcher.add_pattern("trn:*:*:tool:*:v1.*").unwrap();
+
+        assert_eq!(
+            matcher.matching_patterns("trn:user:alice:tool:myapi:v1.0"),
+            vec!["trn:user:*:tool:*:*", "trn:*:*:tool:*:v1.*"]
+        );
+
+        let batch = TrnMatcher::with_patterns([
+            "trn:user:*:tool:*:*",
+            "trn:org:*:tool:*:*",
+            "trn:*:*:tool:*:v1.*",
+        ])
+        .unwrap();
+        assert_eq!(batch.pattern_count(), 3);
+        assert_eq!(
+            batch.matching_patterns("trn:user:alice:tool:myapi:v1.0"),
+            matcher.matching_patterns("trn:user:alice:tool:myapi:v1.0")
+        );
+        assert!(TrnMatcher::with_patterns(["trn:user:*:tool:*"]).is_err());
+
+        matcher.clear();
+        assert!(!matcher.matches("trn:user:alice:tool:myapi:v1.0"));
+    }
+
     #[test]
     fn test_advanced_matcher() {
         let matcher = AdvancedMatcher::new()
@@ -568,6 +992,108 @@ mod tests {
         assert_eq!(stats.common_platforms.get("user"), Some(&2));
         assert_eq!(stats.common_resource_types.get("tool"), Some(&3));
     }
+
+    #[test]
+    fn test_literal_patterns_match_exactly() {
+        let trn = "trn:user:alice:tool:myapi:v1.0";
+        assert!(is_literal_pattern(trn));
+        assert!(matches_pattern(trn, trn));
+        assert!(!matches_pattern(trn, "trn:user:alice:tool:myapi:v1.1"));
+
+        assert!(!is_literal_pattern("trn:user:alice:tool:myapi:"));
+        assert!(!is_literal_pattern("trn:user:alice:tool:myapi:v1.*"));
+        assert!(!is_literal_pattern("trn:user:alice:tool:myapi:v1.0:extra"));
+        assert!(!is_literal_pattern("trn:user::tool:myapi:v1.0"));
+        assert!(!is_literal_pattern("trn:user:alice:tool:myapi"));
+        assert!(!is_literal_pattern("urn:user:alice:tool:myapi:v1.0"));
+    }
+
+    #[test]
+    fn test_segment_patterns_agree_with_regex() {
+        let patterns = [
+            "trn:user:*:tool:*:*",
+            "trn:user:al*:tool:*:v1.*",
+            "trn:*:*:*:*api:*",
+            "trn:user::tool:myapi:",
+            "trn:user:alice:tool:myapi:v1.0",
+            "trn:user:**:tool:my**:**.0",
+            "trn:**:*:*:***api:*",
+        ];
+        let trns = [
+            "trn:user:alice:tool:myapi:v1.0",
+            "trn:user:al@ice:tool:myapi:v1.0",
+            "trn:user:bob:tool:yourapi:v2.0",
+            "trn:org:company:model:bert:v1.0",
+            "trn:user:alice:tool:myapi",
+            "trn:user:alice:tool:myapi:v1.0:extra",
+            "trn:user:-x:tool:myapi:v1.0",
+            "urn:user:alice:tool:myapi:v1.0",
+        ];
+
+        for pattern in patterns {
+            let segments = SegmentPattern::parse(pattern).expect("simple pattern");
+            let regex = compile_pattern(pattern).unwrap().regex;
+            for trn in trns {
+                assert_eq!(
+                    segments.matches(trn),
+                    regex.is_match(trn.as_bytes()),
+                    "{} against {}",
+                    trn,
+                    pattern
+                );
+            }
+        }
+
+        assert!(SegmentPattern::parse("trn:user:a*b*:tool:*:*").is_none());
+        assert!(SegmentPattern::parse("trn:user:a*b:tool:*:*").is_none());
+        assert!(SegmentPattern::parse("trn:user:*:tool:*").is_none());
+        assert!(SegmentPattern::parse("trn:user:*a*:tool:*:*").is_none());
+    }
+
+    #[test]
+    fn test_wildcard_runs_collapse() {
+        assert_eq!(escape_pattern_component("v1.**"), r"v1\.[^:@]*");
+        assert_eq!(escape_pattern_component("a**b*"), "a[^:@]*b[^:@]*");
+        assert_eq!(escape_pattern_component("**"), "[^:@]*");
+        assert_eq!(escape_pattern_component("*"), "[^:@]+");
+
+        // Regex-only shapes keep their meaning once runs are merged
+        let pattern = "trn:user:a***e:tool:*:*";
+        assert!(SegmentPattern::parse(pattern).is_none());
+        assert!(matches_pattern("trn:user:alice:tool:myapi:v1.0", pattern));
+        assert!(matches_pattern("trn:user:ae:tool:myapi:v1.0", pattern));
+        assert!(!matches_pattern("trn:user:bob:tool:myapi:v1.0", pattern));
+    }
+
+    #[test]
+    fn test_byte_patterns_match_non_ascii_like_str_patterns() {
+        let pattern = "trn:user:al*:tool:my*:v1.0";
+        assert!(matches_pattern("trn:user:alïce:tool:myäpi:v1.0", pattern));
+        assert!(matches_pattern("trn:user:alice:tool:myapi:v1.0", pattern));
+        assert!(!matches_pattern("trn:user:al:ice:tool:myapi:v1.0", pattern));
+        assert!(!matches_pattern("trn:user:al@ice:tool:myapi:v1.0", pattern));
+
+        let matcher = TrnMatcher::new(pattern).unwrap();
+        assert!(matcher.matches("trn:user:alïce:tool:myäpi:v1.0"));
+        assert_eq!(matcher.matching_patterns("trn:user:alïce:tool:myapi:v1.0"), vec![pattern]);
+    }
+
+    #[test]
+    fn test_validate_pattern() {
+        assert!(validate_pattern("trn:user:*:tool:*:*").is_ok());
+        assert!(validate_pattern("trn:*:alice:tool:myapi:v1.0").is_ok());
+        assert!(validate_pattern("trn:unknown:*:tool:*:*").is_err());
+        assert!(validate_pattern("trn:user:*:tool:*").is_err());
+    }
+
+    #[test]
+    fn test_filter_version_pattern() {
+        let trn = Trn::parse("trn:user:alice:tool:myapi:v1.0").unwrap();
+        assert!(TrnFilter::new().version_pattern(r"^v1\.").matches(&trn));
+        assert!(!TrnFilter::new().version_pattern(r"^v2\.").matches(&trn));
+        // Invalid regexes fall back to a literal match
+        assert!(!TrnFilter::new().version_pattern("v1.0(").matches(&trn));
+    }
 } 
 
 /// Validate a pattern string
@@ -578,13 +1104,13 @@ pub fn validate_pattern(pattern: &str) -> TrnResult<()> {
         return Err(TrnError::format("Pattern must start with 'trn:'", Some(pattern.to_string())));
     }
     
-    let parts: Vec<&str> = pattern.split(':').collect();
-    if parts.len() != 6 {
+    // Count separators and locate the platform without collecting the parts
+    if pattern.matches(':').count() != 5 {
         return Err(TrnError::format("Pattern must have exactly 6 components", Some(pattern.to_string())));
     }
     
     // Validate platform
-    let platform = parts[1];
+    let platform = pattern.split(':').nth(1).unwrap_or_default();
     if platform != "*" && !["user", "org", "aiplatform"].contains(&platform) {
         return Err(TrnError::format("Invalid platform in pattern", Some(pattern.to_string())));
     }
@@ -601,7 +1127,8 @@ pub struct TrnFilter {
     resource_type: Option<String>,
     scope: Option<String>,
     tool_type: Option<String>,
-    version_pattern: Option<String>,
+    /// Compiled once when set, so `matches` never rebuilds it
+    version_regex: Option<Regex>,
 }
 
 #[allow(dead_code)]
@@ -613,7 +1140,7 @@ impl TrnFilter {
             resource_type: None,
             scope: None,
             tool_type: None,
-            version_pattern: None,
+            version_regex: None,
         }
     }
     
@@ -642,13 +1169,17 @@ impl TrnFilter {
     }
     
     /// Filter by version pattern
+    ///
+    /// The pattern is a regex; if it does not compile it is matched literally.
     pub fn version_pattern(mut self, pattern: &str) -> Self {
-        self.version_pattern = Some(pattern.to_string());
+        let regex = Regex::new(pattern)
+            .unwrap_or_else(|_| Regex::new(&regex::escape(pattern)).unwrap());
+        self.version_regex = Some(regex);
         self
     }
     
     /// Apply filter to a TRN
-    pub fn matches(&self, trn: &crate::types::Trn) -> bool {
+    pub fn matches(&self, trn: &Trn) -> bool {
         if let Some(ref platform) = self.platform {
             if trn.platform() != platform {
                 return false;
@@ -667,10 +1198,7 @@ impl TrnFilter {
             }
         }
         
-        if let Some(ref version_pattern) = self.version_pattern {
-            let version_regex = regex::Regex::new(version_pattern).unwrap_or_else(|_| {
-                regex::Regex::new(&regex::escape(version_pattern)).unwrap()
-            });
+        if let Some(ref version_regex) = self.version_regex {
             if !version_regex.is_match(trn.version()) {
                 return false;
             }
@@ -5,9 +5,15 @@
 
 use crate::constants::*;
 use crate::error::{TrnError, TrnResult};
+use crate::parsing::{parse_trn, scan_trn};
+use crate::pattern::matches_pattern;
+use crate::url::{trn_to_http_url, trn_to_url, url_to_trn};
+use crate::validation::{validate_scanned, validate_trn_struct};
 use serde::{Deserialize, Serialize};
 use std::fmt;
+use std::hash::{Hash, Hasher};
 use std::str::FromStr;
+use std::sync::Arc;
 
 /// Platform types that are supported
 #[derive(Debug, Clone, PartialEq, Eq, Hash, Serialize, Deserialize)]
@@ -30,16 +36,24 @@ impl Platform {
             Platform::Custom(name) => !name.is_empty() && name.len() <= PLATFORM_MAX_LENGTH,
         }
     }
+
+    /// Get the platform's component value
+    ///
+    /// Built-in platforms map to static strings, so comparing a TRN's
+    /// platform against one never allocates.
+    pub fn as_str(&self) -> &str {
+        match self {
+            Platform::User => "user",
+            Platform::Org => "org",
+            Platform::AiPlatform => "aiplatform",
+            Platform::Custom(name) => name,
+        }
+    }
 }
 
 impl fmt::Display for Platform {
     fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
-        match self {
-            Platform::User => write!(f, "user"),
-            Platform::Org => write!(f, "org"),
-            Platform::AiPlatform => write!(f, "aiplatform"),
-            Platform::Custom(name) => write!(f, "{}", name),
-        }
+        f.write_str(self.as_str())
     }
 }
 
@@ -89,17 +103,22 @@ impl ResourceType {
             ResourceType::Custom(name) => !name.is_empty() && name.len() <= RESOURCE_TYPE_MAX_LENGTH,
         }
     }
+
+    /// Get the resource type's component value
+    pub fn as_str(&self) -> &str {
+        match self {
+            ResourceType::Tool => "tool",
+            ResourceType::Model => "model",
+            ResourceType::Dataset => "dataset",
+            ResourceType::Pipeline => "pipeline",
+            ResourceType::Custom(name) => name,
+        }
+    }
 }
 
 impl fmt::Display for ResourceType {
     fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
-        match self {
-            ResourceType::Tool => write!(f, "tool"),
-            ResourceType::Model => write!(f, "model"),
-            ResourceType::Dataset => write!(f, "dataset"),
-            ResourceType::Pipeline => write!(f, "pipeline"),
-            ResourceType::Custom(name) => write!(f, "{}", name),
-        }
+        f.write_str(self.as_str())
     }
 }
 
@@ -128,7 +147,13 @@ impl FromStr for ResourceType {
 }
 
 /// TRN components structure for zero-copy parsing
-#[derive(Debug, Clone, PartialEq, Eq)]
+///
+/// This is also the borrowed view of a [`Trn`]: it serializes to the same
+/// field layout, so a TRN's components can be written out without copying
+/// them into owned strings. It also hashes and compares field by field, so
+/// borrowed views can key sets and maps without building a [`Trn`] first.
+#[derive(Debug, Clone, PartialEq, Eq, Hash, Serialize)]
+#[serde(rename = "Trn")]
 pub struct TrnComponents<'a> {
     /// Platform identifier
     pub platform: &'a str,
@@ -162,55 +187,172 @@ impl<'a> TrnComponents<'a> {
 
     /// Convert to owned TRN
     pub fn to_owned(&self) -> Trn {
-        Trn {
-            platform: self.platform.to_string(),
-            scope: self.scope.to_string(),
-            resource_type: self.resource_type.to_string(),
-            resource_id: self.resource_id.to_string(),
-            version: self.version.to_string(),
-        }
+        Trn::from_parts(
+            self.platform,
+            self.scope,
+            self.resource_type,
+            self.resource_id,
+            self.version,
+        )
     }
 }
 
+/// Byte offset of the platform component in the canonical string
+const COMPONENTS_START: usize = TRN_PREFIX.len() + 1;
+
 /// Main TRN structure (owned variant)
-#[derive(Debug, Clone, PartialEq, Eq, Hash, Serialize, Deserialize)]
+///
+/// The canonical `trn:platform:scope:resource_type:resource_id:version`
+/// string is built once at construction and stored in a single shared
+/// buffer; components are borrowed slices of it. Clones share the buffer
+/// (so handing out cached or filtered TRNs does not copy strings), and the
+/// setters build a new buffer rather than mutating a shared one.
+#[derive(Clone, Deserialize)]
+#[serde(from = "TrnFields")]
 pub struct Trn {
-    /// Platform identifier
+    /// Canonical TRN string, shared between clones
+    repr: Arc<str>,
+    /// End offsets of platform, scope, resource type, resource ID and version in `repr`
+    ends: [u32; 5],
+}
+
+/// Serialized layout of [`Trn`], one field per component
+#[derive(Deserialize)]
+#[serde(rename = "Trn")]
+struct TrnFields {
     platform: String,
-    /// Scope identifier (required)
     scope: String,
-    /// Resource type
     resource_type: String,
-    /// Resource identifier
     resource_id: String,
-    /// Version identifier
     version: String,
 }
 
+impl From<TrnFields> for Trn {
+    fn from(fields: TrnFields) -> Self {
+        Self::from_parts(
+            &fields.platform,
+            &fields.scope,
+            &fields.resource_type,
+            &fields.resource_id,
+            &fields.version,
+        )
+    }
+}
+
+impl Serialize for Trn {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        // Write the components straight from the buffer, without owned copies
+        self.components().serialize(serializer)
+    }
+}
+
+impl PartialEq for Trn {
+    fn eq(&self, other: &Self) -> bool {
+        self.shares_buffer(other)
+            || (self.ends == other.ends && self.repr == other.repr)
+    }
+}
+
+impl Eq for Trn {}
+
+impl Hash for Trn {
+    fn hash<H: Hasher>(&self, state: &mut H) {
+        self.repr.hash(state);
+    }
+}
+
+impl fmt::Debug for Trn {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        f.debug_struct("Trn")
+            .field("platform", &self.platform())
+            .field("scope", &self.scope())
+            .field("resource_type", &self.resource_type())
+            .field("resource_id", &self.resource_id())
+            .field("version", &self.version())
+            .finish()
+    }
+}
+
 impl Trn {
     /// Create a new TRN with validation
+    ///
+    /// Components are only borrowed, so `&str` arguments are copied straight
+    /// into the TRN's buffer without an owned `String` per component.
     pub fn new(
-        platform: impl Into<String>,
-        scope: impl Into<String>,
-        resource_type: impl Into<String>,
-        resource_id: impl Into<String>,
-        version: impl Into<String>,
+        platform: impl AsRef<str>,
+        scope: impl AsRef<str>,
+        resource_type: impl AsRef<str>,
+        resource_id: impl AsRef<str>,
+        version: impl AsRef<str>,
     ) -> TrnResult<Self> {
-        let trn = Self {
-            platform: platform.into(),
-            scope: scope.into(),
-            resource_type: resource_type.into(),
-            resource_id: resource_id.into(),
-            version: version.into(),
-        };
+        let trn = Self::from_parts(
+            platform.as_ref(),
+            scope.as_ref(),
+            resource_type.as_ref(),
+            resource_id.as_ref(),
+            version.as_ref(),
+        );
         
         trn.validate()?;
         Ok(trn)
     }
 
+    /// Build a TRN from its components without validation
+    pub(crate) fn from_parts(
+        platform: &str,
+        scope: &str,
+        resource_type: &str,
+        resource_id: &str,
+        version: &str,
+    ) -> Self {
+        let parts = [platform, scope, resource_type, resource_id, version];
+        let capacity = TRN_PREFIX.len() + parts.iter().map(|part| part.len() + 1).sum::<usize>();
+
+        let mut repr = String::with_capacity(capacity);
+        repr.push_str(TRN_PREFIX);
+        let mut ends = [0; 5];
+        for (end, part) in ends.iter_mut().zip(parts) {
+            repr.push(TRN_SEPARATOR);
+            repr.push_str(part);
+            *end = repr.len();
+        }
+
+        Self::from_buffer(repr, ends)
+    }
+
+    /// Wrap a canonical string and its component end offsets
+    fn from_buffer(repr: String, ends: [usize; 5]) -> Self {
+        Self {
+            repr: repr.into(),
+            ends: ends.map(|end| u32::try_from(end).expect("TRN exceeds 4 GiB")),
+        }
+    }
+
+    /// Borrow the component at `index` (0 = platform, 4 = version)
+    #[inline]
+    fn component(&self, index: usize) -> &str {
+        let start = if index == 0 {
+            COMPONENTS_START
+        } else {
+            self.end(index - 1) + 1
+        };
+        &self.repr[start..self.end(index)]
+    }
+
+    /// End offset of the component at `index` in the canonical string
+    #[inline]
+    fn end(&self, index: usize) -> usize {
+        self.ends[index] as usize
+    }
+
+    /// End offsets of all components in the canonical string
+    fn end_offsets(&self) -> [usize; 5] {
+        self.ends.map(|end| end as usize)
+    }
+
     /// Parse a TRN string
     pub fn parse(input: &str) -> TrnResult<Self> {
-        crate::parsing::parse_trn(input)
+        parse_trn(input)
     }
 
     /// Create TRN from components
@@ -222,7 +364,7 @@ impl Trn {
 
     /// Validate this TRN
     pub fn validate(&self) -> TrnResult<()> {
-        crate::validation::validate_trn_struct(self)
+        validate_trn_struct(self)
     }
 
     /// Check if this TRN is valid
@@ -231,104 +373,152 @@ impl Trn {
     }
 
     // Accessors
+    //
+    // Marked #[inline] so they reduce to a slice of the shared buffer in
+    // downstream crates too, not only under this crate's release LTO.
     /// Get the platform
+    #[inline]
     pub fn platform(&self) -> &str {
-        &self.platform
+        self.component(0)
     }
 
     /// Get the scope
+    #[inline]
     pub fn scope(&self) -> &str {
-        &self.scope
+        self.component(1)
     }
 
     /// Get the resource type
+    #[inline]
     pub fn resource_type(&self) -> &str {
-        &self.resource_type
+        self.component(2)
     }
 
     /// Get the resource ID
+    #[inline]
     pub fn resource_id(&self) -> &str {
-        &self.resource_id
+        self.component(3)
     }
 
     /// Get the version
+    #[inline]
     pub fn version(&self) -> &str {
-        &self.version
+        self.component(4)
     }
 
     // Conversion methods
+    /// Borrow the canonical string representation
+    #[inline]
+    pub fn as_str(&self) -> &str {
+        &self.repr
+    }
+
     /// Convert to string representation
     pub fn to_string(&self) -> String {
-        format!(
-            "trn:{}:{}:{}:{}:{}",
-            self.platform,
-            self.scope,
-            self.resource_type,
-            self.resource_id,
-            self.version
-        )
+        self.repr.to_string()
     }
 
     /// Convert to URL format
+    #[inline]
     pub fn to_url(&self) -> TrnResult<String> {
-        crate::url::trn_to_url(self)
+        trn_to_url(self)
     }
 
     /// Convert to HTTP URL
+    #[inline]
     pub fn to_http_url(&self, base: &str) -> TrnResult<String> {
-        crate::url::trn_to_http_url(self, base)
+        trn_to_http_url(self, base)
     }
 
     // Manipulation methods
     /// Get the base TRN (without version)
     pub fn base_trn(&self) -> Self {
-        Self {
-            platform: self.platform.clone(),
-            scope: self.scope.clone(),
-            resource_type: self.resource_type.clone(),
-            resource_id: self.resource_id.clone(),
-            version: "*".to_string(),
-        }
+        // Keep everything up to the version separator and append the wildcard
+        let head = &self.repr[..=self.end(3)];
+        let mut repr = String::with_capacity(head.len() + 1);
+        repr.push_str(head);
+        repr.push('*');
+
+        let mut ends = self.end_offsets();
+        ends[4] = repr.len();
+        Self::from_buffer(repr, ends)
     }
 
     /// Check if this TRN matches a pattern
     pub fn matches_pattern(&self, pattern: &str) -> bool {
-        crate::pattern::matches_pattern(&self.to_string(), pattern)
+        matches_pattern(self.as_str(), pattern)
+    }
+
+    /// Check whether two TRNs share the same underlying buffer
+    ///
+    /// Clones and repeated [`Trn::parse`] calls for the same string (served
+    /// from the parse cache) share one buffer, so this identity check can
+    /// stand in for string comparison when deduplicating parsed TRNs.
+    pub fn shares_buffer(&self, other: &Self) -> bool {
+        Arc::ptr_eq(&self.repr, &other.repr)
     }
 
     /// Check if this TRN is compatible with another TRN
     pub fn is_compatible_with(&self, other: &Self) -> bool {
-        self.platform == other.platform
-            && self.scope == other.scope
-            && self.resource_type == other.resource_type
-            && self.resource_id == other.resource_id
+        // Everything up to the end of the resource ID is the shared base
+        self.ends[..4] == other.ends[..4] && self.repr[..self.end(3)] == other.repr[..other.end(3)]
+    }
+
+    /// Check if this TRN is compatible with a TRN string
+    ///
+    /// Equivalent to parsing `other` and calling [`Trn::is_compatible_with`]:
+    /// the shared base prefix is compared first, then `other` is scanned and
+    /// validated from that scan, so no TRN is constructed or cached.
+    pub fn is_compatible_with_str(&self, other: &str) -> bool {
+        let base = &self.repr[..=self.end(3)];
+        if !other.starts_with(base) {
+            return false;
+        }
+        match scan_trn(other) {
+            Some(components) => validate_scanned(other, &components).is_ok(),
+            None => false,
+        }
     }
 
     // Mutable operations
     /// Set the scope
     pub fn set_scope(&mut self, scope: String) {
-        self.scope = scope;
+        *self = Self::from_parts(
+            self.platform(),
+            &scope,
+            self.resource_type(),
+            self.resource_id(),
+            self.version(),
+        );
     }
 
     /// Set the version
     pub fn set_version(&mut self, version: String) {
-        self.version = version;
+        let head = &self.repr[..=self.end(3)];
+        let mut repr = String::with_capacity(head.len() + version.len());
+        repr.push_str(head);
+        repr.push_str(&version);
+
+        let mut ends = self.end_offsets();
+        ends[4] = repr.len();
+        *self = Self::from_buffer(repr, ends);
     }
 
     /// Get components as borrowed structure
     pub fn components(&self) -> TrnComponents<'_> {
         TrnComponents {
-            platform: &self.platform,
-            scope: &self.scope,
-            resource_type: &self.resource_type,
-            resource_id: &self.resource_id,
-            version: &self.version,
+            platform: self.platform(),
+            scope: self.scope(),
+            resource_type: self.resource_type(),
+            resource_id: self.resource_id(),
+            version: self.version(),
         }
     }
 
     /// Parse TRN from URL
+    #[inline]
     pub fn from_url(url: &str) -> TrnResult<Self> {
-        crate::url::url_to_trn(url)
+        url_to_trn(url)
     }
 
     /// Serialize to JSON string
@@ -355,16 +545,15 @@ impl Trn {
 }
 
 impl fmt::Display for Trn {
+    #[inline]
     fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
-        write!(
-            f,
-            "trn:{}:{}:{}:{}:{}",
-            self.platform,
-            self.scope,
-            self.resource_type,
-            self.resource_id,
-            self.version
-        )
+        f.write_str(&self.repr)
+    }
+}
+
+impl AsRef<str> for Trn {
+    fn as_ref(&self) -> &str {
+        &self.repr
     }
 }
 
@@ -380,4 +569,128 @@ impl From<TrnComponents<'_>> for Trn {
     fn from(components: TrnComponents<'_>) -> Self {
         components.to_owned()
     }
-}
\ No newline at end of file
+}
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_components_borrow_single_buffer() {
+        let trn = Trn::from_parts("user", "alice", "tool", "myapi", "v1.0");
+        assert_eq!(trn.as_str(), "trn:user:alice:tool:myapi:v1.0");
+        assert_eq!(trn.platform(), "user");
+        assert_eq!(trn.scope(), "alice");
+        assert_eq!(trn.resource_type(), "tool");
+        assert_eq!(trn.resource_id(), "myapi");
+        assert_eq!(trn.version(), "v1.0");
+    }
+
+    #[test]
+    fn test_setters_rebuild_buffer() {
+        let mut trn = Trn::from_parts("user", "alice", "tool", "myapi", "v1.0");
+        trn.set_version("v2.0-beta".to_string());
+        trn.set_scope("bob".to_string());
+        assert_eq!(trn, Trn::from_parts("user", "bob", "tool", "myapi", "v2.0-beta"));
+        assert_eq!(trn.version(), "v2.0-beta");
+    }
+
+    #[test]
+    fn test_trn_stays_compact() {
+        // Shared buffer pointer, five 32-bit offsets and the cached hash
+        assert!(std::mem::size_of::<Trn>() <= 48);
+    }
+
+    #[test]
+    fn test_clones_share_buffer_until_set() {
+        let trn = Trn::from_parts("user", "alice", "tool", "myapi", "v1.0");
+        let mut copy = trn.clone();
+        assert!(trn.shares_buffer(&copy));
+
+        copy.set_version("v2.0".to_string());
+        assert!(!trn.shares_buffer(&copy));
+        assert_eq!(trn.version(), "v1.0");
+        assert_eq!(copy.version(), "v2.0");
+    }
+
+    #[test]
+    fn test_compatible_with_str() {
+        let trn = Trn::from_parts("user", "alice", "tool", "myapi", "v1.0");
+        assert!(trn.is_compatible_with_str("trn:user:alice:tool:myapi:v2.0"));
+        assert!(!trn.is_compatible_with_str("trn:user:alice:tool:myapi2:v1.0"));
+        assert!(!trn.is_compatible_with_str("trn:user:alice:tool:myapi:v1.0:extra"));
+        assert!(!trn.is_compatible_with_str("trn:user:alice:tool:myapi:"));
+
+        // Strings that scan but fail validation are not compatible either
+        assert!(Trn::parse("trn:user:alice:tool:myapi:null").is_err());
+        assert!(!trn.is_compatible_with_str("trn:user:alice:tool:myapi:null"));
+
+        let unsupported = Trn::from_parts("user", "alice", "widget", "myapi", "v1.0");
+        assert!(Trn::parse("trn:user:alice:widget:myapi:v2.0").is_err());
+        assert!(!unsupported.is_compatible_with_str("trn:user:alice:widget:myapi:v2.0"));
+    }
+
+    #[test]
+    fn test_hash_tracks_buffer() {
+        let mut trn = Trn::from_parts("user", "alice", "tool", "myapi", "v1.0");
+        trn.set_version("v2.0".to_string());
+        assert_eq!(trn, Trn::from_parts("user", "alice", "tool", "myapi", "v2.0"));
+
+        let set: std::collections::HashSet<Trn> = [trn.clone(), trn.clone()].into_iter().collect();
+        assert_eq!(set.len(), 1);
+    }
+
+    #[test]
+    fn test_hash_feeds_string_to_hasher() {
+        use std::collections::hash_map::RandomState;
+        use std::hash::BuildHasher;
+
+        // A keyed hasher must see the TRN string, not a precomputed fixed-key hash
+        let state = RandomState::new();
+        let trn = Trn::from_parts("user", "alice", "tool", "myapi", "v1.0");
+
+        let mut trn_hasher = state.build_hasher();
+        trn.hash(&mut trn_hasher);
+        let mut str_hasher = state.build_hasher();
+        trn.as_str().hash(&mut str_hasher);
+        assert_eq!(trn_hasher.finish(), str_hasher.finish());
+    }
+
+    #[test]
+    fn test_components_dedupe_without_owning() {
+        let trns = [
+            Trn::from_parts("user", "alice", "tool", "myapi", "v1.0"),
+            Trn::from_parts("user", "alice", "tool", "myapi", "v1.0"),
+            Trn::from_parts("user", "alice", "tool", "myapi", "v2.0"),
+        ];
+        let set: std::collections::HashSet<TrnComponents<'_>> =
+            trns.iter().map(Trn::components).collect();
+        assert_eq!(set.len(), 2);
+    }
+
+    #[test]
+    fn test_base_trn_replaces_version() {
+        let trn = Trn::from_parts("user", "alice", "tool", "myapi", "v1.0");
+        assert_eq!(trn.base_trn(), Trn::from_parts("user", "alice", "tool", "myapi", "*"));
+    }
+
+    #[test]
+    fn test_closed_vocabulary_as_str_round_trips() {
+        for platform in [Platform::User, Platform::Org, Platform::AiPlatform] {
+            assert_eq!(platform.as_str().parse::<Platform>().unwrap(), platform);
+        }
+        assert_eq!(ResourceType::Custom("agent".to_string()).as_str(), "agent");
+        assert_eq!(ResourceType::Model.to_string(), "model");
+    }
+
+    #[test]
+    fn test_serde_keeps_component_fields() {
+        let trn = Trn::from_parts("user", "alice", "tool", "myapi", "v1.0");
+        let json = trn.to_json().unwrap();
+        assert_eq!(
+            json,
+            r#"{"platform":"user","scope":"alice","resource_type":"tool","resource_id":"myapi","version":"v1.0"}"#
+        );
+        assert_eq!(Trn::from_json(&json).unwrap(), trn);
+        assert_eq!(serde_json::to_string(&trn.components()).unwrap(), json);
+    }
+}
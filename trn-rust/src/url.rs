@@ -3,48 +3,89 @@
 //! This module provides bidirectional conversion between TRN strings and URL formats,
 //! including trn:// URLs and HTTP URLs for web-based access.
 
+use dashmap::DashMap;
+use once_cell::sync::Lazy;
 use percent_encoding::{utf8_percent_encode, percent_decode_str, CONTROLS, AsciiSet};
+use std::borrow::Cow;
+use std::collections::HashMap;
 use url::Url;
 
+use crate::cache::insert_bounded;
+use crate::constants::BASE_URL_CACHE_SIZE;
 use crate::error::{TrnError, TrnResult};
-use crate::types::{Trn, TrnComponents};
+use crate::parsing::parse_trn_from_url;
+use crate::types::Trn;
 
 /// Define a safe encoding set for TRN URL components
 /// Only encode characters that are problematic in URLs, preserve safe characters like - and .
+///
+/// The set is built at compile time and encoding streams borrowed runs of
+/// unescaped text, so repeated components need no memoization.
 const TRN_COMPONENT_ENCODE_SET: &AsciiSet = &CONTROLS.add(b' ').add(b'/').add(b'?').add(b'#').add(b'[').add(b']').add(b'@').add(b'!').add(b'$').add(b'&').add(b'\'').add(b'(').add(b')').add(b'*').add(b'+').add(b',').add(b';').add(b'=');
 
+/// Parsed base URLs keyed by the string callers pass in
+///
+/// Callers convert many TRNs against the same few bases, so each base is
+/// parsed once rather than on every conversion.
+static BASE_URL_CACHE: Lazy<DashMap<String, Url>> = Lazy::new(DashMap::new);
+
 /// Convert a TRN to trn:// URL format
 pub fn trn_to_url(trn: &Trn) -> TrnResult<String> {
-    let path_parts = vec![
-        trn.platform(),
-        trn.scope(),
-        trn.resource_type(),
-        trn.resource_id(),
-        trn.version(),
-    ];
-    
-    // URL encode each path component
-    let encoded_parts: Vec<String> = path_parts
-        .iter()
-        .map(|part| url_encode_component(part))
-        .collect();
-    
-    let url = format!("trn://{}", encoded_parts.join("/"));
-    
+    // "trn:a:b:c:d:e" becomes "trn://a/b/c/d/e", two bytes longer when
+    // nothing needs escaping
+    let mut url = String::with_capacity(trn.as_str().len() + 2);
+    url.push_str("trn:/");
+    push_encoded_components(&mut url, trn);
     Ok(url)
 }
 
 /// Convert a TRN to HTTP URL format
 pub fn trn_to_http_url(trn: &Trn, base_url: &str) -> TrnResult<String> {
-    // Validate base URL
+    let base = parse_base_url(base_url)?;
+    
+    let mut path = String::with_capacity(trn.as_str().len() + 1);
+    path.push_str("trn");
+    push_encoded_components(&mut path, trn);
+    
+    let url = base.join(&path)
+        .map_err(|e| TrnError::url(
+            format!("Failed to join path with base URL: {}", e),
+            Some(base_url.to_string()),
+        ))?;
+    
+    // Hand back the serialization buffer instead of formatting a copy
+    Ok(url.into())
+}
+
+/// Parse and validate a base URL, reusing earlier parses of the same string
+fn parse_base_url(base_url: &str) -> TrnResult<Url> {
+    if let Some(base) = BASE_URL_CACHE.get(base_url) {
+        return Ok(base.value().clone());
+    }
+    
     let base = Url::parse(base_url)
         .map_err(|e| TrnError::url(
             format!("Invalid base URL: {}", e),
             Some(base_url.to_string()),
         ))?;
     
-    let path_parts = vec![
-        "trn",
+    insert_bounded(&BASE_URL_CACHE, BASE_URL_CACHE_SIZE, base_url.to_string(), base.clone());
+    Ok(base)
+}
+
+/// Clear the parsed base URL cache
+pub(crate) fn clear_base_url_cache() {
+    BASE_URL_CACHE.clear();
+}
+
+/// Append each component as a `/`-prefixed, URL-encoded path segment
+///
+/// A component with nothing to escape comes out of the encoder as a single
+/// borrowed run, so the common case is one copy per component. Every
+/// component goes through the encoder, even those validation restricts to
+/// URL-safe characters, because unvalidated TRNs can carry any text.
+fn push_encoded_components(out: &mut String, trn: &Trn) {
+    let components = [
         trn.platform(),
         trn.scope(),
         trn.resource_type(),
@@ -52,21 +93,10 @@ pub fn trn_to_http_url(trn: &Trn, base_url: &str) -> TrnResult<String> {
         trn.version(),
     ];
     
-    // URL encode each path component
-    let encoded_parts: Vec<String> = path_parts
-        .iter()
-        .map(|part| url_encode_component(part))
-        .collect();
-    
-    let path = encoded_parts.join("/");
-    
-    let url = base.join(&path)
-        .map_err(|e| TrnError::url(
-            format!("Failed to join path with base URL: {}", e),
-            Some(base_url.to_string()),
-        ))?;
-    
-    Ok(url.to_string())
+    for component in components {
+        out.push('/');
+        out.extend(utf8_percent_encode(component, TRN_COMPONENT_ENCODE_SET));
+    }
 }
 
 /// Convert a trn:// URL back to TRN string
@@ -78,7 +108,7 @@ pub fn url_to_trn(url: &str) -> TrnResult<Trn> {
         ));
     }
     
-    crate::parsing::parse_trn_from_url(url)
+    parse_trn_from_url(url)
 }
 
 /// Convert an HTTP URL back to TRN string
@@ -90,83 +120,85 @@ pub fn http_url_to_trn(url: &str) -> TrnResult<Trn> {
             Some(url.to_string()),
         ))?;
     
-    let path = parsed_url.path();
+    // Check for and remove the /trn/ path prefix in one step
+    let trn_path = match parsed_url.path().strip_prefix("/trn/") {
+        Some(trn_path) => trn_path,
+        None => {
+            return Err(TrnError::url(
+                "HTTP URL path must start with /trn/",
+                Some(url.to_string()),
+            ));
+        }
+    };
     
-    // Check if path starts with /trn/
-    if !path.starts_with("/trn/") {
-        return Err(TrnError::url(
-            "HTTP URL path must start with /trn/",
-            Some(url.to_string()),
-        ));
+    // Fill the fixed layout from the non-empty segments, counting any surplus
+    let mut path_parts = [""; 5];
+    let mut count = 0;
+    for part in trn_path.split('/').filter(|s| !s.is_empty()) {
+        if let Some(slot) = path_parts.get_mut(count) {
+            *slot = part;
+        }
+        count += 1;
     }
     
-    // Remove /trn/ prefix
-    let trn_path = &path[5..];
-    
-    // Split path into components
-    let path_parts: Vec<&str> = trn_path
-        .split('/')
-        .filter(|s| !s.is_empty())
-        .collect();
-    
-    if path_parts.len() < 5 {
+    if count < 5 {
         return Err(TrnError::url(
             "HTTP URL requires at least 5 TRN path components",
             Some(url.to_string()),
         ));
     }
     
-    // Decode URL components
-    let decoded_parts: Result<Vec<String>, _> = path_parts
-        .iter()
-        .map(|part| url_decode_component(part))
-        .collect();
-    
-    let decoded_parts = decoded_parts.map_err(|e| TrnError::url(
-        format!("Failed to decode URL components: {}", e),
-        Some(url.to_string()),
-    ))?;
-    
     // For the new 6-component format, we expect exactly 5 path components
     // Format: trn://platform/scope/resource_type/resource_id/version
-    if decoded_parts.len() != 5 {
+    if count != 5 {
         return Err(TrnError::url(
-            format!("Invalid trn:// URL format. Expected 5 path components, got {}", decoded_parts.len()),
+            format!("Invalid trn:// URL format. Expected 5 path components, got {}", count),
             Some(url.to_string()),
         ));
     }
     
-    // Build TRN components for the fixed format
-    let components = TrnComponents {
-        platform: &decoded_parts[0],
-        scope: &decoded_parts[1],
-        resource_type: &decoded_parts[2],
-        resource_id: &decoded_parts[3],
-        version: &decoded_parts[4],
-    };
+    // Decode URL components
+    let mut decoded_parts: [Cow<'_, str>; 5] = Default::default();
+    for (decoded, part) in decoded_parts.iter_mut().zip(path_parts) {
+        *decoded = url_decode_component(part).map_err(|e| TrnError::url(
+            format!("Failed to decode URL components: {}", e),
+            Some(url.to_string()),
+        ))?;
+    }
     
-    Ok(components.to_owned())
+    // Copy the decoded parts straight into the TRN's buffer
+    let [platform, scope, resource_type, resource_id, version] = &decoded_parts;
+    Ok(Trn::from_parts(platform, scope, resource_type, resource_id, version))
 }
 
 /// URL encode a TRN component
-fn url_encode_component(component: &str) -> String {
-    utf8_percent_encode(component, TRN_COMPONENT_ENCODE_SET).to_string()
+///
+/// Borrows the input when nothing needs escaping, which is the common case.
+#[allow(dead_code)]
+#[inline]
+fn url_encode_component(component: &str) -> Cow<'_, str> {
+    utf8_percent_encode(component, TRN_COMPONENT_ENCODE_SET).into()
 }
 
 /// URL decode a TRN component
-fn url_decode_component(component: &str) -> Result<String, std::str::Utf8Error> {
-    let decoded = percent_decode_str(component).decode_utf8()?;
-    Ok(decoded.to_string())
+///
+/// Borrows the input when it contains no escapes, which is the common case.
+#[inline]
+fn url_decode_component(component: &str) -> Result<Cow<'_, str>, std::str::Utf8Error> {
+    percent_decode_str(component).decode_utf8()
 }
 
 /// Heuristic to determine if a component looks like a scope
+///
+/// TRN components are ASCII, so the character checks test bytes directly
+/// instead of decoding chars and consulting Unicode tables.
 #[allow(dead_code)]
 fn is_scope_like(value: &str, platform: &str) -> bool {
     match platform {
-        "user" => value.len() >= 2 && value.chars().all(|c| c.is_alphanumeric()),
+        "user" => value.len() >= 2 && value.bytes().all(|b| b.is_ascii_alphanumeric()),
         "org" => value.len() >= 2,
         "aiplatform" => false,
-        _ => value.len() <= 32 && value.chars().all(|c| c.is_alphanumeric() || c == '-'),
+        _ => value.len() <= 32 && value.bytes().all(|b| b.is_ascii_alphanumeric() || b == b'-'),
     }
 }
 
@@ -176,41 +208,47 @@ pub fn build_trn_url_with_params(trn: &Trn, params: &[(&str, &str)]) -> TrnResul
     let base_url = trn_to_url(trn)?;
     
     // Parse existing URL to handle existing query parameters
-    let url = Url::parse(&base_url)
+    let mut url = Url::parse(&base_url)
         .map_err(|e| TrnError::url(
             format!("Failed to parse TRN URL: {}", e),
-            Some(base_url.clone()),
+            Some(base_url),
         ))?;
     
-    let mut new_url = url.clone();
-    
     // Add custom parameters
-    {
-        let mut query_pairs = new_url.query_pairs_mut();
-        for (key, value) in params {
-            query_pairs.append_pair(key, value);
-        }
-    }
+    url.query_pairs_mut().extend_pairs(params);
     
-    Ok(new_url.to_string())
+    Ok(url.into())
 }
 
 /// Extract query parameters from a TRN URL
 #[allow(dead_code)]
-pub fn extract_url_params(url: &str) -> TrnResult<std::collections::HashMap<String, String>> {
+pub fn extract_url_params(url: &str) -> TrnResult<HashMap<String, String>> {
     let parsed_url = Url::parse(url)
         .map_err(|e| TrnError::url(
             format!("Invalid URL: {}", e),
             Some(url.to_string()),
         ))?;
     
-    let mut params = std::collections::HashMap::new();
-    
-    for (key, value) in parsed_url.query_pairs() {
-        params.insert(key.to_string(), value.to_string());
-    }
+    // Decoded pairs are only copied when they still borrow the URL
+    Ok(parsed_url.query_pairs().into_owned().collect())
+}
+
+/// Extract a single query parameter from a TRN URL
+///
+/// Stops at the first pair named `name`, so later pairs are never decoded
+/// and no map is built. Returns `None` when the parameter is absent.
+#[allow(dead_code)]
+pub fn extract_url_param(url: &str, name: &str) -> TrnResult<Option<String>> {
+    let parsed_url = Url::parse(url)
+        .map_err(|e| TrnError::url(
+            format!("Invalid URL: {}", e),
+            Some(url.to_string()),
+        ))?;
     
-    Ok(params)
+    Ok(parsed_url
+        .query_pairs()
+        .find(|(key, _)| key == name)
+        .map(|(_, value)| value.into_owned()))
 }
 
 /// Normalize a URL by removing unnecessary components
@@ -228,14 +266,17 @@ pub fn normalize_url(url: &str) -> TrnResult<String> {
                 Some(url.to_string()),
             ))?;
         
-        Ok(parsed_url.to_string())
+        Ok(parsed_url.into())
     }
 }
 
 /// Check if a URL is a valid TRN URL
+///
+/// URLs with the wrong scheme or number of path segments are rejected
+/// before parsing, so they never build an error value.
 #[allow(dead_code)]
 pub fn is_valid_trn_url(url: &str) -> bool {
-    url_to_trn(url).is_ok()
+    has_trn_url_shape(url) && url_to_trn(url).is_ok()
 }
 
 /// Check if a URL is a valid HTTP TRN URL
@@ -244,6 +285,17 @@ pub fn is_valid_http_trn_url(url: &str) -> bool {
     http_url_to_trn(url).is_ok()
 }
 
+/// Cheap structural check for `trn://a/b/c/d/e` with an optional trailing slash
+fn has_trn_url_shape(url: &str) -> bool {
+    match url.strip_prefix("trn://") {
+        Some(path) => {
+            let path = path.strip_suffix('/').unwrap_or(path);
+            path.bytes().filter(|&b| b == b'/').count() == 4
+        }
+        None => false,
+    }
+}
+
 /// Convert between different URL formats
 #[allow(dead_code)]
 pub fn convert_url_format(url: &str, target_format: UrlFormat, base_url: Option<&str>) -> TrnResult<String> {
@@ -305,10 +357,10 @@ pub fn validate_url(url: &str) -> UrlValidationResult {
         match url_to_trn(url) {
             Ok(trn) => UrlValidationResult {
                 is_valid: true,
-                trn: Some(trn.clone()),
+                normalized_url: trn_to_url(&trn).ok(),
+                trn: Some(trn),
                 error: None,
                 format: Some(UrlFormat::TrnUrl),
-                normalized_url: trn_to_url(&trn).ok(),
             },
             Err(e) => UrlValidationResult {
                 is_valid: false,
@@ -324,7 +376,7 @@ pub fn validate_url(url: &str) -> UrlValidationResult {
         match http_url_to_trn(url) {
             Ok(trn) => UrlValidationResult {
                 is_valid: true,
-                trn: Some(trn.clone()),
+                trn: Some(trn),
                 error: None,
                 format: Some(UrlFormat::HttpUrl),
                 normalized_url: Some(url.to_string()),
@@ -370,11 +422,33 @@ mod tests {
         assert_eq!(url, "trn://user/alice/tool/myapi/v1.0");
     }
 
+    #[test]
+    fn test_trn_to_url_encodes_components() {
+        let trn = Trn::from_parts("user", "alice", "tool", "my api", "v1.0");
+        assert_eq!(trn_to_url(&trn).unwrap(), "trn://user/alice/tool/my%20api/v1.0");
+
+        // Unvalidated TRNs may put unsafe characters in any component
+        let trn = Trn::from_parts("my/platform", "alice", "a tool", "myapi", "v1.0+build");
+        assert_eq!(
+            trn_to_url(&trn).unwrap(),
+            "trn://my%2Fplatform/alice/a%20tool/myapi/v1.0%2Bbuild"
+        );
+    }
+
     #[test]
     fn test_trn_to_http_url() {
         let trn = Trn::parse("trn:user:alice:tool:myapi:v1.0").unwrap();
         let url = trn_to_http_url(&trn, "https://api.example.com/").unwrap();
         assert_eq!(url, "https://api.example.com/trn/user/alice/tool/myapi/v1.0");
+        assert!(BASE_URL_CACHE.contains_key("https://api.example.com/"));
+
+        // Repeat conversions reuse the cached base
+        let again = trn_to_http_url(&trn, "https://api.example.com/").unwrap();
+        assert_eq!(again, url);
+
+        // Invalid bases are rejected and never cached
+        assert!(trn_to_http_url(&trn, "not a url").is_err());
+        assert!(!BASE_URL_CACHE.contains_key("not a url"));
     }
 
     #[test]
@@ -392,6 +466,33 @@ mod tests {
         let trn = http_url_to_trn(url).unwrap();
         assert_eq!(trn.platform(), "user");
         assert_eq!(trn.scope(), "alice");
+
+        assert!(http_url_to_trn("https://api.example.com/trn/user/alice/tool").is_err());
+        assert!(http_url_to_trn("https://api.example.com/trn/user/alice/tool/myapi/v1.0/extra").is_err());
+    }
+
+    #[test]
+    fn test_url_params_round_trip() {
+        let trn = Trn::parse("trn:user:alice:tool:myapi:v1.0").unwrap();
+        let url = build_trn_url_with_params(&trn, &[("hash", "a b"), ("ref", "main")]).unwrap();
+        assert_eq!(url, "trn://user/alice/tool/myapi/v1.0?hash=a+b&ref=main");
+
+        let params = extract_url_params(&url).unwrap();
+        assert_eq!(params.get("hash").map(String::as_str), Some("a b"));
+        assert_eq!(params.get("ref").map(String::as_str), Some("main"));
+
+        assert_eq!(extract_url_param(&url, "hash").unwrap().as_deref(), Some("a b"));
+        assert_eq!(extract_url_param(&url, "missing").unwrap(), None);
+        assert!(extract_url_param("not a url", "hash").is_err());
+    }
+
+    #[test]
+    fn test_is_scope_like() {
+        assert!(is_scope_like("alice", "user"));
+        assert!(!is_scope_like("al-ice", "user"));
+        assert!(!is_scope_like("ålice", "user"));
+        assert!(is_scope_like("my-team", "custom"));
+        assert!(!is_scope_like("anything", "aiplatform"));
     }
 
     #[test]
@@ -400,6 +501,11 @@ mod tests {
         let encoded = url_encode_component(component);
         let decoded = url_decode_component(&encoded).unwrap();
         assert_eq!(component, decoded);
+
+        // Components with nothing to escape are borrowed, not copied
+        assert!(matches!(encoded, Cow::Borrowed(_)));
+        assert!(matches!(decoded, Cow::Borrowed(_)));
+        assert!(matches!(url_encode_component("my api"), Cow::Owned(_)));
     }
 
     #[test]
@@ -422,6 +528,11 @@ mod tests {
         let result = validate_url(invalid_url);
         assert!(!result.is_valid);
         assert!(result.error.is_some());
+
+        assert!(is_valid_trn_url(valid_url));
+        assert!(is_valid_trn_url("trn://user/alice/tool/myapi/v1.0/"));
+        assert!(!is_valid_trn_url(invalid_url));
+        assert!(!is_valid_trn_url("trn://user/alice/tool/myapi/v1.0/extra"));
     }
 
     #[test]
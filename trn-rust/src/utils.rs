@@ -3,12 +3,20 @@
 //! This module provides various utility functions for TRN operations,
 //! including version comparison, statistics, and convenience helpers.
 
+use std::collections::hash_map::DefaultHasher;
 use std::collections::HashMap;
 use std::cmp::Ordering;
+use std::hash::{Hash, Hasher};
 
+use dashmap::DashMap;
+use once_cell::sync::Lazy;
+
+use crate::cache::insert_bounded;
+use crate::constants::VERSION_CACHE_SIZE;
 use crate::error::{TrnError, TrnResult};
+use crate::parsing::try_parse_trn;
 use crate::types::{Trn, Platform};
-use crate::TrnBuilder;
+use crate::validation::{is_valid_trn, validate_trn_string, validate_version_component};
 
 /// Hash algorithm enumeration
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
@@ -31,11 +39,8 @@ impl HashAlgorithm {
 
 /// Generate hash for TRN using specified algorithm
 pub fn generate_trn_hash(trn: &Trn, algorithm: HashAlgorithm) -> String {
-    use std::collections::hash_map::DefaultHasher;
-    use std::hash::{Hash, Hasher};
-    
     let mut hasher = DefaultHasher::new();
-    trn.to_string().hash(&mut hasher);
+    trn.as_str().hash(&mut hasher);
     
     match algorithm {
         HashAlgorithm::Sha256 => format!("sha256:{:x}", hasher.finish()),
@@ -95,6 +100,54 @@ impl VersionOp {
     }
 }
 
+/// Split a version into its numeric fields, pre-release and build metadata
+///
+/// Accepts the grammar `N.N.N[-ident][+ident]`, where `N` is one or more ASCII
+/// digits and `ident` is one or more of `[a-zA-Z0-9.-]`, with a single byte
+/// scan per part instead of a capturing regex.
+fn split_semver(version: &str) -> Option<([&str; 3], Option<&str>, Option<&str>)> {
+    let is_ident = |part: &str| {
+        !part.is_empty()
+            && part.bytes().all(|b| b.is_ascii_alphanumeric() || b == b'.' || b == b'-')
+    };
+
+    let (rest, build) = match version.split_once('+') {
+        Some((rest, build)) => (rest, Some(build)),
+        None => (version, None),
+    };
+    let (core, prerelease) = match rest.split_once('-') {
+        Some((core, prerelease)) => (core, Some(prerelease)),
+        None => (rest, None),
+    };
+
+    let mut fields = core.split('.');
+    let numbers = [fields.next()?, fields.next()?, fields.next()?];
+    if fields.next().is_some()
+        || !numbers
+            .iter()
+            .all(|number| !number.is_empty() && number.bytes().all(|b| b.is_ascii_digit()))
+        || !prerelease.map_or(true, is_ident)
+        || !build.map_or(true, is_ident)
+    {
+        return None;
+    }
+
+    Some((numbers, prerelease, build))
+}
+
+/// Successfully parsed semantic versions keyed by the original version string
+static VERSION_CACHE: Lazy<DashMap<String, SemanticVersion>> = Lazy::new(DashMap::new);
+
+/// Remember a parsed version, evicting a quarter of the entries when full
+fn cache_version(version: &str, semver: &SemanticVersion) {
+    insert_bounded(&VERSION_CACHE, VERSION_CACHE_SIZE, version.to_string(), semver.clone());
+}
+
+/// Clear the semantic version cache
+pub(crate) fn clear_version_cache() {
+    VERSION_CACHE.clear();
+}
+
 /// Semantic version structure
 #[derive(Debug, Clone, PartialEq, Eq)]
 pub struct SemanticVersion {
@@ -112,31 +165,38 @@ pub struct SemanticVersion {
 
 impl SemanticVersion {
     /// Parse semantic version from string
+    ///
+    /// Successful parses are cached by input string, so sorting or comparing
+    /// many TRNs that share versions parses each distinct version once.
     pub fn parse(version: &str) -> TrnResult<Self> {
+        if let Some(cached) = VERSION_CACHE.get(version) {
+            return Ok(cached.value().clone());
+        }
+
+        let semver = Self::parse_uncached(version)?;
+        cache_version(version, &semver);
+        Ok(semver)
+    }
+
+    /// Parse semantic version from string without consulting the cache
+    fn parse_uncached(version: &str) -> TrnResult<Self> {
         let version = version.trim_start_matches('v');
         
-        let version_regex = regex::Regex::new(r"^(\d+)\.(\d+)\.(\d+)(?:-([a-zA-Z0-9\.\-]+))?(?:\+([a-zA-Z0-9\.\-]+))?$").unwrap();
-        if let Some(captures) = version_regex.captures(version) {
-            let major = captures.get(1)
-                .unwrap()
-                .as_str()
+        if let Some(([major, minor, patch], prerelease, build)) = split_semver(version) {
+            let major = major
                 .parse()
                 .map_err(|_| TrnError::version("Invalid major version", version, "", "=="))?;
             
-            let minor = captures.get(2)
-                .unwrap()
-                .as_str()
+            let minor = minor
                 .parse()
                 .map_err(|_| TrnError::version("Invalid minor version", version, "", "=="))?;
             
-            let patch = captures.get(3)
-                .unwrap()
-                .as_str()
+            let patch = patch
                 .parse()
                 .map_err(|_| TrnError::version("Invalid patch version", version, "", "=="))?;
             
-            let prerelease = captures.get(4).map(|m| m.as_str().to_string());
-            let build = captures.get(5).map(|m| m.as_str().to_string());
+            let prerelease = prerelease.map(str::to_string);
+            let build = build.map(str::to_string);
             
             Ok(Self {
                 major,
@@ -174,11 +234,65 @@ impl SemanticVersion {
 
     /// Compare versions
     pub fn compare(&self, other: &Self) -> Ordering {
+        self.view().compare(&other.view())
+    }
+
+    /// Borrow this version's fields
+    fn view(&self) -> SemverRef<'_> {
+        SemverRef {
+            major: self.major,
+            minor: self.minor,
+            patch: self.patch,
+            prerelease: self.prerelease.as_deref(),
+            build: self.build.as_deref(),
+        }
+    }
+
+    /// Check if versions are compatible (~)
+    pub fn is_compatible(&self, other: &Self) -> bool {
+        self.major == other.major && self.minor == other.minor
+    }
+
+    /// Check if versions are major compatible (^)
+    pub fn is_major_compatible(&self, other: &Self) -> bool {
+        self.major == other.major && self >= other
+    }
+}
+
+/// Borrowed view of a semantic version
+///
+/// Parsed straight from the version string, so comparing two versions needs
+/// neither a cache lookup nor owned pre-release and build strings.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+struct SemverRef<'a> {
+    major: u32,
+    minor: u32,
+    patch: u32,
+    prerelease: Option<&'a str>,
+    build: Option<&'a str>,
+}
+
+impl<'a> SemverRef<'a> {
+    /// Parse the same grammar as [`SemanticVersion::parse`], borrowing the input
+    fn parse(version: &'a str) -> Option<Self> {
+        let ([major, minor, patch], prerelease, build) =
+            split_semver(version.trim_start_matches('v'))?;
+        Some(Self {
+            major: major.parse().ok()?,
+            minor: minor.parse().ok()?,
+            patch: patch.parse().ok()?,
+            prerelease,
+            build,
+        })
+    }
+
+    /// Order by core version, then pre-release (a release outranks any pre-release)
+    fn compare(&self, other: &Self) -> Ordering {
         // Compare core version numbers
         match (self.major, self.minor, self.patch).cmp(&(other.major, other.minor, other.patch)) {
             Ordering::Equal => {
                 // Compare prerelease
-                match (&self.prerelease, &other.prerelease) {
+                match (self.prerelease, other.prerelease) {
                     (None, None) => Ordering::Equal,
                     (None, Some(_)) => Ordering::Greater, // Release > prerelease
                     (Some(_), None) => Ordering::Less,    // Prerelease < release
@@ -188,16 +302,6 @@ impl SemanticVersion {
             other => other,
         }
     }
-
-    /// Check if versions are compatible (~)
-    pub fn is_compatible(&self, other: &Self) -> bool {
-        self.major == other.major && self.minor == other.minor
-    }
-
-    /// Check if versions are major compatible (^)
-    pub fn is_major_compatible(&self, other: &Self) -> bool {
-        self.major == other.major && self >= other
-    }
 }
 
 impl PartialOrd for SemanticVersion {
@@ -219,17 +323,18 @@ pub fn compare_versions(v1: &str, v2: &str, op: VersionOp) -> bool {
         return compare_alias_versions(v1, v2, op);
     }
     
-    // Try semantic version comparison
-    if let (Ok(ver1), Ok(ver2)) = (SemanticVersion::parse(v1), SemanticVersion::parse(v2)) {
+    // Try semantic version comparison on borrowed views of both strings
+    if let (Some(ver1), Some(ver2)) = (SemverRef::parse(v1), SemverRef::parse(v2)) {
+        let ordering = ver1.compare(&ver2);
         match op {
             VersionOp::Equal => ver1 == ver2,
             VersionOp::NotEqual => ver1 != ver2,
-            VersionOp::Greater => ver1 > ver2,
-            VersionOp::GreaterEqual => ver1 >= ver2,
-            VersionOp::Less => ver1 < ver2,
-            VersionOp::LessEqual => ver1 <= ver2,
-            VersionOp::Compatible => ver1.is_compatible(&ver2),
-            VersionOp::CompatibleMajor => ver1.is_major_compatible(&ver2),
+            VersionOp::Greater
+            | VersionOp::GreaterEqual
+            | VersionOp::Less
+            | VersionOp::LessEqual => ordering_satisfies(ordering, op),
+            VersionOp::Compatible => ver1.major == ver2.major && ver1.minor == ver2.minor,
+            VersionOp::CompatibleMajor => ver1.major == ver2.major && ordering != Ordering::Less,
         }
     } else {
         // Fallback to string comparison
@@ -243,59 +348,74 @@ pub fn compare_versions(v1: &str, v2: &str, op: VersionOp) -> bool {
 
 /// Compare version aliases
 fn compare_alias_versions(v1: &str, v2: &str, op: VersionOp) -> bool {
-    let alias_order = |alias: &str| -> u32 {
-        match alias {
-            "dev" | "experimental" => 0,
-            "alpha" => 1,
-            "beta" => 2,
-            "rc" => 3,
-            "stable" | "lts" => 4,
-            "latest" => 5,
-            _ => 3, // Default to rc level
-        }
-    };
-    
-    let order1 = alias_order(v1);
-    let order2 = alias_order(v2);
-    
+    ordering_satisfies(alias_rank(v1).cmp(&alias_rank(v2)), op)
+}
+
+/// Maturity rank of a version alias
+fn alias_rank(alias: &str) -> u32 {
+    match alias {
+        "dev" | "experimental" => 0,
+        "alpha" => 1,
+        "beta" => 2,
+        "rc" => 3,
+        "stable" | "lts" => 4,
+        "latest" => 5,
+        _ => 3, // Default to rc level
+    }
+}
+
+/// Check whether an already computed ordering satisfies `op`
+///
+/// Both compatibility operators reduce to equality for orderings alone.
+fn ordering_satisfies(ordering: Ordering, op: VersionOp) -> bool {
     match op {
-        VersionOp::Equal => order1 == order2,
-        VersionOp::NotEqual => order1 != order2,
-        VersionOp::Greater => order1 > order2,
-        VersionOp::GreaterEqual => order1 >= order2,
-        VersionOp::Less => order1 < order2,
-        VersionOp::LessEqual => order1 <= order2,
-        VersionOp::Compatible | VersionOp::CompatibleMajor => order1 == order2,
+        VersionOp::Equal => ordering == Ordering::Equal,
+        VersionOp::NotEqual => ordering != Ordering::Equal,
+        VersionOp::Greater => ordering == Ordering::Greater,
+        VersionOp::GreaterEqual => ordering != Ordering::Less,
+        VersionOp::Less => ordering == Ordering::Less,
+        VersionOp::LessEqual => ordering != Ordering::Greater,
+        VersionOp::Compatible | VersionOp::CompatibleMajor => ordering == Ordering::Equal,
     }
 }
 
 /// Find the latest version from a list of TRNs
+///
+/// The running maximum borrows its TRN string, so only the winner is copied,
+/// however many times the maximum changes along the way. Valid TRNs end in
+/// their version, so it is sliced off the string and compared in place
+/// rather than read from a parsed `Trn` and an owned `SemanticVersion`.
 pub fn find_latest_version(trns: &[String]) -> Option<String> {
-    let mut latest: Option<(String, SemanticVersion)> = None;
-    
+    let mut latest: Option<(&String, SemverRef<'_>)> = None;
+
     for trn_str in trns {
-        if let Ok(trn) = Trn::parse(trn_str) {
-            let version = trn.version();
-            
-            // Skip aliases for latest comparison
-            if is_common_alias(version) {
-                continue;
-            }
-            
-            if let Ok(semver) = SemanticVersion::parse(version) {
-                match &latest {
-                    None => latest = Some((trn_str.clone(), semver)),
-                    Some((_, current_ver)) => {
-                        if semver > *current_ver {
-                            latest = Some((trn_str.clone(), semver));
-                        }
+        if !is_valid_trn(trn_str) {
+            continue;
+        }
+
+        let version = match trn_str.rsplit_once(':') {
+            Some((_, version)) => version,
+            None => continue,
+        };
+
+        // Skip aliases for latest comparison
+        if is_common_alias(version) {
+            continue;
+        }
+
+        if let Some(semver) = SemverRef::parse(version) {
+            match &latest {
+                None => latest = Some((trn_str, semver)),
+                Some((_, current_ver)) => {
+                    if semver.compare(current_ver) == Ordering::Greater {
+                        latest = Some((trn_str, semver));
                     }
                 }
             }
         }
     }
-    
-    latest.map(|(trn, _)| trn)
+
+    latest.map(|(trn, _)| trn.clone())
 }
 
 /// Version component for increment operations
@@ -347,63 +467,70 @@ pub fn normalize_version(version: &str) -> TrnResult<String> {
 }
 
 /// Check if a version string is a semantic version
+///
+/// Strings that cannot start the grammar, such as aliases, are rejected on
+/// their first byte without a cache lookup or an error value.
 pub fn is_semantic_version(version: &str) -> bool {
-    SemanticVersion::parse(version).is_ok()
+    matches!(version.trim_start_matches('v').as_bytes().first(), Some(b'0'..=b'9'))
+        && SemanticVersion::parse(version).is_ok()
 }
 
 /// Transform a TRN to use a different version
+///
+/// Only the version changes, so the new version is checked on its own rather
+/// than revalidating the whole transformed TRN.
 pub fn transform_version(trn: &Trn, new_version: &str) -> TrnResult<Trn> {
-    TrnBuilder::from_trn(trn)
-        .version(new_version)
-        .build()
+    // `trn` may come from `Trn::from_parts` or deserialization, which do not
+    // validate, so its other components still need checking. For parsed TRNs
+    // this is a validation cache hit on their string; validating the new
+    // string instead would always miss and fill the cache with every result.
+    trn.validate()?;
+    validate_version_component(new_version)?;
+
+    // Rewrite the tail of a copy in place
+    let mut transformed = trn.clone();
+    transformed.set_version(new_version.to_string());
+    Ok(transformed)
 }
 
 /// Group TRNs by component
 pub fn group_trns_by_platform(trns: &[String]) -> HashMap<String, Vec<String>> {
-    let mut groups = HashMap::new();
-    
+    group_trns_by(trns, |trn| Some(trn.platform()))
+}
+
+/// Group valid TRNs under the key returned by `key`, skipping TRNs for which it returns `None`
+///
+/// The key is only copied into an owned `String` the first time a group is seen,
+/// so large inputs with few distinct groups do one lookup and no allocation per TRN.
+fn group_trns_by<F>(trns: &[String], key: F) -> HashMap<String, Vec<String>>
+where
+    F: Fn(&Trn) -> Option<&str>,
+{
+    let mut groups: HashMap<String, Vec<String>> = HashMap::new();
+
     for trn_str in trns {
-        if let Ok(trn) = Trn::parse(trn_str) {
-            groups
-                .entry(trn.platform().to_string())
-                .or_insert_with(Vec::new)
-                .push(trn_str.clone());
+        if let Some(trn) = try_parse_trn(trn_str) {
+            if let Some(key) = key(&trn) {
+                if let Some(group) = groups.get_mut(key) {
+                    group.push(trn_str.clone());
+                } else {
+                    groups.insert(key.to_string(), vec![trn_str.clone()]);
+                }
+            }
         }
     }
-    
+
     groups
 }
 
 /// Group TRNs by resource type
 pub fn group_trns_by_resource_type(trns: &[String]) -> HashMap<String, Vec<String>> {
-    let mut groups = HashMap::new();
-    
-    for trn_str in trns {
-        if let Ok(trn) = Trn::parse(trn_str) {
-            groups
-                .entry(trn.resource_type().to_string())
-                .or_insert_with(Vec::new)
-                .push(trn_str.clone());
-        }
-    }
-    
-    groups
+    group_trns_by(trns, |trn| Some(trn.resource_type()))
 }
 
 /// Group TRNs by version
 pub fn group_trns_by_version(trns: &[String]) -> HashMap<String, Vec<String>> {
-    let mut groups = HashMap::new();
-    
-    for trn_str in trns {
-        if let Ok(trn) = Trn::parse(trn_str) {
-            groups
-                .entry(trn.version().to_string())
-                .or_insert_with(Vec::new)
-                .push(trn_str.clone());
-        }
-    }
-    
-    groups
+    group_trns_by(trns, |trn| Some(trn.version()))
 }
 
 /// TRN statistics
@@ -427,6 +554,15 @@ pub struct TrnStatistics {
     pub average_length: f64,
 }
 
+/// Increment the count for `key`, copying it into an owned `String` only the first time it is seen
+pub(crate) fn count_occurrence(counts: &mut HashMap<String, usize>, key: &str) {
+    if let Some(count) = counts.get_mut(key) {
+        *count += 1;
+    } else {
+        counts.insert(key.to_string(), 1);
+    }
+}
+
 /// Calculate statistics for a collection of TRNs
 pub fn calculate_trn_statistics(trns: &[String]) -> TrnStatistics {
     let mut platforms = HashMap::new();
@@ -437,10 +573,10 @@ pub fn calculate_trn_statistics(trns: &[String]) -> TrnStatistics {
     for trn_str in trns {
         total_length += trn_str.len();
         
-        if let Ok(trn) = Trn::parse(trn_str) {
-            *platforms.entry(trn.platform().to_string()).or_insert(0) += 1;
-            *resource_types.entry(trn.resource_type().to_string()).or_insert(0) += 1;
-            *versions.entry(trn.version().to_string()).or_insert(0) += 1;
+        if let Some(trn) = try_parse_trn(trn_str) {
+            count_occurrence(&mut platforms, trn.platform());
+            count_occurrence(&mut resource_types, trn.resource_type());
+            count_occurrence(&mut versions, trn.version());
         }
     }
     
@@ -477,11 +613,13 @@ pub fn calculate_trn_statistics(trns: &[String]) -> TrnStatistics {
 
 /// Extract unique component values
 pub fn extract_unique_platforms(trns: &[String]) -> Vec<String> {
-    let mut platforms = std::collections::HashSet::new();
+    let mut platforms = std::collections::HashSet::<String>::new();
     
     for trn_str in trns {
-        if let Ok(trn) = Trn::parse(trn_str) {
-            platforms.insert(trn.platform().to_string());
+        if let Some(trn) = try_parse_trn(trn_str) {
+            if !platforms.contains(trn.platform()) {
+                platforms.insert(trn.platform().to_string());
+            }
         }
     }
     
@@ -492,11 +630,13 @@ pub fn extract_unique_platforms(trns: &[String]) -> Vec<String> {
 
 /// Extract unique resource types
 pub fn extract_unique_resource_types(trns: &[String]) -> Vec<String> {
-    let mut resource_types = std::collections::HashSet::new();
+    let mut resource_types = std::collections::HashSet::<String>::new();
     
     for trn_str in trns {
-        if let Ok(trn) = Trn::parse(trn_str) {
-            resource_types.insert(trn.resource_type().to_string());
+        if let Some(trn) = try_parse_trn(trn_str) {
+            if !resource_types.contains(trn.resource_type()) {
+                resource_types.insert(trn.resource_type().to_string());
+            }
         }
     }
     
@@ -506,26 +646,34 @@ pub fn extract_unique_resource_types(trns: &[String]) -> Vec<String> {
 }
 
 /// Extract unique versions and sort them semantically
+///
+/// Valid TRNs end in their version, so versions are sliced off the input
+/// strings, and each distinct version is parsed once into a borrowed sort key
+/// rather than on both sides of every comparison.
 pub fn extract_unique_versions(trns: &[String]) -> Vec<String> {
-    let mut versions = std::collections::HashSet::new();
-    
+    let mut versions = std::collections::HashSet::<&str>::new();
+
     for trn_str in trns {
-        if let Ok(trn) = Trn::parse(trn_str) {
-            versions.insert(trn.version().to_string());
+        if !is_valid_trn(trn_str) {
+            continue;
+        }
+        if let Some((_, version)) = trn_str.rsplit_once(':') {
+            versions.insert(version);
         }
     }
-    
-    let mut result: Vec<String> = versions.into_iter().collect();
-    
+
+    let mut keyed: Vec<(Option<SemverRef<'_>>, &str)> = versions
+        .into_iter()
+        .map(|version| (SemverRef::parse(version), version))
+        .collect();
+
     // Sort semantically
-    result.sort_by(|a, b| {
-        match (SemanticVersion::parse(a), SemanticVersion::parse(b)) {
-            (Ok(v1), Ok(v2)) => v1.cmp(&v2),
-            _ => a.cmp(b), // Fallback to string comparison
-        }
+    keyed.sort_by(|(va, a), (vb, b)| match (va, vb) {
+        (Some(v1), Some(v2)) => v1.compare(v2),
+        _ => a.cmp(b), // Fallback to string comparison
     });
-    
-    result
+
+    keyed.into_iter().map(|(_, version)| version.to_string()).collect()
 }
 
 /// Convert TRN to different formats
@@ -567,41 +715,86 @@ pub enum TrnFormat {
 }
 
 /// Deduplicate TRNs (keep only unique ones)
+///
+/// The seen-set borrows from the input, so each distinct TRN is copied once,
+/// into the result, however many times it repeats.
 pub fn deduplicate_trns(trns: &[String]) -> Vec<String> {
-    let mut seen = std::collections::HashSet::new();
+    let mut seen = std::collections::HashSet::<&str>::with_capacity(trns.len());
     let mut result = Vec::new();
-    
+
     for trn in trns {
-        if seen.insert(trn.clone()) {
+        if seen.insert(trn.as_str()) {
             result.push(trn.clone());
         }
     }
-    
+
     result
 }
 
 /// Sort TRNs by various criteria
 pub fn sort_trns(trns: &mut [String], sort_by: TrnSortCriteria) {
-    trns.sort_by(|a, b| {
-        let trn_a = Trn::parse(a);
-        let trn_b = Trn::parse(b);
-        
-        match (trn_a, trn_b) {
-            (Ok(ta), Ok(tb)) => match sort_by {
+    sort_by_parsed(
+        trns,
+        |trn| match sort_by {
+            TrnSortCriteria::Version => version_key(trn),
+            _ => (trn, None),
+        },
+        |a, b| {
+            let (ta, tb) = (&a.0, &b.0);
+            match sort_by {
                 TrnSortCriteria::Platform => ta.platform().cmp(tb.platform()),
                 TrnSortCriteria::ResourceType => ta.resource_type().cmp(tb.resource_type()),
                 TrnSortCriteria::InstanceId => ta.resource_id().cmp(tb.resource_id()),
-                TrnSortCriteria::Version => {
-                    match (SemanticVersion::parse(ta.version()), SemanticVersion::parse(tb.version())) {
-                        (Ok(v1), Ok(v2)) => v1.cmp(&v2),
-                        _ => ta.version().cmp(tb.version()),
-                    }
-                }
-                TrnSortCriteria::Length => ta.to_string().len().cmp(&tb.to_string().len()),
-            },
-            _ => a.cmp(b), // Fallback to string comparison
-        }
+                TrnSortCriteria::Version => compare_version_keys(a, b),
+                TrnSortCriteria::Length => ta.as_str().len().cmp(&tb.as_str().len()),
+            }
+        },
+        |a, b| a.cmp(b), // Fallback to string comparison
+    );
+}
+
+/// Pair a TRN with its semantic version, parsed once for version sorts
+fn version_key(trn: Trn) -> (Trn, Option<SemanticVersion>) {
+    let semver = SemanticVersion::parse(trn.version()).ok();
+    (trn, semver)
+}
+
+/// Order version keys semantically, falling back to the raw version strings
+fn compare_version_keys(
+    (ta, va): &(Trn, Option<SemanticVersion>),
+    (tb, vb): &(Trn, Option<SemanticVersion>),
+) -> Ordering {
+    match (va, vb) {
+        (Some(v1), Some(v2)) => v1.cmp(v2),
+        _ => ta.version().cmp(tb.version()),
+    }
+}
+
+/// Stable-sort TRN strings by a comparison of keys built from their parsed forms
+///
+/// Every string is parsed and turned into its key by `key` once up front, so
+/// the sort does N parses and key computations rather than O(N log N), and
+/// `compare` only looks at precomputed keys. Pairs where either side fails to
+/// parse are ordered by `fallback` on the raw strings.
+fn sort_by_parsed<K, F, C, G>(trns: &mut [String], key: F, compare: C, fallback: G)
+where
+    F: Fn(Trn) -> K,
+    C: Fn(&K, &K) -> Ordering,
+    G: Fn(&str, &str) -> Ordering,
+{
+    let mut keyed: Vec<(Option<K>, String)> = trns
+        .iter_mut()
+        .map(|trn_str| (try_parse_trn(trn_str).map(&key), std::mem::take(trn_str)))
+        .collect();
+
+    keyed.sort_by(|(ka, a), (kb, b)| match (ka, kb) {
+        (Some(ka), Some(kb)) => compare(ka, kb),
+        _ => fallback(a, b),
     });
+
+    for (slot, (_, trn_str)) in trns.iter_mut().zip(keyed) {
+        *slot = trn_str;
+    }
 }
 
 /// TRN sorting criteria
@@ -632,15 +825,15 @@ impl TrnSortCriteria {
 /// Generate TRN variants (different versions of the same base TRN)
 pub fn generate_trn_variants(base_trn: &str, versions: &[&str]) -> TrnResult<Vec<String>> {
     let trn = Trn::parse(base_trn)?;
-    let base = trn.base_trn();
+    // Everything before the version is shared by all variants
+    let head = &trn.as_str()[..trn.as_str().len() - trn.version().len()];
     
-    let mut variants = Vec::new();
+    let mut variants = Vec::with_capacity(versions.len());
     
+    // The base parsed, so each variant is valid iff its version is
     for version in versions {
-        let variant = crate::builder::TrnBuilder::from_trn(&base)
-            .version(*version)
-            .build()?;
-        variants.push(variant.to_string());
+        validate_version_component(version)?;
+        variants.push(format!("{}{}", head, version));
     }
     
     Ok(variants)
@@ -653,7 +846,7 @@ pub fn validate_trn_collection(trns: &[String]) -> TrnValidationSummary {
     let mut errors = Vec::new();
     
     for trn in trns {
-        match crate::validation::validate_trn_string(trn) {
+        match validate_trn_string(trn) {
             Ok(()) => valid += 1,
             Err(e) => {
                 invalid += 1;
@@ -717,13 +910,10 @@ pub fn transform_platform(
     new_platform: Platform, 
     scope: Option<&str>
 ) -> TrnResult<Trn> {
-    let mut new_trn = trn.clone();
-    new_trn.set_scope(scope.unwrap_or("").to_string());
-    
     // Create new TRN with the new platform
     Trn::new(
-        new_platform.to_string(),
-        scope.unwrap_or("").to_string(),
+        new_platform.as_str(),
+        scope.unwrap_or(""),
         trn.resource_type(),
         trn.resource_id(),
         trn.version()
@@ -754,47 +944,23 @@ pub fn get_fix_suggestions(error: &TrnError) -> Vec<String> {
 
 /// Group TRNs by scope
 pub fn group_by_scope(trns: &[String]) -> HashMap<String, Vec<String>> {
-    let mut groups = HashMap::new();
-    
-    for trn_str in trns {
-        if let Ok(trn) = Trn::parse(trn_str) {
-            let scope = trn.scope().to_string();
-            groups
-                .entry(scope)
-                .or_insert_with(Vec::new)
-                .push(trn_str.clone());
-        }
-    }
-    
-    groups
+    group_trns_by(trns, |trn| Some(trn.scope()))
 }
 
 /// Group TRNs by tool type
 pub fn group_by_tool_type(trns: &[String]) -> HashMap<String, Vec<String>> {
-    let mut groups = HashMap::new();
-    
-    for trn_str in trns {
-        if let Ok(trn) = Trn::parse(trn_str) {
-            if trn.resource_type() == "tool" {
-                groups
-                    .entry(trn.resource_type().to_string())
-                    .or_insert_with(Vec::new)
-                    .push(trn_str.clone());
-            }
+    group_trns_by(trns, |trn| {
+        if trn.resource_type() == "tool" {
+            Some(trn.resource_type())
+        } else {
+            None
         }
-    }
-    
-    groups
+    })
 }
 
 /// Filter TRNs by platform
 pub fn filter_by_platform(trns: &[Trn], platform: &crate::Platform) -> Vec<Trn> {
-    let platform_str = match platform {
-        crate::Platform::User => "user",
-        crate::Platform::Org => "org", 
-        crate::Platform::AiPlatform => "aiplatform",
-        crate::Platform::Custom(custom) => custom.as_str(),
-    };
+    let platform_str = platform.as_str();
     
     trns.iter()
         .filter(|trn| trn.platform() == platform_str)
@@ -837,48 +1003,33 @@ pub fn sort_trns_alphabetically(trns: &mut [String]) {
 
 /// Sort TRNs by version (semantic version aware)
 pub fn sort_trns_by_version(trns: &mut [String], reverse: bool) {
-    trns.sort_by(|a, b| {
-        let trn_a = Trn::parse(a);
-        let trn_b = Trn::parse(b);
-        
-        match (trn_a, trn_b) {
-            (Ok(ta), Ok(tb)) => {
-                let version_a = ta.version();
-                let version_b = tb.version();
-                
-                match (SemanticVersion::parse(version_a), SemanticVersion::parse(version_b)) {
-                    (Ok(v1), Ok(v2)) => {
-                        if reverse {
-                            v2.cmp(&v1)
-                        } else {
-                            v1.cmp(&v2)
-                        }
-                    }
-                    _ => {
-                        if reverse {
-                            version_b.cmp(version_a)
-                        } else {
-                            version_a.cmp(version_b)
-                        }
-                    }
-                }
+    sort_by_parsed(
+        trns,
+        version_key,
+        |a, b| {
+            if reverse {
+                compare_version_keys(b, a)
+            } else {
+                compare_version_keys(a, b)
             }
-            _ => {
-                if reverse {
-                    b.cmp(a)
-                } else {
-                    a.cmp(b)
-                }
+        },
+        |a, b| {
+            if reverse {
+                b.cmp(a)
+            } else {
+                a.cmp(b)
             }
-        }
-    });
+        },
+    );
 }
 
 /// Check if a version string is a common alias
 fn is_common_alias(version: &str) -> bool {
-    let common_aliases = ["latest", "stable", "beta", "alpha", "dev", "main", "master", 
-                         "current", "next", "preview", "rc", "snapshot", "nightly"];
-    common_aliases.contains(&version)
+    matches!(
+        version,
+        "latest" | "stable" | "beta" | "alpha" | "dev" | "main" | "master"
+            | "current" | "next" | "preview" | "rc" | "snapshot" | "nightly"
+    )
 }
 
 #[cfg(test)]
@@ -895,15 +1046,71 @@ mod tests {
         assert_eq!(version.build, Some("build.1".to_string()));
     }
 
+    #[test]
+    fn test_semantic_version_cache_returns_equal_version() {
+        let first = SemanticVersion::parse("v3.1.4-rc.1").unwrap();
+        let cached = SemanticVersion::parse("v3.1.4-rc.1").unwrap();
+        assert_eq!(first, cached);
+        assert!(SemanticVersion::parse("v3.1").is_err());
+        assert!(SemanticVersion::parse("v3.1").is_err());
+    }
+
+    #[test]
+    fn test_split_semver_grammar() {
+        assert_eq!(split_semver("1.2.3"), Some((["1", "2", "3"], None, None)));
+        assert_eq!(
+            split_semver("10.0.1-rc.1-x+build.5-a"),
+            Some((["10", "0", "1"], Some("rc.1-x"), Some("build.5-a")))
+        );
+        for invalid in ["1.2", "1.2.3.4", "1..3", "1.2.3-", "1.2.3+", "1.2.x", "1.2.3+a+b", "1.2.3-a_b", "١.2.3"] {
+            assert_eq!(split_semver(invalid), None, "{}", invalid);
+        }
+        assert!(SemanticVersion::parse("99999999999.0.0").is_err());
+
+        let long_prerelease = format!("1.2.3-{}!", "a.".repeat(50_000));
+        assert!(SemanticVersion::parse(&long_prerelease).is_err());
+    }
+
+    #[test]
+    fn test_is_semantic_version() {
+        assert!(is_semantic_version("1.2.3"));
+        assert!(is_semantic_version("v1.2.3-beta"));
+        assert!(!is_semantic_version("latest"));
+        assert!(!is_semantic_version("v"));
+        assert!(!is_semantic_version(""));
+        assert!(!is_semantic_version("1.2"));
+    }
+
     #[test]
     fn test_version_comparison() {
         assert!(compare_versions("v1.2.3", "v1.2.0", VersionOp::Greater));
         assert!(compare_versions("v1.2.3", "v1.2.3", VersionOp::Equal));
         assert!(compare_versions("v1.2.0", "v1.2.3", VersionOp::Less));
+        assert!(compare_versions("latest", "beta", VersionOp::Greater));
+        assert!(compare_versions("rc", "next", VersionOp::Equal));
+        assert!(!compare_versions("alpha", "stable", VersionOp::GreaterEqual));
         
         let v1 = SemanticVersion::parse("1.2.3").unwrap();
         let v2 = SemanticVersion::parse("1.2.0").unwrap();
         assert!(v1.is_compatible(&v2));
+
+        // Borrowed comparisons agree with the owned SemanticVersion ordering
+        let versions = ["1.0.0-alpha", "1.0.0-beta", "1.0.0", "v1.0.0+build", "1.2.0", "2.0.0-rc.1"];
+        for a in versions {
+            for b in versions {
+                let (sa, sb) = (SemanticVersion::parse(a).unwrap(), SemanticVersion::parse(b).unwrap());
+                assert_eq!(compare_versions(a, b, VersionOp::Greater), sa > sb, "{} > {}", a, b);
+                assert_eq!(compare_versions(a, b, VersionOp::LessEqual), sa <= sb, "{} <= {}", a, b);
+                assert_eq!(compare_versions(a, b, VersionOp::Equal), sa == sb, "{} == {}", a, b);
+                assert_eq!(
+                    compare_versions(a, b, VersionOp::CompatibleMajor),
+                    sa.is_major_compatible(&sb),
+                    "{} ^ {}",
+                    a,
+                    b
+                );
+            }
+        }
     }
 
     #[test]
@@ -916,6 +1123,17 @@ mod tests {
         
         let latest = find_latest_version(&trns).unwrap();
         assert!(latest.contains("v1.2.0"));
+
+        // Invalid TRNs and aliases are skipped; a release outranks its pre-release
+        let trns = vec![
+            "trn:user:alice:tool:myapi:v2.0.0-beta".to_string(),
+            "trn:user:alice:tool:myapi:latest".to_string(),
+            "not-a-trn:v9.0.0".to_string(),
+            "trn:user:alice:tool:myapi:v2.0.0".to_string(),
+            "trn:user:alice:tool:myapi:v1.9.9".to_string(),
+        ];
+        assert_eq!(find_latest_version(&trns).unwrap(), "trn:user:alice:tool:myapi:v2.0.0");
+        assert_eq!(find_latest_version(&[]), None);
     }
 
     #[test]
@@ -948,6 +1166,20 @@ mod tests {
         assert_eq!(stats.unique_resource_types, 2);
     }
 
+    #[test]
+    fn test_group_by_tool_type_skips_other_types() {
+        let trns = vec![
+            "trn:user:alice:tool:myapi:v1.0".to_string(),
+            "trn:org:company:dataset:mydata:latest".to_string(),
+            "not-a-trn".to_string(),
+            "trn:user:bob:tool:myscript:v2.0".to_string(),
+        ];
+
+        let groups = group_by_tool_type(&trns);
+        assert_eq!(groups.len(), 1);
+        assert_eq!(groups["tool"], vec![trns[0].clone(), trns[3].clone()]);
+    }
+
     #[test]
     fn test_extract_unique_components() {
         let trns = vec![
@@ -963,6 +1195,18 @@ mod tests {
         assert_eq!(resources, vec!["dataset", "tool"]);
     }
 
+    #[test]
+    fn test_deduplicate_trns() {
+        let trns = vec![
+            "trn:user:alice:tool:myapi:v1.0".to_string(),
+            "trn:user:bob:tool:myscript:v2.0".to_string(),
+            "trn:user:alice:tool:myapi:v1.0".to_string(),
+        ];
+
+        let unique = deduplicate_trns(&trns);
+        assert_eq!(unique, vec![trns[0].clone(), trns[1].clone()]);
+    }
+
     #[test]
     fn test_sort_trns() {
         let mut trns = vec![
@@ -976,6 +1220,45 @@ mod tests {
         
         sort_trns(&mut trns, TrnSortCriteria::InstanceId);
         assert!(trns[0].contains("myapi"));
+
+        // Unparseable entries are kept and ordered by their raw strings
+        let mut trns = vec![
+            "trn:user:bob:tool:myscript:v2.0".to_string(),
+            "not-a-trn".to_string(),
+            "trn:user:alice:tool:myapi:v1.10.0".to_string(),
+            "trn:user:alice:tool:myapi:v1.9.0".to_string(),
+        ];
+        sort_trns_by_version(&mut trns, false);
+        assert_eq!(trns.len(), 4);
+        assert!(trns.contains(&"not-a-trn".to_string()));
+        let v19 = trns.iter().position(|t| t.ends_with("v1.9.0")).unwrap();
+        let v110 = trns.iter().position(|t| t.ends_with("v1.10.0")).unwrap();
+        assert!(v19 < v110);
+
+        // Versions are compared semantically, with non-semver versions by string
+        let mut trns = vec![
+            "trn:user:alice:tool:myapi:v1.10.0".to_string(),
+            "trn:user:alice:tool:myapi:latest".to_string(),
+            "trn:user:alice:tool:myapi:v1.9.0".to_string(),
+        ];
+        sort_trns(&mut trns, TrnSortCriteria::Version);
+        assert!(trns[0].ends_with("latest"));
+        assert!(trns[1].ends_with("v1.9.0"));
+        assert!(trns[2].ends_with("v1.10.0"));
+        sort_trns_by_version(&mut trns, true);
+        assert!(trns[0].ends_with("v1.10.0"));
+        assert!(trns[1].ends_with("v1.9.0"));
+    }
+
+    #[test]
+    fn test_extract_unique_versions_sorts_semantically() {
+        let trns = vec![
+            "trn:user:alice:tool:myapi:v1.10.0".to_string(),
+            "trn:user:bob:tool:other:v1.9.0".to_string(),
+            "trn:user:alice:tool:myapi:v1.9.0".to_string(),
+            "not-a-trn".to_string(),
+        ];
+        assert_eq!(extract_unique_versions(&trns), vec!["v1.9.0", "v1.10.0"]);
     }
 
     #[test]
@@ -987,6 +1270,19 @@ mod tests {
         assert_eq!(variants.len(), 3);
         assert!(variants.iter().any(|v| v.contains("v2.0")));
         assert!(variants.iter().any(|v| v.contains("latest")));
+        assert_eq!(variants[0], "trn:user:alice:tool:myapi:v2.0");
+
+        assert!(generate_trn_variants(base, &["bad version"]).is_err());
+
+        let transformed = transform_version(&Trn::parse(base).unwrap(), "v2.0").unwrap();
+        assert_eq!(transformed.to_string(), variants[0]);
+        assert!(transform_version(&Trn::parse(base).unwrap(), "null").is_err());
+        assert!(transform_version(&Trn::parse(base).unwrap(), "v1:0").is_err());
+        assert!(transform_version(&Trn::parse(base).unwrap(), "").is_err());
+
+        // Unvalidated TRNs are still rejected when only the version is replaced
+        let unvalidated = Trn::from_parts("user", "alice", "widget", "myapi", "v1.0");
+        assert!(transform_version(&unvalidated, "v2.0").is_err());
     }
 
     #[test]
@@ -8,9 +8,11 @@ use serde::{Deserialize, Serialize};
 use std::sync::Arc;
 use std::time::{Duration, Instant};
 
+use crate::cache::insert_bounded;
 use crate::constants::*;
 use crate::error::{TrnError, TrnResult};
-use crate::types::Trn;
+use crate::parsing::{scan_trn, split_trn_components};
+use crate::types::{Trn, TrnComponents};
 
 /// Validation cache for performance optimization
 #[derive(Debug, Clone)]
@@ -38,55 +40,43 @@ impl ValidationCache {
 
     /// Get cached validation result
     pub fn get(&self, key: &str) -> Option<bool> {
-        if let Some(entry) = self.cache.get(key) {
-            if entry.timestamp.elapsed() < self.ttl {
-                return Some(entry.result);
-            } else {
-                // Entry expired, remove it
-                self.cache.remove(key);
-            }
+        // Copy the entry out so the shard lock is released before any removal;
+        // removing while the read guard is alive would deadlock on the shard
+        let (result, fresh) = match self.cache.get(key) {
+            Some(entry) => (entry.result, entry.timestamp.elapsed() < self.ttl),
+            None => return None,
+        };
+
+        if fresh {
+            return Some(result);
         }
+
+        // Entry expired, remove it unless it was refreshed in the meantime
+        self.cache.remove_if(key, |_, entry| entry.timestamp.elapsed() >= self.ttl);
         None
     }
 
     /// Insert validation result into cache
+    ///
+    /// When the cache is full, expired entries are dropped first and, if that
+    /// frees nothing, a quarter of the entries are evicted.
     pub fn insert(&self, key: String, result: bool) {
-        // If cache is full, remove oldest entries
         if self.cache.len() >= self.max_size {
             self.cleanup_expired();
-            
-            if self.cache.len() >= self.max_size {
-                // Remove some entries to make space
-                let keys_to_remove: Vec<String> = self.cache
-                    .iter()
-                    .take(self.max_size / 4)
-                    .map(|entry| entry.key().clone())
-                    .collect();
-                
-                for key in keys_to_remove {
-                    self.cache.remove(&key);
-                }
-            }
         }
 
-        self.cache.insert(key, CacheEntry {
+        let entry = CacheEntry {
             result,
             timestamp: Instant::now(),
-        });
+        };
+        insert_bounded(&self.cache, self.max_size, key, entry);
     }
 
     /// Remove expired entries
     fn cleanup_expired(&self) {
         let now = Instant::now();
-        let expired_keys: Vec<String> = self.cache
-            .iter()
-            .filter(|entry| now.duration_since(entry.timestamp) >= self.ttl)
-            .map(|entry| entry.key().clone())
-            .collect();
-
-        for key in expired_keys {
-            self.cache.remove(&key);
-        }
+        self.cache
+            .retain(|_, entry| now.duration_since(entry.timestamp) < self.ttl);
     }
 
     /// Clear all cached entries
@@ -116,6 +106,11 @@ static VALIDATION_CACHE: once_cell::sync::Lazy<ValidationCache> = once_cell::syn
     ValidationCache::new(VALIDATION_CACHE_SIZE, VALIDATION_CACHE_TTL_SECONDS)
 });
 
+/// Clear all cached validation results
+pub fn clear_validation_cache() {
+    VALIDATION_CACHE.clear();
+}
+
 /// Validation statistics
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct ValidationStats {
@@ -130,51 +125,98 @@ pub struct ValidationStats {
 }
 
 /// Validate a TRN string
+///
+/// Every valid TRN passes the byte scanner, so malformed input is rejected
+/// there without building the detailed error that is about to be discarded,
+/// and accepted input is checked against the rules from that same scan.
 pub fn is_valid_trn(input: &str) -> bool {
-    validate_trn_string(input).is_ok()
+    match scan_trn(input) {
+        Some(components) => validate_scanned(input, &components).is_ok(),
+        None => false,
+    }
 }
 
 /// Validate a TRN string with detailed error information
+///
+/// Successful validations are cached by input string, which also covers
+/// `Trn` construction since TRNs validate their canonical string. Failures
+/// are not cached, so every rejection reports the specific rule that failed.
 pub fn validate_trn_string(input: &str) -> TrnResult<()> {
+    // Input without the prefix or outside the length bounds can never have
+    // been cached as valid, so it skips hashing for the cache lookup
+    if !input.starts_with("trn:") || !(TRN_MIN_LENGTH..=TRN_MAX_LENGTH).contains(&input.len()) {
+        return validate_trn_string_impl(input);
+    }
+
+    cached_validation(input, || validate_trn_string_impl(input))
+}
+
+/// Validate components that [`scan_trn`] has already accepted for `input`
+///
+/// The scan covers the prefix, separators, lengths and byte grammar, so only
+/// the reserved-word and business rules are left to check. Callers that have
+/// just scanned the input use this rather than [`validate_trn_string`], which
+/// would scan it a second time. Results share the validation cache.
+pub(crate) fn validate_scanned(input: &str, components: &TrnComponents<'_>) -> TrnResult<()> {
+    cached_validation(input, || validate_scanned_rules(components, input))
+}
+
+/// Run `validate` for `input` unless it is already known to be valid, caching success
+fn cached_validation<F>(input: &str, validate: F) -> TrnResult<()>
+where
+    F: FnOnce() -> TrnResult<()>,
+{
     // Check cache first
-    if let Some(cached_result) = VALIDATION_CACHE.get(input) {
-        return if cached_result {
-            Ok(())
-        } else {
-            Err(TrnError::validation("TRN is invalid (cached)".to_string(), "cached".to_string(), Some(input.to_string())))
-        };
+    if VALIDATION_CACHE.get(input) == Some(true) {
+        return Ok(());
     }
 
     // Perform validation
-    let result = validate_trn_string_impl(input);
+    let result = validate();
     
     // Cache the result
-    VALIDATION_CACHE.insert(input.to_string(), result.is_ok());
+    if result.is_ok() {
+        VALIDATION_CACHE.insert(input.to_string(), true);
+    }
     
     result
 }
 
 /// Internal validation implementation
 fn validate_trn_string_impl(input: &str) -> TrnResult<()> {
+    // One scan checks the prefix, separators, lengths and every component's
+    // byte grammar; only inputs it rejects go through the detailed checks
+    if let Some(components) = scan_trn(input) {
+        return validate_scanned_rules(&components, input);
+    }
+
     // Basic format validation
     validate_basic_format(input)?;
-    
+
     // Length validation
     validate_length(input)?;
-    
-    // Component validation
-    validate_components(input)?;
+
+    // Component validation, keeping the split components for the rules below
+    let components = validate_components(input)?;
     
     // Business rules validation
-    validate_business_rules(input)?;
+    validate_business_rules(&components, input)?;
     
     Ok(())
 }
 
+/// Rules left to check once the byte scanner has accepted a TRN
+///
+/// Unlike [`validate_scanned`] this neither consults nor fills the validation
+/// cache, for bulk loads whose inputs are not looked up again.
+pub(crate) fn validate_scanned_rules(components: &TrnComponents<'_>, input: &str) -> TrnResult<()> {
+    validate_reserved_words(components)?;
+    validate_business_rules(components, input)
+}
+
 /// Validate TRN structure (for already parsed TRN objects)
 pub fn validate_trn_struct(trn: &Trn) -> TrnResult<()> {
-    let trn_string = trn.to_string();
-    validate_trn_string(&trn_string)
+    validate_trn_string(trn.as_str())
 }
 
 /// Validate basic TRN format
@@ -202,19 +244,11 @@ fn validate_basic_format(input: &str) -> TrnResult<()> {
         ));
     }
 
-    // Basic regex validation
-    if !TRN_REGEX.is_match(input) {
-        return Err(TrnError::format(
-            "Invalid TRN format. Expected: trn:platform:scope:resource_type:resource_id:version".to_string(),
-            Some(input.to_string()),
-        ));
-    }
-
     Ok(())
 }
 
 /// Validate TRN length
-fn validate_length(input: &str) -> TrnResult<()> {
+pub(crate) fn validate_length(input: &str) -> TrnResult<()> {
     let len = input.len();
     
     if len < TRN_MIN_LENGTH {
@@ -239,34 +273,79 @@ fn validate_length(input: &str) -> TrnResult<()> {
 }
 
 /// Validate individual TRN components
-fn validate_components(input: &str) -> TrnResult<()> {
-    let components = crate::parsing::parse_trn_components(input)?;
-    
-    // Validate platform
-    validate_component(components.platform, "platform", &PLATFORM_REGEX, PLATFORM_MAX_LENGTH)?;
-    
-    // Validate scope (required in simplified format)
-    validate_component(components.scope, "scope", &SCOPE_REGEX, SCOPE_MAX_LENGTH)?;
-    
-    // Validate resource type
-    validate_component(components.resource_type, "resource_type", &RESOURCE_TYPE_REGEX, RESOURCE_TYPE_MAX_LENGTH)?;
-    
-    // Validate resource ID
-    validate_component(components.resource_id, "resource_id", &RESOURCE_ID_REGEX, RESOURCE_ID_MAX_LENGTH)?;
-    
-    // Validate version
-    validate_component(components.version, "version", &VERSION_REGEX, VERSION_MAX_LENGTH)?;
-    
+///
+/// This is the slow path for input the scanner rejected: each component is
+/// checked on its own, so failures report the offending component rather than
+/// a whole-string mismatch.
+///
+/// Returns the components so later checks can reuse them without rescanning.
+/// The input is split directly: the scanner has already rejected it, so
+/// trying it again first could only repeat that failed pass.
+fn validate_components(input: &str) -> TrnResult<TrnComponents<'_>> {
+    let components = split_trn_components(input)?;
+
+    let values = [
+        components.platform,
+        components.scope,
+        components.resource_type,
+        components.resource_id,
+        components.version,
+    ];
+
+    for (index, value) in values.into_iter().enumerate() {
+        validate_component(value, index)?;
+    }
+
+    Ok(components)
+}
+
+/// Reject reserved words in components whose byte grammar already passed
+fn validate_reserved_words(components: &TrnComponents<'_>) -> TrnResult<()> {
+    let values = [
+        components.platform,
+        components.scope,
+        components.resource_type,
+        components.resource_id,
+        components.version,
+    ];
+
+    for (index, value) in values.into_iter().enumerate() {
+        if is_reserved_word(value) {
+            return Err(TrnError::validation(
+                format!("{} '{}' is a reserved word", COMPONENT_NAMES[index], value),
+                "reserved_word".to_string(),
+                None,
+            ));
+        }
+    }
+
     Ok(())
 }
 
-/// Validate a single component
-fn validate_component(
-    value: &str,
-    component_name: &str,
-    regex: &regex::Regex,
-    max_length: usize,
-) -> TrnResult<()> {
+/// Validate a replacement version for an already valid TRN
+///
+/// No business rule depends on the version, so swapping in a new version keeps
+/// a valid TRN valid exactly when the version passes its own component checks;
+/// the rest of the TRN need not be validated again.
+pub(crate) fn validate_version_component(version: &str) -> TrnResult<()> {
+    validate_component(version, COMPONENT_NAMES.len() - 1)
+}
+
+/// Validate a single component, identified by its position within the TRN
+fn validate_component(value: &str, index: usize) -> TrnResult<()> {
+    // Supported platforms and resource types are well-formed and never reserved
+    let is_known = match index {
+        0 => is_valid_platform(value),
+        2 => is_valid_resource_type(value),
+        _ => false,
+    };
+    if is_known {
+        return Ok(());
+    }
+
+    let component_name = COMPONENT_NAMES[index];
+    let max_length = COMPONENT_MAX_LENGTHS[index];
+
     if value.is_empty() {
         return Err(TrnError::component(
             format!("{} cannot be empty", component_name),
@@ -284,7 +363,7 @@ fn validate_component(
         ));
     }
     
-    if !regex.is_match(value) {
+    if !COMPONENT_CHARSETS[index].matches(value) {
         return Err(TrnError::component(
             format!("{} contains invalid characters or format", component_name),
             component_name.to_string(),
@@ -293,11 +372,7 @@ fn validate_component(
     }
     
     // Check for reserved words
-    if RESERVED_PLATFORMS.contains(value) || 
-       RESERVED_SCOPES.contains(value) || 
-       RESERVED_RESOURCE_TYPES.contains(value) ||
-       RESERVED_RESOURCE_IDS.contains(value) ||
-       RESERVED_VERSIONS.contains(value) {
+    if is_reserved_word(value) {
         return Err(TrnError::validation(
             format!("{} '{}' is a reserved word", component_name, value),
             "reserved_word".to_string(),
@@ -309,11 +384,9 @@ fn validate_component(
 }
 
 /// Validate business rules for simplified format
-fn validate_business_rules(input: &str) -> TrnResult<()> {
-    let components = crate::parsing::parse_trn_components(input)?;
-    
+fn validate_business_rules(components: &TrnComponents<'_>, input: &str) -> TrnResult<()> {
     // Validate resource type support
-    if !VALID_RESOURCE_TYPES.contains(components.resource_type) {
+    if !is_valid_resource_type(components.resource_type) {
         return Err(TrnError::validation(
             format!("Resource type '{}' is not supported", components.resource_type),
             "resource_type_support".to_string(),
@@ -322,7 +395,7 @@ fn validate_business_rules(input: &str) -> TrnResult<()> {
     }
     
     // Validate scope requirements based on platform
-    validate_scope_requirements(&components, input)?;
+    validate_scope_requirements(components, input)?;
     
     // Validate version format
     validate_version_format(components.version, input)?;
@@ -331,9 +404,12 @@ fn validate_business_rules(input: &str) -> TrnResult<()> {
 }
 
 /// Validate scope requirements based on platform (simplified for new format)
-fn validate_scope_requirements(components: &crate::types::TrnComponents<'_>, input: &str) -> TrnResult<()> {
+fn validate_scope_requirements(components: &TrnComponents<'_>, input: &str) -> TrnResult<()> {
+    // Read the scope length once; every platform rule below is a bounds check on it
+    let scope_len = components.scope.len();
+
     // In the simplified format, scope is always required but check platform-specific rules
-    if components.scope.is_empty() {
+    if scope_len == 0 {
         return Err(TrnError::validation(
             "Scope cannot be empty in simplified TRN format".to_string(),
             "scope_required".to_string(),
@@ -342,60 +418,41 @@ fn validate_scope_requirements(components: &crate::types::TrnComponents<'_>, inp
     }
 
     // Platform-specific scope validation
-    match components.platform {
-        "user" => {
-            // User scope should be a valid username
-            if components.scope.len() < 2 || components.scope.len() > 32 {
-                                 return Err(TrnError::validation(
-                     "User scope must be between 2 and 32 characters".to_string(),
-                     "scope_length".to_string(),
-                     Some(input.to_string()),
-                 ));
-            }
-        }
-        "org" => {
-            // Organization scope should be a valid organization name
-            if components.scope.len() < 2 || components.scope.len() > 32 {
-                                 return Err(TrnError::validation(
-                     "Organization scope must be between 2 and 32 characters".to_string(),
-                     "scope_length".to_string(),
-                     Some(input.to_string()),
-                 ));
-            }
-        }
-        "aiplatform" => {
-            // AI platform typically uses system-level scopes
-            if components.scope.len() > 32 {
-                                 return Err(TrnError::validation(
-                     "AI platform scope must not exceed 32 characters".to_string(),
-                     "scope_length".to_string(),
-                     Some(input.to_string()),
-                 ));
-            }
+    let message = match components.platform {
+        // User scope should be a valid username
+        "user" if !(2..=32).contains(&scope_len) => {
+            "User scope must be between 2 and 32 characters"
         }
-        _ => {
-            // Custom platforms have flexible scope requirements
+        // Organization scope should be a valid organization name
+        "org" if !(2..=32).contains(&scope_len) => {
+            "Organization scope must be between 2 and 32 characters"
         }
-    }
-    
-    Ok(())
+        // AI platform typically uses system-level scopes
+        "aiplatform" if scope_len > 32 => "AI platform scope must not exceed 32 characters",
+        // Custom platforms have flexible scope requirements
+        _ => return Ok(()),
+    };
+
+    Err(TrnError::validation(
+        message.to_string(),
+        "scope_length".to_string(),
+        Some(input.to_string()),
+    ))
 }
 
 /// Validate version format
+///
+/// Common aliases (`latest`, `stable`, ...) and numbered versions are both
+/// accepted by the byte grammar, which every caller has already applied, so
+/// the only rule left is a single emptiness check rather than an alias
+/// lookup followed by a pattern check.
 fn validate_version_format(version: &str, input: &str) -> TrnResult<()> {
-    // Check if it's a common version alias
-    let common_aliases = ["latest", "stable", "beta", "alpha", "dev", "main", "master"];
-    if common_aliases.contains(&version) {
-        return Ok(());
-    }
-    
-    // Check basic version pattern (already validated by regex, but add semantic checks)
     if version.is_empty() {
-                 return Err(TrnError::validation(
-             "Version cannot be empty".to_string(),
-             "version_empty".to_string(),
-             Some(input.to_string()),
-         ));
+        return Err(TrnError::validation(
+            "Version cannot be empty".to_string(),
+            "version_empty".to_string(),
+            Some(input.to_string()),
+        ));
     }
 
     // Additional version format validation can be added here
@@ -403,10 +460,58 @@ fn validate_version_format(version: &str, input: &str) -> TrnResult<()> {
 }
 
 /// Batch validation of multiple TRNs
+///
+/// Results are returned in input order. Batches of 4096 or more TRNs are
+/// validated on scoped threads, one contiguous chunk per available core.
 pub fn validate_multiple_trns(trns: &[String]) -> Vec<TrnResult<()>> {
-    trns.iter()
-        .map(|trn| validate_trn_string(trn))
-        .collect()
+    map_chunks(trns, |chunk| {
+        chunk.iter()
+            .map(|trn| validate_trn_string(trn))
+            .collect()
+    })
+}
+
+/// Batch validity check of multiple TRNs
+///
+/// Like [`validate_multiple_trns`], but each TRN goes through
+/// [`is_valid_trn`], so malformed input is rejected by the scanner without
+/// building an error that would only be discarded. Results are in input order.
+pub fn are_valid_trns(trns: &[String]) -> Vec<bool> {
+    map_chunks(trns, |chunk| {
+        chunk.iter()
+            .map(|trn| is_valid_trn(trn))
+            .collect()
+    })
+}
+
+/// Apply `f` to `trns` and concatenate its output in input order
+///
+/// Large inputs are split into one contiguous chunk per available core and
+/// processed on scoped threads; validation shares only the concurrent
+/// caches, so the chunks are independent.
+fn map_chunks<R, F>(trns: &[String], f: F) -> Vec<R>
+where
+    R: Send,
+    F: Fn(&[String]) -> Vec<R> + Sync,
+{
+    let workers = std::thread::available_parallelism().map_or(1, |n| n.get());
+    if trns.len() < PARALLEL_VALIDATION_THRESHOLD || workers < 2 {
+        return f(trns);
+    }
+
+    let chunk_size = (trns.len() + workers - 1) / workers;
+    let f = &f;
+    std::thread::scope(|scope| {
+        let handles: Vec<_> = trns
+            .chunks(chunk_size)
+            .map(|chunk| scope.spawn(move || f(chunk)))
+            .collect();
+
+        handles
+            .into_iter()
+            .flat_map(|handle| handle.join().expect("validation worker panicked"))
+            .collect()
+    })
 }
 
 /// Validation report for batch operations
@@ -427,17 +532,19 @@ pub struct ValidationReport {
 /// Generate a validation report for multiple TRNs
 pub fn generate_validation_report(trns: &[String]) -> ValidationReport {
     let start_time = std::time::Instant::now();
-    let results = validate_multiple_trns(trns);
+    // Only failures are kept, so a mostly-valid batch stores almost nothing
+    let failures: Vec<TrnError> = map_chunks(trns, |chunk| {
+        chunk.iter()
+            .filter_map(|trn| validate_trn_string(trn).err())
+            .collect()
+    });
     let duration = start_time.elapsed();
     
-    let total = results.len();
-    let valid = results.iter().filter(|r| r.is_ok()).count();
-    let invalid = total - valid;
-    
-    let errors: Vec<String> = results
-        .iter()
-        .filter_map(|r| r.as_ref().err().map(|e| e.to_string()))
-        .collect();
+    let total = trns.len();
+    let invalid = failures.len();
+    let valid = total - invalid;
+    // Render each error exactly once, outside the timed section
+    let errors: Vec<String> = failures.iter().map(ToString::to_string).collect();
     
     let stats = ValidationStats {
         duration_ms: duration.as_millis() as u64,
@@ -460,31 +567,31 @@ pub fn generate_validation_report(trns: &[String]) -> ValidationReport {
 }
 
 /// Check if TRN components are well-formed
-pub fn check_component_format(components: &crate::types::TrnComponents<'_>) -> Vec<String> {
+pub fn check_component_format(components: &TrnComponents<'_>) -> Vec<String> {
     let mut issues = Vec::new();
     
     // Check platform format
-    if !PLATFORM_REGEX.is_match(components.platform) {
+    if !PLATFORM_CHARSET.matches(components.platform) {
         issues.push(format!("Platform '{}' has invalid format", components.platform));
     }
     
     // Check scope format
-    if !SCOPE_REGEX.is_match(components.scope) {
+    if !SCOPE_CHARSET.matches(components.scope) {
         issues.push(format!("Scope '{}' has invalid format", components.scope));
     }
     
     // Check resource type format
-    if !RESOURCE_TYPE_REGEX.is_match(components.resource_type) {
+    if !RESOURCE_TYPE_CHARSET.matches(components.resource_type) {
         issues.push(format!("Resource type '{}' has invalid format", components.resource_type));
     }
     
     // Check resource ID format
-    if !RESOURCE_ID_REGEX.is_match(components.resource_id) {
+    if !RESOURCE_ID_CHARSET.matches(components.resource_id) {
         issues.push(format!("Resource ID '{}' has invalid format", components.resource_id));
     }
     
     // Check version format
-    if !VERSION_REGEX.is_match(components.version) {
+    if !VERSION_CHARSET.matches(components.version) {
         issues.push(format!("Version '{}' has invalid format", components.version));
     }
     
@@ -520,6 +627,23 @@ pub fn validate_performance_batch(trns: &[String], max_duration_ms: u64) -> Vali
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_validation_cache_expiry_and_eviction() {
+        // Expired entries are dropped on lookup
+        let cache = ValidationCache::new(4, 0);
+        cache.insert("trn:user:alice:tool:myapi:v1.0".to_string(), true);
+        assert_eq!(cache.get("trn:user:alice:tool:myapi:v1.0"), None);
+        assert_eq!(cache.stats().total_entries, 0);
+
+        // A full cache makes room before inserting
+        let cache = ValidationCache::new(4, 300);
+        for index in 0..5 {
+            cache.insert(format!("trn:user:alice:tool:api{}:v1.0", index), true);
+        }
+        assert!(cache.stats().total_entries <= 4);
+        assert_eq!(cache.get("trn:user:alice:tool:api4:v1.0"), Some(true));
+    }
+
     #[test]
     fn test_valid_trn() {
         assert!(validate_trn_string("trn:user:alice:tool:myapi:v1.0").is_ok());
@@ -553,6 +677,65 @@ mod tests {
         // Test reserved scopes
         assert!(validate_trn_string("trn:user:null:tool:myapi:v1.0").is_err());
         assert!(validate_trn_string("trn:user:undefined:tool:myapi:v1.0").is_err());
+
+        // Every component position is checked and reported
+        let cases = [
+            ("trn:null:alice:tool:myapi:v1.0", "platform"),
+            ("trn:user:null:tool:myapi:v1.0", "scope"),
+            ("trn:user:alice:null:myapi:v1.0", "resource_type"),
+            ("trn:user:alice:tool:null:v1.0", "resource_id"),
+            ("trn:user:alice:tool:myapi:null", "version"),
+        ];
+        for (input, component) in cases {
+            match validate_trn_string_impl(input).unwrap_err() {
+                TrnError::Validation { rule, message, .. } => {
+                    assert_eq!(rule, "reserved_word");
+                    assert!(message.starts_with(component), "{}", message);
+                }
+                other => panic!("unexpected error for {}: {:?}", input, other),
+            }
+        }
+
+        // Reserved words match case-sensitively; the grammar accepts uppercase
+        assert!(validate_trn_string("trn:user:NULL:tool:myapi:v1.0").is_ok());
+        assert!(validate_trn_string("trn:user:alice:tool:Void:v1.0").is_ok());
+    }
+
+    #[test]
+    fn test_scope_requirements_by_platform() {
+        for input in ["trn:user:a:tool:myapi:v1.0", "trn:org:a:tool:myapi:v1.0"] {
+            match validate_trn_string_impl(input).unwrap_err() {
+                TrnError::Validation { rule, .. } => assert_eq!(rule, "scope_length"),
+                other => panic!("unexpected error for {}: {:?}", input, other),
+            }
+        }
+        assert!(validate_trn_string_impl("trn:aiplatform:a:tool:myapi:v1.0").is_ok());
+        assert!(validate_trn_string_impl("trn:custom:a:tool:myapi:v1.0").is_ok());
+    }
+
+    #[test]
+    fn test_scanned_lengths_stay_within_trn_bounds() {
+        // A successful scan stands in for the format and length checks
+        let separators = "trn".len() + COMPONENT_CHARSETS.len();
+        let shortest: usize = COMPONENT_CHARSETS.iter().map(|charset| charset.min_length).sum();
+        let longest: usize = COMPONENT_CHARSETS.iter().map(|charset| charset.max_length).sum();
+        assert!(separators + shortest >= TRN_MIN_LENGTH);
+        assert!(separators + longest <= TRN_MAX_LENGTH);
+    }
+
+    #[test]
+    fn test_repeated_failure_keeps_detailed_error() {
+        let input = "trn:user:alice:tool:myapi:bad$version";
+        for _ in 0..2 {
+            let err = validate_trn_string(input).unwrap_err();
+            assert!(matches!(err, TrnError::Component { ref component, .. } if component == "version"));
+        }
+    }
+
+    #[test]
+    fn test_component_error_names_component() {
+        let err = validate_trn_string("trn:user:alice:tool:bad$resource:v1.0").unwrap_err();
+        assert!(matches!(err, TrnError::Component { ref component, .. } if component == "resource_id"));
     }
 
     #[test]
@@ -590,4 +773,34 @@ mod tests {
         let trn = Trn::new("USER", "alice", "tool", "myapi", "v1.0").unwrap();
         assert!(validate_naming_conventions(&trn).is_ok());
     }
-} 
\ No newline at end of file
+
+    #[test]
+    fn test_large_batches_keep_input_order() {
+        let trns: Vec<String> = (0..PARALLEL_VALIDATION_THRESHOLD + 100)
+            .map(|i| {
+                if i % 1000 == 7 {
+                    format!("trn:user:alice:tool:bad id {}:v1.0", i)
+                } else {
+                    format!("trn:user:alice:tool:api{}:v1.0", i)
+                }
+            })
+            .collect();
+
+        let results = validate_multiple_trns(&trns);
+        assert_eq!(results.len(), trns.len());
+        for (i, result) in results.iter().enumerate() {
+            assert_eq!(result.is_err(), i % 1000 == 7, "index {}", i);
+        }
+
+        let valid = are_valid_trns(&trns);
+        assert_eq!(valid.len(), trns.len());
+        for (i, is_valid) in valid.iter().enumerate() {
+            assert_eq!(!is_valid, i % 1000 == 7, "index {}", i);
+        }
+
+        let report = generate_validation_report(&trns);
+        assert_eq!(report.invalid, 5);
+        assert_eq!(report.valid, trns.len() - 5);
+        assert_eq!(report.errors.len(), 5);
+    }
+}
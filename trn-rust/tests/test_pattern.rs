@@ -1,4 +1,5 @@
-use trn_rust::Trn;
+use std::time::{Duration, Instant};
+use trn_rust::{Trn, TrnMatcher};
 
 #[test]
 fn test_basic_pattern_matching() {
@@ -179,4 +180,34 @@ fn test_pattern_escaping() {
     
     // Wildcard should still work
     assert!(trn.matches_pattern("trn:user:alice:tool:*:v1.0"));
-} 
\ No newline at end of file
+}
+
+#[test]
+fn test_adversarial_pattern_matches_in_linear_time() {
+    // `a*a*...a*b` against a long run of `a` with no `b` takes time polynomial
+    // in the input (degree = wildcard count) for a backtracking engine; the
+    // compiled automaton rejects it in one linear scan
+    let pattern = format!("trn:user:alice:tool:{}b:*", "a*".repeat(64));
+    let matcher = TrnMatcher::new(&pattern).unwrap();
+    let input = format!("trn:user:alice:tool:{}:v1.0", "a".repeat(100_000));
+
+    let start = Instant::now();
+    assert!(!matcher.matches_pattern(&input, 0));
+    assert!(!matcher.matches(&input));
+    let duration = start.elapsed();
+    assert!(duration < Duration::from_secs(5), "Adversarial match too slow: {:?}", duration);
+
+    let trns = [input];
+    assert!(trn_rust::find_matching_trns(&trns, &pattern).is_empty());
+}
+
+#[test]
+fn test_oversized_pattern_fails_to_compile() {
+    // Pattern length is unbounded, so the compiled regex size is capped instead
+    let pattern = format!("trn:user:alice:tool:{}:*", "a".repeat(1_000_000));
+    assert!(TrnMatcher::new(&pattern).is_err());
+
+    // The widest ordinary shape, every component a wildcard, stays under the cap
+    assert!(TrnMatcher::new("trn:*:*:*:*:*").is_ok());
+    assert!(TrnMatcher::new(&format!("trn:user:alice:tool:{}:*", "a*".repeat(64))).is_ok());
+}
@@ -221,6 +221,20 @@ fn test_component_format_check() {
     assert!(issues.is_empty(), "Valid TRN should have no format issues");
 }
 
+#[test]
+fn test_long_malformed_inputs_are_rejected() {
+    let inputs = [
+        format!("trn:{}!", "a".repeat(100_000)),
+        format!("trn:a:{}", "a-".repeat(50_000)),
+        format!("trn:user:alice:tool:myapi:v{}!", "1.".repeat(50_000)),
+    ];
+
+    for input in &inputs {
+        assert!(!is_valid_trn(input));
+        assert!(validate_trn_string(input).is_err());
+    }
+}
+
 #[test]
 fn test_validation_error_messages() {
     let test_cases = vec![